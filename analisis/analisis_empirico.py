@@ -1,7 +1,4 @@
-import time
-import matplotlib.pyplot as plt
-import numpy as np
-from src.maquina_turing import MaquinaTuring
+from analisis.benchmark import medir
 
 
 def numero_a_unario(n):
@@ -11,36 +8,24 @@ def numero_a_unario(n):
     return '1' * n
 
 
-def medir_tiempo_ejecucion(n):
+def medir_tiempo_ejecucion(n, repeticiones=100):
     """
     Mide el tiempo de ejecución para calcular F(n).
     
+    Usa el arnés de analisis.benchmark: la configuración se carga una sola
+    vez, la preparación de la cinta se mide aparte y se reporta la mediana
+    de las repeticiones (tras descartar unas de calentamiento).
+    
     Args:
         n (int): Índice de Fibonacci
+        repeticiones (int): Número de muestras
     
     Returns:
         tuple: (tiempo_ejecucion, numero_pasos)
     """
     entrada = numero_a_unario(n)
-    
-    # Ejecutar múltiples veces para obtener tiempos medibles
-    repeticiones = 100  # Ejecutar 100 veces para promediar
-    
-    tiempo_inicio = time.perf_counter()  # Usar perf_counter para mayor precisión
-    for _ in range(repeticiones):
-        maquina_temp = MaquinaTuring('config/maquina_fibonacci.json')
-        maquina_temp.inicializar(entrada)
-        maquina_temp.ejecutar(max_pasos=1000, mostrar_pasos=False)
-    tiempo_fin = time.perf_counter()
-    
-    tiempo_promedio = (tiempo_fin - tiempo_inicio) / repeticiones
-    
-    # Obtener número de pasos de una ejecución
-    maquina = MaquinaTuring('config/maquina_fibonacci.json')
-    maquina.inicializar(entrada)
-    maquina.ejecutar(max_pasos=1000, mostrar_pasos=False)
-    
-    return tiempo_promedio, maquina.pasos
+    fila = medir('config/maquina_fibonacci.json', entrada, repeticiones=repeticiones, max_pasos=1000)
+    return fila['ejecucion_mediana_s'], fila['pasos']
 
 
 def analisis_empirico():
@@ -56,8 +41,8 @@ def analisis_empirico():
     tiempos = []
     pasos_lista = []
     
-    print("\nEjecutando pruebas (100 repeticiones por valor para mayor precisión)...")
-    print(f"{'n':<5} {'F(n)':<10} {'Pasos':<10} {'Tiempo promedio (ms)':<20}")
+    print("\nEjecutando pruebas (100 repeticiones por valor, se reporta la mediana)...")
+    print(f"{'n':<5} {'F(n)':<10} {'Pasos':<10} {'Tiempo mediano (ms)':<20}")
     print("-"*60)
     
     for n in valores_n:
@@ -94,6 +79,8 @@ def crear_graficas(valores_n, tiempos, pasos):
         tiempos (list): Lista de tiempos de ejecución en milisegundos
         pasos (list): Lista de número de pasos
     """
+    import matplotlib.pyplot as plt
+    
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
     
     # Gráfica 1: Tiempo vs Tamaño de entrada
@@ -126,6 +113,9 @@ def realizar_regresion(valores_n, tiempos):
         valores_n (list): Lista de valores de n
         tiempos (list): Lista de tiempos de ejecución en milisegundos
     """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    
     print("\n" + "="*60)
     print("REGRESIÓN POLINOMIAL")
     print("="*60)
@@ -0,0 +1,443 @@
+import argparse
+import csv
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from src.cinta import Cinta
+from src.definicion import cargar_definicion
+from src.ejecucion import crear_ejecucion
+from src.simulador import CONFIGURACIONES, MAXIMO_N_UNARIO, numero_a_binario, numero_a_unario
+
+
+# Opciones de ejecutar() para cada motor medido
+MOTORES = {
+    'interpretado': {'compilado': False},
+    'compilado': {'compilado': True},
+    'macro': {'compilado': True, 'macro_pasos': True},
+}
+
+TIPOS_CINTA = ('lista', 'compacta')
+
+# Cintas que se pueden pedir con --cintas pero no se miden por defecto
+TIPOS_CINTA_OPCIONALES = ('mmap',)
+
+# Máquinas de Fibonacci: (archivo de la máquina, codificación de n, mayor n a medir)
+CODIFICACIONES = {
+    'unario': ('config/maquina_fibonacci.json', numero_a_unario, MAXIMO_N_UNARIO),
+    'unario_3_cintas': ('config/maquina_fibonacci_multicinta.json', numero_a_unario, 20),
+    'binario': ('config/maquina_fibonacci_binario.json', numero_a_binario, None),
+}
+
+# Duración mínima de una muestra; las ejecuciones cortas se agrupan hasta alcanzarla
+DURACION_MINIMA_MUESTRA = 0.001
+
+
+class CintaCrecimientoFijo(Cinta):
+    """Cinta que crece siempre de 10 en 10 celdas (comportamiento anterior), solo como referencia."""
+
+    def asegurar_posicion(self):
+        if self.posicion_cabezal < 0:
+            self.expandir_izquierda(10)
+            self.posicion_cabezal += 10
+        elif self.posicion_cabezal >= len(self.cinta):
+            self.expandir_derecha(10)
+
+
+def recorrer_izquierda(clase_cinta, longitud):
+    """
+    Mide el tiempo de escribir `longitud` celdas avanzando siempre a la izquierda.
+
+    Args:
+        clase_cinta (type): Clase de cinta a medir
+        longitud (int): Número de movimientos hacia la izquierda
+
+    Returns:
+        float: Tiempo total en segundos
+    """
+    cinta = clase_cinta('1')
+    tiempo_inicio = time.perf_counter()
+    for _ in range(longitud):
+        cinta.mover_cabezal('L')
+        cinta.escribir('1')
+    return time.perf_counter() - tiempo_inicio
+
+
+def benchmark_cinta_izquierda(longitudes=(1000, 10000, 50000)):
+    """
+    Compara el costo por movimiento de recorridos largos hacia la izquierda.
+
+    Con crecimiento geométrico el tiempo por movimiento se mantiene constante
+    al aumentar la longitud; con crecimiento fijo crece linealmente (tiempo
+    total cuadrático).
+
+    Args:
+        longitudes (tuple): Longitudes de recorrido a medir
+
+    Returns:
+        list: Una fila (dict) por longitud, con los ns por movimiento de
+        cada crecimiento
+    """
+    print("="*60)
+    print("BENCHMARK - RECORRIDO HACIA LA IZQUIERDA")
+    print("="*60)
+    print(f"{'Celdas':<10} {'Geométrico (ns/mov)':<22} {'Fijo de 10 (ns/mov)':<22}")
+    print("-"*60)
+
+    filas = []
+    for longitud in longitudes:
+        geometrico = recorrer_izquierda(Cinta, longitud) / longitud * 1e9
+        fijo = recorrer_izquierda(CintaCrecimientoFijo, longitud) / longitud * 1e9
+        filas.append({'longitud': longitud, 'geometrico_ns_por_mov': geometrico, 'fijo_ns_por_mov': fijo})
+        print(f"{longitud:<10} {geometrico:<22.1f} {fijo:<22.1f}")
+
+    return filas
+
+
+def intervalo_mediana(muestras, z=1.96):
+    """
+    Intervalo de confianza de la mediana sin suponer una distribución.
+
+    Usa los estadísticos de orden n/2 ± z·√n/2 de las muestras ordenadas.
+
+    Args:
+        muestras (list): Valores medidos
+        z (float): Cuantil de la normal (1.96 para 95 %)
+
+    Returns:
+        tuple: (inferior, superior)
+    """
+    ordenadas = sorted(muestras)
+    n = len(ordenadas)
+    margen = z * math.sqrt(n) / 2
+    inferior = max(int(math.floor(n / 2 - margen)), 0)
+    superior = min(int(math.ceil(n / 2 + margen)), n - 1)
+    return ordenadas[inferior], ordenadas[superior]
+
+
+def _muestra(definicion, entrada, opciones, tipo_cinta, max_pasos, numero):
+    """
+    Mide una muestra: prepara `numero` ejecuciones y luego las ejecuta todas.
+
+    Returns:
+        tuple: (segundos de preparación por ejecución, segundos de ejecución
+        por ejecución, pasos, motivo de parada)
+    """
+    tiempo_inicio = time.perf_counter()
+    ejecuciones = [crear_ejecucion(definicion, entrada, mostrar_avisos=False, historial='ninguno',
+                                   tipo_cinta=tipo_cinta) for _ in range(numero)]
+    preparacion = time.perf_counter() - tiempo_inicio
+
+    tiempo_inicio = time.perf_counter()
+    for ejecucion in ejecuciones:
+        ejecucion.ejecutar(max_pasos=max_pasos, **opciones)
+    ejecucion_total = time.perf_counter() - tiempo_inicio
+
+    ultima = ejecuciones[-1]
+    return preparacion / numero, ejecucion_total / numero, ultima.pasos, ultima.motivo_parada
+
+
+def medir(archivo_config, entrada, motor='interpretado', tipo_cinta='lista', repeticiones=30,
+          calentamiento=3, max_pasos=100000, numero=None, optimizar=False, preservar_pasos=True):
+    """
+    Mide la preparación y la ejecución de una entrada con estadísticas robustas.
+
+    La definición se carga (y compila) antes de medir. Cada muestra prepara
+    primero sus ejecuciones (cinta e historial) y luego las ejecuta, así que
+    los dos tiempos se reportan por separado. Las primeras `calentamiento`
+    muestras se descartan.
+
+    Args:
+        archivo_config (str): Ruta al archivo JSON de la máquina
+        entrada (str): Cadena de entrada
+        motor (str): Clave de MOTORES
+        tipo_cinta (str): 'lista', 'compacta' o 'mmap'
+        repeticiones (int): Muestras que se conservan
+        calentamiento (int): Muestras iniciales descartadas
+        max_pasos (int): Límite de pasos por ejecución
+        numero (int): Ejecuciones por muestra; None lo calibra para que cada
+            muestra dure al menos DURACION_MINIMA_MUESTRA
+        optimizar (bool): Si True, mide la máquina con la tabla optimizada
+        preservar_pasos (bool): Con optimizar, si False también compone cadenas
+
+    Returns:
+        dict: Fila del resultado (tiempos en segundos por ejecución)
+    """
+    if motor not in MOTORES:
+        raise ValueError(f"Motor desconocido: {motor!r} (use uno de {', '.join(MOTORES)})")
+    definicion = cargar_definicion(archivo_config, optimizar, preservar_pasos)
+    opciones = MOTORES[motor]
+
+    if numero is None:
+        numero = 1
+        while True:
+            _, tiempo, _, _ = _muestra(definicion, entrada, opciones, tipo_cinta, max_pasos, numero)
+            if tiempo * numero >= DURACION_MINIMA_MUESTRA or numero >= 100000:
+                break
+            numero *= 10
+
+    for _ in range(calentamiento):
+        _muestra(definicion, entrada, opciones, tipo_cinta, max_pasos, numero)
+
+    preparaciones, ejecuciones = [], []
+    for _ in range(repeticiones):
+        preparacion, ejecucion, pasos, motivo = _muestra(definicion, entrada, opciones, tipo_cinta,
+                                                          max_pasos, numero)
+        preparaciones.append(preparacion)
+        ejecuciones.append(ejecucion)
+
+    mediana = statistics.median(ejecuciones)
+    if len(ejecuciones) >= 2:
+        q1, _, q3 = statistics.quantiles(ejecuciones, n=4)
+    else:
+        q1 = q3 = mediana
+    inferior, superior = intervalo_mediana(ejecuciones)
+
+    return {
+        'maquina': definicion.nombre,
+        'huella': definicion.huella[:12],
+        'longitud_entrada': len(entrada.strip('_')),
+        'motor': motor,
+        'tipo_cinta': tipo_cinta,
+        'pasos': pasos,
+        'motivo': motivo,
+        'repeticiones': repeticiones,
+        'ejecuciones_por_muestra': numero,
+        'preparacion_mediana_s': statistics.median(preparaciones),
+        'ejecucion_mediana_s': mediana,
+        'ejecucion_iqr_s': q3 - q1,
+        'ejecucion_ic95_inferior_s': inferior,
+        'ejecucion_ic95_superior_s': superior,
+        'pasos_por_segundo': pasos / mediana if mediana > 0 else float('inf'),
+        'ns_por_paso': mediana / pasos * 1e9 if pasos else 0.0,
+    }
+
+
+def barrido(archivo_config, entradas, motores=tuple(MOTORES), tipos_cinta=TIPOS_CINTA, **opciones):
+    """
+    Mide todas las combinaciones de entrada, motor y tipo de cinta.
+
+    Args:
+        archivo_config (str): Ruta al archivo JSON de la máquina
+        entradas (list): Cadenas de entrada
+        motores (tuple): Claves de MOTORES a medir
+        tipos_cinta (tuple): Tipos de cinta a medir
+        **opciones: Argumentos adicionales para medir()
+
+    Returns:
+        list: Una fila (dict) por combinación
+    """
+    print("="*86)
+    print("BENCHMARK - BARRIDO DE MOTORES Y CINTAS")
+    print("="*86)
+    print(f"{'Entrada':<9} {'Motor':<13} {'Cinta':<9} {'Pasos':<8} {'Prep. (µs)':<11} "
+          f"{'Ejec. (µs)':<11} {'IQR (µs)':<10} {'ns/paso':<9}")
+    print("-"*86)
+
+    filas = []
+    for entrada in entradas:
+        for motor in motores:
+            for tipo_cinta in tipos_cinta:
+                fila = medir(archivo_config, entrada, motor, tipo_cinta, **opciones)
+                filas.append(fila)
+                print(f"{fila['longitud_entrada']:<9} {motor:<13} {tipo_cinta:<9} {fila['pasos']:<8} "
+                      f"{fila['preparacion_mediana_s']*1e6:<11.2f} {fila['ejecucion_mediana_s']*1e6:<11.2f} "
+                      f"{fila['ejecucion_iqr_s']*1e6:<10.2f} {fila['ns_por_paso']:<9.1f}")
+    return filas
+
+
+def comparar_codificaciones(ns=(0, 1, 2, 3, 4, 5, 10, 20, 50, 100, 200), motor='compilado',
+                            repeticiones=10, calentamiento=1):
+    """
+    Compara las máquinas de Fibonacci (unaria, unaria de tres cintas y binaria) para los mismos n.
+
+    La unaria de una cinta solo se mide hasta el mayor n que calcula bien y
+    la de tres cintas hasta n = 20, porque sus pasos crecen como F(n); la
+    binaria escala a n mucho mayores porque sus pasos crecen como n². La de
+    tres cintas siempre usa el motor interpretado.
+
+    Args:
+        ns (tuple): Valores de n a medir
+        motor (str): Clave de MOTORES
+        repeticiones (int): Muestras por medición
+        calentamiento (int): Muestras descartadas por medición
+
+    Returns:
+        list: Filas de medir() con las columnas 'codificacion' y 'n' agregadas
+    """
+    print("="*74)
+    print("BENCHMARK - CODIFICACIÓN UNARIA, TRES CINTAS Y BINARIA")
+    print("="*74)
+    print(f"{'n':<7} {'Máquina':<18} {'Entrada':<9} {'Pasos':<12} {'Ejec. (µs)':<14} {'ns/paso':<9}")
+    print("-"*74)
+
+    filas = []
+    for n in ns:
+        for codificacion, (archivo_config, codificar, maximo) in CODIFICACIONES.items():
+            if maximo is not None and n > maximo:
+                continue
+            fila = medir(archivo_config, codificar(n), motor, repeticiones=repeticiones,
+                         calentamiento=calentamiento, max_pasos=10**9)
+            fila.update(codificacion=codificacion, n=n)
+            filas.append(fila)
+            print(f"{n:<7} {codificacion:<18} {fila['longitud_entrada']:<9} {fila['pasos']:<12} "
+                  f"{fila['ejecucion_mediana_s']*1e6:<14.2f} {fila['ns_por_paso']:<9.1f}")
+    return filas
+
+
+def benchmark_arranque(repeticiones=20, comando=None):
+    """
+    Mide el tiempo de arranque de la línea de comandos sin interfaz.
+
+    Cada muestra lanza un intérprete nuevo, así que incluye el arranque de
+    Python y todos los imports. También reporta el tiempo de importar solo
+    src.simulador para separar el costo de los imports del de la ejecución.
+
+    Args:
+        repeticiones (int): Procesos lanzados por medición
+        comando (list): Argumentos de src.simulador a medir
+
+    Returns:
+        dict: Medianas en segundos del proceso completo y del import
+    """
+    if comando is None:
+        comando = ['run', '--input', '11111', '--json']
+    mediciones = {
+        'proceso_s': [sys.executable, '-m', 'src.simulador'] + comando,
+        'import_s': [sys.executable, '-c', 'import src.simulador'],
+        'python_s': [sys.executable, '-c', 'pass'],
+    }
+
+    print("="*60)
+    print("BENCHMARK - ARRANQUE DE LA LÍNEA DE COMANDOS")
+    print("="*60)
+    resultado = {'comando': ' '.join(comando), 'repeticiones': repeticiones}
+    for nombre, argumentos in mediciones.items():
+        muestras = []
+        for _ in range(repeticiones):
+            tiempo_inicio = time.perf_counter()
+            subprocess.run(argumentos, check=True, stdout=subprocess.DEVNULL)
+            muestras.append(time.perf_counter() - tiempo_inicio)
+        resultado[nombre] = statistics.median(muestras)
+
+    print(f"Intérprete vacío:        {resultado['python_s']*1000:.1f} ms")
+    print(f"import src.simulador:    {resultado['import_s']*1000:.1f} ms")
+    print(f"simulador {resultado['comando']}: {resultado['proceso_s']*1000:.1f} ms")
+    return resultado
+
+
+def exportar_json(filas, ruta, extras=None):
+    """
+    Guarda las filas en JSON junto con datos del entorno, para comparar versiones.
+
+    Args:
+        filas (list): Filas del barrido
+        ruta (str): Archivo de destino
+        extras (dict): Resultados de los demás benchmarks por nombre
+            ('codificaciones', 'cinta_izquierda', 'arranque'), que se
+            guardan como claves adicionales
+    """
+    datos = {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'resultados': filas,
+    }
+    datos.update(extras or {})
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(datos, f, indent=2, ensure_ascii=False)
+    print(f"\n✅ Resultados guardados en: {ruta}")
+
+
+def exportar_csv(filas, ruta, extras=None):
+    """
+    Guarda las filas en CSV (una columna por métrica).
+
+    La columna 'benchmark' indica de qué medición es cada fila ('barrido' o
+    la clave de extras); las columnas que no corresponden quedan vacías.
+
+    Args:
+        filas (list): Filas del barrido
+        ruta (str): Archivo de destino
+        extras (dict): Resultados de los demás benchmarks por nombre: una
+            lista de filas o una sola fila (dict)
+    """
+    todas = [dict(benchmark='barrido', **fila) for fila in filas]
+    for nombre, resultado in (extras or {}).items():
+        for fila in [resultado] if isinstance(resultado, dict) else resultado:
+            todas.append(dict(benchmark=nombre, **fila))
+    columnas = list(dict.fromkeys(columna for fila in todas for columna in fila))
+    with open(ruta, 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.DictWriter(f, fieldnames=columnas)
+        escritor.writeheader()
+        escritor.writerows(todas)
+    print(f"\n✅ Resultados guardados en: {ruta}")
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos de los benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmarks de rendimiento del simulador")
+    parser.add_argument('--config', help="Archivo JSON de la máquina (por defecto, la de Fibonacci)")
+    parser.add_argument('--binario', action='store_true',
+                        help="Usa la máquina de Fibonacci binaria y codifica cada n en binario")
+    parser.add_argument('--n', type=int, nargs='+',
+                        help="Valores de n a medir (por defecto, 0 a 5 en unario y "
+                             "0 a 5, 10, 100 y 1000 en binario)")
+    parser.add_argument('--motores', nargs='+', choices=list(MOTORES), default=list(MOTORES))
+    parser.add_argument('--cintas', nargs='+', choices=list(TIPOS_CINTA + TIPOS_CINTA_OPCIONALES),
+                        default=list(TIPOS_CINTA))
+    parser.add_argument('--max-pasos', type=int, default=10**7,
+                        help="Límite de pasos por ejecución (F(1000) en binario toma unos 696 000)")
+    parser.add_argument('--repeticiones', type=int, default=30)
+    parser.add_argument('--calentamiento', type=int, default=3)
+    parser.add_argument('--optimizar', action='store_true', help="Mide las máquinas con la tabla optimizada")
+    parser.add_argument('--componer', action='store_true',
+                        help="Con --optimizar, compone también cadenas de transiciones")
+    parser.add_argument('--json', help="Exporta los resultados a este archivo JSON")
+    parser.add_argument('--csv', help="Exporta los resultados a este archivo CSV")
+    parser.add_argument('--cinta-izquierda', action='store_true',
+                        help="Ejecuta también el benchmark de recorrido hacia la izquierda")
+    parser.add_argument('--codificaciones', action='store_true',
+                        help="Compara también las máquinas de Fibonacci unaria, de tres cintas y binaria")
+    parser.add_argument('--arranque', action='store_true',
+                        help="Ejecuta también el benchmark de arranque de la línea de comandos")
+    args = parser.parse_args(argumentos)
+
+    ns = args.n
+    if ns is None:
+        ns = [0, 1, 2, 3, 4, 5, 10, 100, 1000] if args.binario else list(range(MAXIMO_N_UNARIO + 1))
+    if args.config is None and not args.binario and max(ns) > MAXIMO_N_UNARIO:
+        parser.error(f"la máquina de Fibonacci unaria solo calcula bien n ≤ {MAXIMO_N_UNARIO}; "
+                     f"use --binario para n mayores")
+    if args.binario:
+        entradas = [numero_a_binario(n) for n in ns]
+    else:
+        entradas = [numero_a_unario(n) for n in ns]
+
+    filas = barrido(args.config or CONFIGURACIONES[args.binario], entradas, args.motores, args.cintas,
+                    repeticiones=args.repeticiones, calentamiento=args.calentamiento, max_pasos=args.max_pasos,
+                    optimizar=args.optimizar or args.componer, preservar_pasos=not args.componer)
+    extras = {}
+    if args.cinta_izquierda:
+        print()
+        extras['cinta_izquierda'] = benchmark_cinta_izquierda()
+    if args.codificaciones:
+        print()
+        extras['codificaciones'] = comparar_codificaciones()
+    if args.arranque:
+        print()
+        extras['arranque'] = benchmark_arranque()
+    if args.json:
+        exportar_json(filas, args.json, extras)
+    if args.csv:
+        exportar_csv(filas, args.csv, extras)
+    return filas
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import os
+from collections import OrderedDict, namedtuple
+
+from src.ejecucion import crear_ejecucion
+
+
+# Archivo por defecto del nivel en disco
+RUTA_CACHE = os.path.join('.cache', 'resultados.sqlite')
+
+# Solo se guardan ejecuciones que se detuvieron solas: su resultado no depende del límite de pasos
+MOTIVOS_CACHEABLES = ('final', 'sin_transicion')
+
+# Resultado memorizado de una entrada
+ResultadoCache = namedtuple('ResultadoCache', ['salida', 'pasos', 'motivo'])
+
+
+class CacheResultados:
+    """
+    Caché de resultados por (huella de la máquina, entrada).
+
+    Tiene un nivel en memoria con descarte LRU y, si se indica una ruta, un
+    nivel en disco en SQLite que se comparte entre ejecuciones del programa.
+    La huella es la de DefinicionMT, así que editar el archivo de la máquina
+    invalida sus resultados.
+    """
+
+    def __init__(self, tamano=1024, ruta=None):
+        """
+        Args:
+            tamano (int): Máximo de resultados en memoria
+            ruta (str): Archivo SQLite del nivel en disco (None = solo memoria)
+        """
+        self.tamano = tamano
+        self.memoria = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.conexion = None
+        if ruta is not None:
+            # sqlite3 solo se importa si se usa el nivel en disco
+            import sqlite3
+            directorio = os.path.dirname(ruta)
+            if directorio:
+                os.makedirs(directorio, exist_ok=True)
+            self.conexion = sqlite3.connect(ruta)
+            self.conexion.execute(
+                "CREATE TABLE IF NOT EXISTS resultados ("
+                "huella TEXT, entrada TEXT, salida TEXT, pasos INTEGER, motivo TEXT, "
+                "PRIMARY KEY (huella, entrada))"
+            )
+
+    def obtener(self, huella, entrada, max_pasos=None):
+        """
+        Busca el resultado de una entrada.
+
+        Args:
+            huella (str): Huella de la definición de la máquina
+            entrada (str): Cadena de entrada
+            max_pasos (int): Si se indica, ignora resultados que necesitaron
+                más pasos (con ese límite la ejecución no habría terminado)
+
+        Returns:
+            ResultadoCache: Resultado guardado, o None si no hay
+        """
+        clave = (huella, entrada)
+        resultado = self.memoria.get(clave)
+        if resultado is not None:
+            self.memoria.move_to_end(clave)
+        elif self.conexion is not None:
+            fila = self.conexion.execute(
+                "SELECT salida, pasos, motivo FROM resultados WHERE huella = ? AND entrada = ?", clave
+            ).fetchone()
+            if fila is not None:
+                resultado = ResultadoCache(*fila)
+                self._recordar(clave, resultado)
+
+        if resultado is None or (max_pasos is not None and resultado.pasos > max_pasos):
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        return resultado
+
+    def guardar(self, huella, entrada, resultado):
+        """
+        Guarda el resultado de una entrada si la ejecución terminó sola.
+
+        Args:
+            huella (str): Huella de la definición de la máquina
+            entrada (str): Cadena de entrada
+            resultado (ResultadoCache): Resultado a guardar
+        """
+        if resultado.motivo not in MOTIVOS_CACHEABLES:
+            return
+        clave = (huella, entrada)
+        self._recordar(clave, resultado)
+        if self.conexion is not None:
+            with self.conexion:
+                self.conexion.execute(
+                    "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?, ?)", clave + tuple(resultado)
+                )
+
+    def _recordar(self, clave, resultado):
+        """Agrega un resultado al nivel en memoria, descartando el menos usado."""
+        self.memoria[clave] = resultado
+        self.memoria.move_to_end(clave)
+        while len(self.memoria) > self.tamano:
+            self.memoria.popitem(last=False)
+
+    def limpiar(self):
+        """Borra todos los resultados, en memoria y en disco."""
+        self.memoria.clear()
+        if self.conexion is not None:
+            with self.conexion:
+                self.conexion.execute("DELETE FROM resultados")
+
+    def cerrar(self):
+        """Cierra el archivo del nivel en disco, si lo hay."""
+        if self.conexion is not None:
+            self.conexion.close()
+            self.conexion = None
+
+    def __len__(self):
+        return len(self.memoria)
+
+
+def calcular(definicion, entrada, max_pasos=100000, cache=None, compilado=True):
+    """
+    Ejecuta una entrada, o retorna su resultado memorizado si ya se conoce.
+
+    Args:
+        definicion (DefinicionMT): Máquina a ejecutar
+        entrada (str): Cadena de entrada
+        max_pasos (int): Límite de pasos
+        cache (CacheResultados): Caché a consultar y actualizar; None
+            ejecuta siempre (por ejemplo, al medir tiempos)
+        compilado (bool): Si True, usa el motor compilado
+
+    Returns:
+        ResultadoCache: Salida, pasos y motivo de parada
+    """
+    if cache is not None:
+        resultado = cache.obtener(definicion.huella, entrada, max_pasos)
+        if resultado is not None:
+            return resultado
+
+    ejecucion = crear_ejecucion(definicion, entrada, mostrar_avisos=False, historial='ninguno')
+    ejecucion.ejecutar(max_pasos=max_pasos, compilado=compilado)
+    resultado = ResultadoCache(ejecucion.obtener_resultado(), ejecucion.pasos, ejecucion.motivo_parada)
+
+    if cache is not None:
+        cache.guardar(definicion.huella, entrada, resultado)
+    return resultado
@@ -0,0 +1,105 @@
+import os
+import struct
+import zlib
+from collections import namedtuple
+
+from src.cinta import TAMANO_BLOQUE, TIPOS_CINTA
+
+
+MAGICO = b'MTCP'
+VERSION = 1
+
+# magico, versión, huella SHA-256 de la definición, estado, pasos,
+# cabezal, origen, celdas, largo del tipo de cinta y largo de la ruta
+_CABECERA = struct.Struct('<4sH32sIQqqQHH')
+
+# Contenido de un checkpoint; estado y celdas usan los identificadores de la TablaCompilada
+Checkpoint = namedtuple('Checkpoint', ['ruta_config', 'huella', 'tipo_cinta', 'estado', 'pasos',
+                                       'posicion_cabezal', 'origen', 'celdas'])
+
+
+def guardar_checkpoint(ejecucion, ruta):
+    """
+    Guarda el estado completo de una ejecución en un archivo binario.
+
+    El archivo se escribe primero en un temporal y luego se renombra, así que
+    una interrupción a mitad de la escritura no deja un checkpoint corrupto.
+    Se guardan solo las celdas entre la parte usada de la cinta, el cabezal y
+    la entrada, comprimidas de a bloques de TAMANO_BLOQUE (un byte por
+    celda), así que la memoria no depende del largo de la cinta.
+
+    Args:
+        ejecucion (Ejecucion): Ejecución a guardar
+        ruta (str): Archivo de destino
+    """
+    definicion = ejecucion.definicion
+    tabla = definicion.tabla
+    cinta = ejecucion.cinta
+    # Tramo lógico a guardar: la parte usada, el cabezal y la posición 0 (el origen)
+    usado_inicio, usado_fin = cinta.rango_usado()
+    cabezal = cinta.posicion_logica()
+    inicio = min(usado_inicio, cabezal, 0)
+    fin = max(usado_fin, cabezal + 1, 0)
+
+    tipo = next((nombre for nombre, clase in TIPOS_CINTA.items() if type(cinta) is clase), None)
+    if tipo is None:
+        raise ValueError(f"Tipo de cinta sin soporte para checkpoints: {type(cinta).__name__}")
+    tipo = tipo.encode('utf-8')
+    ruta_config = (definicion.ruta or '').encode('utf-8')
+
+    cabecera = _CABECERA.pack(
+        MAGICO, VERSION, bytes.fromhex(definicion.huella), tabla.id_estado[ejecucion.estado_actual],
+        ejecucion.pasos, cabezal - inicio, -inicio, fin - inicio, len(tipo), len(ruta_config)
+    )
+
+    temporal = f"{ruta}.tmp"
+    try:
+        with open(temporal, 'wb') as f:
+            f.write(cabecera)
+            f.write(tipo)
+            f.write(ruta_config)
+            compresor = zlib.compressobj(1)
+            for desde in range(inicio, fin, TAMANO_BLOQUE):
+                celdas = tabla.codificar(cinta.tramo(desde, min(desde + TAMANO_BLOQUE, fin)))
+                if celdas is None:
+                    raise ValueError("La cinta contiene símbolos fuera del alfabeto; no se puede guardar")
+                f.write(compresor.compress(celdas))
+            f.write(compresor.flush())
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        os.remove(temporal)
+        raise
+    os.replace(temporal, ruta)
+
+
+def leer_checkpoint(ruta):
+    """
+    Lee un checkpoint guardado con guardar_checkpoint().
+
+    Args:
+        ruta (str): Archivo del checkpoint
+
+    Returns:
+        Checkpoint: Datos guardados, con la huella en hexadecimal
+    """
+    with open(ruta, 'rb') as f:
+        datos = f.read()
+
+    if len(datos) < _CABECERA.size or datos[:4] != MAGICO:
+        raise ValueError(f"{ruta} no es un checkpoint de Máquina de Turing")
+    (_, version, huella, estado, pasos, posicion, origen, longitud,
+     largo_tipo, largo_ruta) = _CABECERA.unpack_from(datos)
+    if version != VERSION:
+        raise ValueError(f"Versión de checkpoint no soportada: {version}")
+
+    inicio = _CABECERA.size
+    tipo = datos[inicio:inicio + largo_tipo].decode('utf-8')
+    inicio += largo_tipo
+    ruta_config = datos[inicio:inicio + largo_ruta].decode('utf-8') or None
+    inicio += largo_ruta
+
+    celdas = zlib.decompress(datos[inicio:])
+    if len(celdas) != longitud:
+        raise ValueError(f"Checkpoint incompleto: se esperaban {longitud} celdas y hay {len(celdas)}")
+    return Checkpoint(ruta_config, huella.hex(), tipo, estado, pasos, posicion, origen, celdas)
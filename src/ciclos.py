@@ -0,0 +1,163 @@
+class DetectorCiclos:
+    """
+    Detecta ejecuciones que no terminan observando la máquina paso a paso.
+
+    Reconoce dos casos:
+
+    - 'ciclo': la configuración completa (estado, cabezal y cinta) se repite.
+      Se lleva un hash incremental de la cinta (estilo Zobrist: XOR de un
+      valor por celda no blanca) y se compara con una configuración de
+      referencia que se renueva cuando los pasos transcurridos llegan a una
+      potencia de dos (algoritmo de Brent). Una coincidencia del hash se
+      confirma comparando las configuraciones exactas.
+    - 'ciclo_trasladado': la máquina repite el mismo comportamiento cada vez
+      más a la derecha (o a la izquierda) sobre cinta en blanco. Se comparan
+      los récords del cabezal (visitas a una celda nueva con todo blanco más
+      allá): si dos récords tienen el mismo estado y el tramo de cinta entre
+      la posición más lejana que alcanzó el cabezal desde el primero y el
+      cabezal se repite desplazado, la máquina no se detiene nunca.
+      La referencia de récords también se renueva en potencias de dos.
+
+    Las posiciones son lógicas (relativas a la primera celda de la entrada).
+    """
+
+    def __init__(self, ejecucion):
+        """
+        Prepara el detector a partir de la configuración actual de la ejecución.
+
+        Args:
+            ejecucion (Ejecucion): Ejecución a observar (ya inicializada)
+        """
+        cinta = ejecucion.cinta
+        self.blanco = cinta.simbolo_blanco
+        self.motivo = None
+        self.periodo = None
+        self.desplazamiento = None
+        self.inicio_ciclo = None
+
+        self.hash_cinta = 0
+        inicio, fin = cinta.rango_usado()
+        for posicion, simbolo in enumerate(self._celdas(cinta, inicio, fin - 1), inicio):
+            if simbolo != self.blanco:
+                self.hash_cinta ^= hash((posicion, simbolo))
+
+        paso, estado, posicion = ejecucion.pasos, ejecucion.estado_actual, cinta.posicion_logica()
+        self._nueva_referencia(paso, estado, posicion, cinta, limite=1)
+
+        # Récords del cabezal hacia cada lado: (paso, estado, cabezal, inicio, celdas)
+        self.maximo = self.minimo = posicion
+        self.record_derecha = self.record_izquierda = None
+        self.extremo_desde_derecha = self.extremo_desde_izquierda = posicion
+        self.records_derecha = self.records_izquierda = 0
+        self.limite_derecha = self.limite_izquierda = 1
+
+    def _celdas(self, cinta, desde, hasta):
+        """Símbolos de las posiciones lógicas desde..hasta (inclusive), con blancos fuera de la cinta."""
+        return cinta.tramo(desde, hasta + 1)
+
+    def _instantanea(self, cinta):
+        """Copia del tramo no blanco de la cinta: (inicio, celdas)."""
+        inicio, fin = cinta.rango_usado()
+        return inicio, self._celdas(cinta, inicio, fin - 1)
+
+    def _tramo(self, instantanea, desde, hasta):
+        """Símbolos de una instantánea en las posiciones desde..hasta (inclusive)."""
+        inicio, celdas = instantanea
+        return [celdas[p - inicio] if 0 <= p - inicio < len(celdas) else self.blanco
+                for p in range(desde, hasta + 1)]
+
+    def _nueva_referencia(self, paso, estado, posicion, cinta, limite):
+        """Toma la configuración actual como referencia para ciclos exactos."""
+        self.paso_referencia = paso
+        self.hash_referencia = hash((self.hash_cinta, estado, posicion))
+        self.configuracion_referencia = (estado, posicion, self._instantanea(cinta))
+        self.limite_referencia = limite
+
+    def _detener(self, motivo, periodo, inicio, desplazamiento=0):
+        """Registra el ciclo encontrado y retorna su motivo."""
+        self.motivo = motivo
+        self.periodo = periodo
+        self.inicio_ciclo = inicio
+        self.desplazamiento = desplazamiento
+        return motivo
+
+    def registrar(self, paso, estado, posicion_anterior, leido, escrito, cinta):
+        """
+        Observa un paso recién ejecutado.
+
+        Args:
+            paso (int): Número de pasos después de este
+            estado (str): Estado después del paso
+            posicion_anterior (int): Posición lógica donde se escribió
+            leido (str): Símbolo que había en esa celda
+            escrito (str): Símbolo escrito
+            cinta (Cinta): Cinta después del paso
+
+        Returns:
+            str: 'ciclo' o 'ciclo_trasladado' si la máquina no se detendrá,
+            o None si todavía no se sabe
+        """
+        if escrito != leido:
+            if leido != self.blanco:
+                self.hash_cinta ^= hash((posicion_anterior, leido))
+            if escrito != self.blanco:
+                self.hash_cinta ^= hash((posicion_anterior, escrito))
+
+        posicion = cinta.posicion_logica()
+
+        # Ciclo exacto (Brent)
+        if hash((self.hash_cinta, estado, posicion)) == self.hash_referencia:
+            if (estado, posicion, self._instantanea(cinta)) == self.configuracion_referencia:
+                return self._detener('ciclo', paso - self.paso_referencia, self.paso_referencia)
+        if paso - self.paso_referencia >= self.limite_referencia:
+            self._nueva_referencia(paso, estado, posicion, cinta, 2 * self.limite_referencia)
+
+        # Ciclo trasladado: comparar récords del cabezal
+        self.extremo_desde_derecha = min(self.extremo_desde_derecha, posicion)
+        self.extremo_desde_izquierda = max(self.extremo_desde_izquierda, posicion)
+        if posicion > self.maximo:
+            self.maximo = posicion
+            if cinta.rango_usado()[1] <= posicion + 1:
+                return self._record_derecha(paso, estado, posicion, cinta)
+        elif posicion < self.minimo:
+            self.minimo = posicion
+            inicio, fin = cinta.rango_usado()
+            if fin == inicio or inicio >= posicion:
+                return self._record_izquierda(paso, estado, posicion, cinta)
+        return None
+
+    def _record_derecha(self, paso, estado, posicion, cinta):
+        """Procesa un récord hacia la derecha (todo blanco a la derecha del cabezal)."""
+        record = self.record_derecha
+        if record is not None and record[1] == estado:
+            paso_record, _, cabezal, inicio, celdas = record
+            desplazamiento = posicion - cabezal
+            m = self.extremo_desde_derecha
+            if self._tramo((inicio, celdas), m, cabezal) == self._celdas(cinta, m + desplazamiento, posicion):
+                return self._detener('ciclo_trasladado', paso - paso_record, paso_record, desplazamiento)
+
+        self.records_derecha += 1
+        if record is None or self.records_derecha >= self.limite_derecha:
+            self.record_derecha = (paso, estado, posicion) + self._instantanea(cinta)
+            self.extremo_desde_derecha = posicion
+            self.limite_derecha *= 2
+            self.records_derecha = 0
+        return None
+
+    def _record_izquierda(self, paso, estado, posicion, cinta):
+        """Procesa un récord hacia la izquierda (todo blanco a la izquierda del cabezal)."""
+        record = self.record_izquierda
+        if record is not None and record[1] == estado:
+            paso_record, _, cabezal, inicio, celdas = record
+            desplazamiento = posicion - cabezal
+            m = self.extremo_desde_izquierda
+            if self._tramo((inicio, celdas), cabezal, m) == self._celdas(cinta, posicion, m + desplazamiento):
+                return self._detener('ciclo_trasladado', paso - paso_record, paso_record, desplazamiento)
+
+        self.records_izquierda += 1
+        if record is None or self.records_izquierda >= self.limite_izquierda:
+            self.record_izquierda = (paso, estado, posicion) + self._instantanea(cinta)
+            self.extremo_desde_izquierda = posicion
+            self.limite_izquierda *= 2
+            self.records_izquierda = 0
+        return None
@@ -1,53 +1,201 @@
+import mmap
+import os
+import re
+import tempfile
+from collections import Counter
+
+from src.motor_compilado import ejecutar_compilado
+
+
+# Celdas que se leen o escriben de una vez al cargar, contar o exportar una cinta mapeada
+TAMANO_BLOQUE = 1 << 20
+
+# Celdas de la cinta mapeada que se copian al motor compilado en cada tramo
+TAMANO_VENTANA = 1 << 20
+
+# Las cintas mapeadas crecen de a páginas completas
+PAGINA = mmap.PAGESIZE
+
+
+def formatear_ventana(cinta_visible, posicion_relativa):
+    """Formatea una ventana de la cinta con el indicador del cabezal debajo."""
+    # Crear indicador del cabezal
+    indicador = ' ' * posicion_relativa + '^'
+    
+    return f"Cinta: {cinta_visible}\n       {indicador}"
+
+
+def representar_cinta(celdas, posicion_cabezal):
+    """
+    Representación visual de una ventana de la cinta con el cabezal.
+    
+    Args:
+        celdas (list): Símbolos de la cinta
+        posicion_cabezal (int): Índice del cabezal dentro de celdas
+    
+    Returns:
+        str: Dos líneas, la cinta visible y el indicador del cabezal
+    """
+    # Encontrar rango útil (sin muchos blancos)
+    inicio = max(0, posicion_cabezal - 20)
+    fin = min(len(celdas), posicion_cabezal + 20)
+    
+    return formatear_ventana(''.join(celdas[inicio:fin]), posicion_cabezal - inicio)
+
+
 class Cinta:
     """
     Representa la cinta infinita de la Máquina de Turing.
     """
     
-    def __init__(self, entrada="", simbolo_blanco="_"):
+    def __init__(self, entrada="", simbolo_blanco="_", simbolos=None):
         """
         Inicializa la cinta con una cadena de entrada.
         
         Args:
             entrada (str): Cadena inicial en la cinta
             simbolo_blanco (str): Símbolo que representa una celda vacía
+            simbolos (list): Alfabeto de la cinta (esta implementación no lo necesita)
         """
         self.simbolo_blanco = simbolo_blanco
         self.cinta = list(entrada) if entrada else [simbolo_blanco]
         self.posicion_cabezal = 0
+        self.origen = 0  # Índice de la primera celda de la entrada
+        
+        # Límites [izquierda, derecha) de las celdas no blancas y conteo
+        # por símbolo, mantenidos de forma incremental en escribir()
+        self.izquierda = 0
+        self.derecha = 0
+        self.conteos = {}
         
         # Añadir espacios en blanco a los lados
         self.expandir_izquierda(10)
         self.expandir_derecha(10)
         self.posicion_cabezal = 10  # Ajustar posición inicial
+        self.recalcular_limites()
     
     def expandir_izquierda(self, cantidad=10):
         """Expande la cinta hacia la izquierda."""
         self.cinta = [self.simbolo_blanco] * cantidad + self.cinta
+        self.origen += cantidad
+        self.izquierda += cantidad
+        self.derecha += cantidad
     
     def expandir_derecha(self, cantidad=10):
         """Expande la cinta hacia la derecha."""
         self.cinta.extend([self.simbolo_blanco] * cantidad)
     
+    def asegurar_posicion(self):
+        """
+        Expande la cinta si el cabezal quedó fuera de ella.
+        
+        La expansión es geométrica (al menos duplica la cinta), así que el
+        costo de copiar la lista se amortiza a O(1) por movimiento incluso
+        cuando la máquina avanza siempre hacia el mismo lado.
+        """
+        if self.posicion_cabezal < 0:
+            cantidad = max(10, len(self.cinta), -self.posicion_cabezal)
+            self.expandir_izquierda(cantidad)
+            self.posicion_cabezal += cantidad
+        elif self.posicion_cabezal >= len(self.cinta):
+            self.expandir_derecha(max(10, len(self.cinta), self.posicion_cabezal - len(self.cinta) + 1))
+    
     def leer(self):
         """Lee el símbolo en la posición actual del cabezal."""
         # Expandir si es necesario
-        if self.posicion_cabezal < 0:
-            self.expandir_izquierda(10)
-            self.posicion_cabezal += 10
-        if self.posicion_cabezal >= len(self.cinta):
-            self.expandir_derecha(10)
+        if not 0 <= self.posicion_cabezal < len(self.cinta):
+            self.asegurar_posicion()
         
         return self.cinta[self.posicion_cabezal]
     
     def escribir(self, simbolo):
         """Escribe un símbolo en la posición actual del cabezal."""
-        if self.posicion_cabezal < 0:
-            self.expandir_izquierda(10)
-            self.posicion_cabezal += 10
-        if self.posicion_cabezal >= len(self.cinta):
-            self.expandir_derecha(10)
+        if not 0 <= self.posicion_cabezal < len(self.cinta):
+            self.asegurar_posicion()
         
-        self.cinta[self.posicion_cabezal] = simbolo
+        anterior = self.cinta[self.posicion_cabezal]
+        if anterior != simbolo:
+            self.cinta[self.posicion_cabezal] = simbolo
+            self.registrar_escritura(self.posicion_cabezal, anterior, simbolo)
+    
+    def registrar_escritura(self, posicion, anterior, simbolo):
+        """
+        Actualiza los límites y conteos tras cambiar una celda.
+        
+        Args:
+            posicion (int): Índice de la celda modificada
+            anterior (str): Símbolo que había en la celda
+            simbolo (str): Símbolo escrito
+        """
+        blanco = self.simbolo_blanco
+        if anterior != blanco:
+            self.conteos[anterior] -= 1
+        if simbolo != blanco:
+            self.conteos[simbolo] = self.conteos.get(simbolo, 0) + 1
+            if self.izquierda >= self.derecha:
+                self.izquierda, self.derecha = posicion, posicion + 1
+            elif posicion < self.izquierda:
+                self.izquierda = posicion
+            elif posicion >= self.derecha:
+                self.derecha = posicion + 1
+        elif anterior != blanco:
+            # Se borró una celda: solo cambian los límites si estaba en un extremo
+            if self.cantidad_no_blancos() == 0:
+                self.izquierda = self.derecha = 0
+            elif posicion == self.izquierda:
+                self.izquierda = self.buscar_no_blanco(posicion + 1, self.derecha)
+            elif posicion == self.derecha - 1:
+                self.derecha = self.buscar_no_blanco_inverso(self.izquierda, posicion) + 1
+    
+    def buscar_no_blanco(self, inicio, fin):
+        """Índice de la primera celda no blanca en [inicio, fin), o fin si no hay."""
+        blanco = self.simbolo_blanco
+        cinta = self.cinta
+        for i in range(inicio, fin):
+            if cinta[i] != blanco:
+                return i
+        return fin
+    
+    def buscar_no_blanco_inverso(self, inicio, fin):
+        """Índice de la última celda no blanca en [inicio, fin), o inicio - 1 si no hay."""
+        blanco = self.simbolo_blanco
+        cinta = self.cinta
+        for i in range(fin - 1, inicio - 1, -1):
+            if cinta[i] != blanco:
+                return i
+        return inicio - 1
+    
+    def recalcular_limites(self):
+        """Recalcula límites y conteos recorriendo toda la cinta."""
+        conteos = Counter(self.cinta)
+        del conteos[self.simbolo_blanco]
+        self.conteos = dict(conteos)
+        if self.cantidad_no_blancos() == 0:
+            self.izquierda = self.derecha = 0
+        else:
+            self.izquierda = self.buscar_no_blanco(0, len(self.cinta))
+            self.derecha = self.buscar_no_blanco_inverso(0, len(self.cinta)) + 1
+    
+    def rango_usado(self):
+        """
+        Rango de celdas no blancas, en posiciones relativas a la entrada.
+        
+        Returns:
+            tuple: (inicio, fin) semiabierto; (0, 0) si la cinta está vacía
+        """
+        if self.izquierda >= self.derecha:
+            return 0, 0
+        return self.izquierda - self.origen, self.derecha - self.origen
+    
+    def cantidad_no_blancos(self):
+        """Número de celdas con un símbolo distinto del blanco (O(alfabeto))."""
+        return sum(self.conteos.values())
+    
+    def contar(self, simbolo):
+        """Número de celdas que contienen el símbolo dado (O(1), salvo el blanco)."""
+        if simbolo == self.simbolo_blanco:
+            return len(self.cinta) - self.cantidad_no_blancos()
+        return self.conteos.get(simbolo, 0)
     
     def mover_cabezal(self, direccion):
         """
@@ -64,19 +212,725 @@ class Cinta:
     
     def obtener_contenido(self):
         """Retorna el contenido de la cinta como string, sin espacios en blanco en los extremos."""
-        contenido = ''.join(self.cinta).strip(self.simbolo_blanco)
-        return contenido if contenido else self.simbolo_blanco
+        if self.izquierda >= self.derecha:
+            return self.simbolo_blanco
+        return ''.join(self.cinta[self.izquierda:self.derecha])
+    
+    def simbolos(self):
+        """Retorna todas las celdas de la cinta como secuencia de símbolos."""
+        return self.cinta
+    
+    def tramo(self, inicio, fin):
+        """
+        Símbolos de las posiciones lógicas [inicio, fin), con blancos fuera de la cinta.
+        
+        Args:
+            inicio (int): Primera posición, relativa a la entrada
+            fin (int): Posición siguiente a la última
+        
+        Returns:
+            list: fin - inicio símbolos (vacía si fin <= inicio)
+        """
+        if fin <= inicio:
+            return []
+        simbolos = self.simbolos()
+        desde = inicio + self.origen
+        hasta = fin + self.origen
+        celdas = list(simbolos[max(desde, 0):max(min(hasta, len(simbolos)), 0)])
+        if desde < 0:
+            celdas[0:0] = [self.simbolo_blanco] * min(-desde, hasta - desde)
+        if hasta > len(simbolos):
+            celdas.extend([self.simbolo_blanco] * min(hasta - len(simbolos), hasta - desde))
+        return celdas
+    
+    def exportar(self, ruta):
+        """
+        Escribe el contenido de la cinta (ver obtener_contenido) en un archivo.
+        
+        Args:
+            ruta (str): Archivo de destino (latin-1, un byte por celda)
+        """
+        with open(ruta, 'w', encoding='latin-1') as f:
+            f.write(self.obtener_contenido())
+    
+    def reemplazar(self, simbolos, posicion_cabezal, origen):
+        """
+        Reemplaza el contenido completo de la cinta.
+        
+        Args:
+            simbolos (list): Nuevas celdas de la cinta
+            posicion_cabezal (int): Índice del cabezal en las nuevas celdas
+            origen (int): Índice de la primera celda de la entrada
+        """
+        self.cinta = list(simbolos)
+        self.posicion_cabezal = posicion_cabezal
+        self.origen = origen
+        self.recalcular_limites()
+    
+    def posicion_logica(self):
+        """Posición del cabezal relativa a la primera celda de la entrada."""
+        return self.posicion_cabezal - self.origen
+    
+    def __str__(self):
+        """Representación visual de la cinta con el cabezal."""
+        return representar_cinta(self.cinta, self.posicion_cabezal)
+
+
+class CintaCompacta(Cinta):
+    """
+    Cinta que guarda cada celda como un byte en un bytearray.
+    
+    Cada símbolo del alfabeto se guarda con su código latin-1, de modo que
+    una celda ocupa 1 byte en lugar de un puntero de 8 bytes por elemento de
+    lista, y cualquier rango de la cinta se decodifica directamente desde un
+    memoryview sin ''.join.
+    """
+    
+    def __init__(self, entrada="", simbolo_blanco="_", simbolos=None):
+        """
+        Inicializa la cinta compacta.
+        
+        Args:
+            entrada (str): Cadena inicial en la cinta
+            simbolo_blanco (str): Símbolo que representa una celda vacía
+            simbolos (list): Alfabeto de la cinta; si se omite se usan los
+                símbolos de la entrada más el blanco
+        """
+        alfabeto = list(simbolos) if simbolos is not None else sorted(set(entrada))
+        if simbolo_blanco not in alfabeto:
+            alfabeto.append(simbolo_blanco)
+        for simbolo in alfabeto:
+            if len(simbolo) != 1 or ord(simbolo) > 0xFF:
+                raise ValueError(f"La cinta compacta solo admite símbolos latin-1 de un carácter: {simbolo!r}")
+        
+        self.codigos = {simbolo: ord(simbolo) for simbolo in alfabeto}
+        self.simbolo_blanco = simbolo_blanco
+        self._blanco = bytes([self.codigos[simbolo_blanco]])
+        # Detecta el primer símbolo distinto del blanco
+        self._no_blanco = re.compile(b'[^' + re.escape(self._blanco) + b']')
+        
+        self.cinta = bytearray(self._codificar(entrada)) if entrada else bytearray(self._blanco)
+        self.posicion_cabezal = 0
+        self.origen = 0
+        self.izquierda = 0
+        self.derecha = 0
+        self.conteos = {}
+        
+        # Añadir espacios en blanco a los lados
+        self.expandir_izquierda(10)
+        self.expandir_derecha(10)
+        self.posicion_cabezal = 10  # Ajustar posición inicial
+        self.recalcular_limites()
+    
+    def _codificar(self, simbolos):
+        """Convierte símbolos a sus códigos, validando que pertenezcan al alfabeto."""
+        try:
+            return bytes(map(self.codigos.__getitem__, simbolos))
+        except KeyError as e:
+            raise ValueError(f"Símbolo fuera del alfabeto de la cinta: {e.args[0]!r}") from None
+    
+    def expandir_izquierda(self, cantidad=10):
+        """Expande la cinta hacia la izquierda."""
+        self.cinta[0:0] = self._blanco * cantidad
+        self.origen += cantidad
+        self.izquierda += cantidad
+        self.derecha += cantidad
+    
+    def expandir_derecha(self, cantidad=10):
+        """Expande la cinta hacia la derecha."""
+        self.cinta.extend(self._blanco * cantidad)
+    
+    def leer(self):
+        """Lee el símbolo en la posición actual del cabezal."""
+        if not 0 <= self.posicion_cabezal < len(self.cinta):
+            self.asegurar_posicion()
+        
+        return chr(self.cinta[self.posicion_cabezal])
+    
+    def escribir(self, simbolo):
+        """Escribe un símbolo en la posición actual del cabezal."""
+        if not 0 <= self.posicion_cabezal < len(self.cinta):
+            self.asegurar_posicion()
+        
+        codigo = self.codigos.get(simbolo)
+        if codigo is None:
+            raise ValueError(f"Símbolo fuera del alfabeto de la cinta: {simbolo!r}")
+        anterior = self.cinta[self.posicion_cabezal]
+        if anterior != codigo:
+            self.cinta[self.posicion_cabezal] = codigo
+            self.registrar_escritura(self.posicion_cabezal, chr(anterior), simbolo)
+    
+    def buscar_no_blanco(self, inicio, fin):
+        """Índice de la primera celda no blanca en [inicio, fin), o fin si no hay."""
+        encontrado = self._no_blanco.search(self.cinta, inicio, fin)
+        return encontrado.start() if encontrado else fin
+    
+    def buscar_no_blanco_inverso(self, inicio, fin):
+        """Índice de la última celda no blanca en [inicio, fin), o inicio - 1 si no hay."""
+        # Ventanas crecientes hacia atrás desde fin: el costo depende de la
+        # distancia a la celda encontrada, no del largo de [inicio, fin)
+        ventana = 64
+        while inicio < fin:
+            desde = max(inicio, fin - ventana)
+            resto = self.cinta[desde:fin].rstrip(self._blanco)
+            if resto:
+                return desde + len(resto) - 1
+            fin = desde
+            ventana = min(2 * ventana, TAMANO_BLOQUE)
+        return inicio - 1
+    
+    def recalcular_limites(self):
+        """Recalcula límites y conteos recorriendo toda la cinta."""
+        self.conteos = {}
+        for simbolo, codigo in self.codigos.items():
+            if simbolo != self.simbolo_blanco:
+                cantidad = self.cinta.count(codigo)
+                if cantidad:
+                    self.conteos[simbolo] = cantidad
+        if self.cantidad_no_blancos() == 0:
+            self.izquierda = self.derecha = 0
+        else:
+            self.izquierda = self.buscar_no_blanco(0, len(self.cinta))
+            self.derecha = self.buscar_no_blanco_inverso(self.izquierda, len(self.cinta)) + 1
+    
+    def vista(self, inicio=None, fin=None):
+        """
+        Retorna un memoryview (sin copia) sobre un rango de la cinta.
+        
+        El memoryview debe liberarse (o salir de alcance) antes de que la
+        cinta vuelva a crecer.
+        """
+        return memoryview(self.cinta)[inicio:fin]
+    
+    def obtener_contenido(self):
+        """Retorna el contenido de la cinta como string, sin espacios en blanco en los extremos."""
+        if self.izquierda >= self.derecha:
+            return self.simbolo_blanco
+        with self.vista(self.izquierda, self.derecha) as contenido:
+            return str(contenido, 'latin-1')
+    
+    def simbolos(self):
+        """Retorna todas las celdas de la cinta como cadena (una letra por celda)."""
+        with self.vista() as celdas:
+            return str(celdas, 'latin-1')
+    
+    def reemplazar(self, simbolos, posicion_cabezal, origen):
+        """
+        Reemplaza el contenido completo de la cinta.
+        
+        Args:
+            simbolos (list): Nuevas celdas de la cinta
+            posicion_cabezal (int): Índice del cabezal en las nuevas celdas
+            origen (int): Índice de la primera celda de la entrada
+        """
+        self.cinta = bytearray(self._codificar(simbolos))
+        self.posicion_cabezal = posicion_cabezal
+        self.origen = origen
+        self.recalcular_limites()
     
     def __str__(self):
         """Representación visual de la cinta con el cabezal."""
-        # Encontrar rango útil (sin muchos blancos)
         inicio = max(0, self.posicion_cabezal - 20)
         fin = min(len(self.cinta), self.posicion_cabezal + 20)
+        with self.vista(inicio, fin) as visibles:
+            return formatear_ventana(str(visibles, 'latin-1'), self.posicion_cabezal - inicio)
+
+
+def _redondear_paginas(celdas):
+    """Redondea un número de celdas (bytes) hacia arriba a páginas completas."""
+    return -(-celdas // PAGINA) * PAGINA
+
+
+def _liberar(mapa, inicio, largo):
+    """Deja de mantener residentes las páginas de un tramo ya procesado, si el sistema lo permite."""
+    if hasattr(mmap, 'MADV_DONTNEED'):
+        inicio -= inicio % PAGINA
+        if inicio < len(mapa):
+            mapa.madvise(mmap.MADV_DONTNEED, inicio, largo + PAGINA)
+
+
+def _primer_no_cero(mapa, inicio, fin):
+    """Índice del primer byte distinto de cero en mapa[inicio:fin], o None (costo según la distancia)."""
+    ventana = 64
+    while inicio < fin:
+        tramo = mapa[inicio:min(fin, inicio + ventana)]
+        resto = tramo.lstrip(b'\0')
+        if resto:
+            return inicio + len(tramo) - len(resto)
+        inicio += len(tramo)
+        ventana = min(2 * ventana, TAMANO_BLOQUE)
+    return None
+
+
+def _ultimo_no_cero(mapa, inicio, fin):
+    """Índice del último byte distinto de cero en mapa[inicio:fin], o None (costo según la distancia)."""
+    ventana = 64
+    while inicio < fin:
+        desde = max(inicio, fin - ventana)
+        resto = mapa[desde:fin].rstrip(b'\0')
+        if resto:
+            return desde + len(resto) - 1
+        fin = desde
+        ventana = min(2 * ventana, TAMANO_BLOQUE)
+    return None
+
+
+class CintaMmap(Cinta):
+    """
+    Cinta guardada en archivos temporales mapeados en memoria.
+    
+    Las celdas 0, 1, 2... (relativas a la entrada) van en un archivo y las
+    -1, -2, -3... en otro, de modo que la cinta crece por páginas hacia
+    los dos lados sin mover lo ya escrito. Cada celda ocupa un byte: el
+    código latin-1 del símbolo combinado (XOR) con el del blanco, así que
+    el blanco es el byte 0 y las páginas que nunca se escribieron son
+    huecos del archivo que no ocupan disco ni memoria. Solo quedan
+    residentes las páginas que toca el cabezal; el sistema puede
+    devolverlas al disco cuando necesita memoria.
+    
+    La entrada puede ser una ruta (os.PathLike) y se copia al mapa por
+    bloques sin crear nunca una cadena de Python con toda la cinta. Las
+    posiciones físicas (posicion_cabezal, izquierda, derecha) mantienen la
+    convención de Cinta, con origen igual al largo del archivo izquierdo.
+    """
+    
+    def __init__(self, entrada="", simbolo_blanco="_", simbolos=None, directorio=None):
+        """
+        Inicializa la cinta mapeada.
+        
+        Args:
+            entrada (str | os.PathLike): Cadena inicial en la cinta, o
+                archivo del que leerla (latin-1, un byte por celda; se
+                ignora el salto de línea final)
+            simbolo_blanco (str): Símbolo que representa una celda vacía
+            simbolos (list): Alfabeto de la cinta; si se omite se admite
+                cualquier símbolo latin-1 de un carácter
+            directorio (str): Directorio de los archivos temporales (por
+                defecto el de tempfile, que respeta TMPDIR); para cintas
+                más grandes que la memoria debe estar en disco, no en tmpfs
+        """
+        alfabeto = list(simbolos) if simbolos is not None else [chr(c) for c in range(256)]
+        if simbolo_blanco not in alfabeto:
+            alfabeto.append(simbolo_blanco)
+        for simbolo in alfabeto:
+            if len(simbolo) != 1 or ord(simbolo) > 0xFF:
+                raise ValueError(f"La cinta mmap solo admite símbolos latin-1 de un carácter: {simbolo!r}")
+        
+        self.simbolo_blanco = simbolo_blanco
+        self.directorio = directorio
+        blanco = ord(simbolo_blanco)
+        self.codigos = {simbolo: ord(simbolo) ^ blanco for simbolo in alfabeto}
+        # XOR con el blanco es su propia inversa: la misma tabla codifica y decodifica
+        self._traduccion = bytes(c ^ blanco for c in range(256))
+        self._alfabeto = bytes(ord(simbolo) for simbolo in alfabeto)
+        self._simbolo = [chr(c ^ blanco) for c in range(256)]
+        
+        self.cinta = None
+        self._negativas = self._crear_mapa()
+        self._positivas = self._crear_mapa()
+        self.origen = len(self._negativas)
+        self.posicion_cabezal = self.origen
+        self.izquierda = 0
+        self.derecha = 0
+        self.conteos = {}
+        
+        if isinstance(entrada, os.PathLike):
+            self._cargar_archivo(entrada)
+        elif entrada:
+            self._escribir(0, self._codificar(entrada))
+        self.recalcular_limites()
+    
+    def _crear_mapa(self, celdas=0):
+        """Mapea un archivo temporal (disperso, todo blanco) de al menos celdas bytes."""
+        tamano = _redondear_paginas(max(celdas, 1))
+        with tempfile.TemporaryFile(dir=self.directorio) as archivo:
+            archivo.truncate(tamano)
+            # El mapa conserva su propio descriptor: el archivo ya se puede cerrar
+            return mmap.mmap(archivo.fileno(), tamano)
+    
+    def _validar(self, datos):
+        """Verifica que los bytes latin-1 dados sean símbolos del alfabeto."""
+        ajenos = datos.translate(None, self._alfabeto)
+        if ajenos:
+            raise ValueError(f"Símbolo fuera del alfabeto de la cinta: {chr(ajenos[0])!r}")
+    
+    def _codificar(self, simbolos):
+        """Convierte una secuencia de símbolos a los bytes que se guardan en el mapa."""
+        texto = simbolos if isinstance(simbolos, str) else ''.join(simbolos)
+        try:
+            datos = texto.encode('latin-1')
+        except UnicodeEncodeError as e:
+            raise ValueError(f"Símbolo fuera del alfabeto de la cinta: {texto[e.start]!r}") from None
+        if len(datos) != len(simbolos):
+            raise ValueError("La cinta mmap solo admite símbolos de un carácter")
+        self._validar(datos)
+        return datos.translate(self._traduccion)
+    
+    def _cargar_archivo(self, ruta):
+        """Copia el contenido de un archivo a la cinta, de a un bloque por vez."""
+        with open(ruta, 'rb') as f:
+            tamano = os.fstat(f.fileno()).st_size
+            # Ignorar el salto de línea final
+            for final in (b'\n', b'\r'):
+                if tamano:
+                    f.seek(tamano - 1)
+                    if f.read(1) == final:
+                        tamano -= 1
+            f.seek(0)
+            
+            self._asegurar_celdas(False, tamano)
+            mapa = self._positivas
+            bloque = bytearray(TAMANO_BLOQUE)
+            posicion = 0
+            while posicion < tamano:
+                with memoryview(bloque)[:min(TAMANO_BLOQUE, tamano - posicion)] as vista:
+                    leidos = f.readinto(vista)
+                    if not leidos:
+                        break
+                    datos = vista[:leidos].tobytes()
+                self._validar(datos)
+                mapa[posicion:posicion + leidos] = datos.translate(self._traduccion)
+                _liberar(mapa, posicion, leidos)
+                posicion += leidos
+    
+    def _asegurar_celdas(self, negativas, celdas):
+        """
+        Hace crecer un lado de la cinta hasta tener al menos celdas celdas.
+        
+        El crecimiento al menos duplica el mapa y se redondea a páginas. Al
+        crecer por la izquierda también se corre el cabezal, que sigue en la
+        misma posición lógica.
+        """
+        mapa = self._negativas if negativas else self._positivas
+        if celdas <= len(mapa):
+            return
+        cantidad = _redondear_paginas(max(celdas, 2 * len(mapa))) - len(mapa)
+        if negativas:
+            self.expandir_izquierda(cantidad)
+            self.posicion_cabezal += cantidad
+        else:
+            self.expandir_derecha(cantidad)
+    
+    def expandir_izquierda(self, cantidad=10):
+        """Expande la cinta hacia la izquierda."""
+        self._negativas.resize(len(self._negativas) + cantidad)
+        self.origen += cantidad
+        self.izquierda += cantidad
+        self.derecha += cantidad
+    
+    def expandir_derecha(self, cantidad=10):
+        """Expande la cinta hacia la derecha."""
+        self._positivas.resize(len(self._positivas) + cantidad)
+    
+    def asegurar_posicion(self):
+        """Expande la cinta (por páginas) si el cabezal quedó fuera de ella."""
+        posicion = self.posicion_logica()
+        if posicion < 0:
+            self._asegurar_celdas(True, -posicion)
+        else:
+            self._asegurar_celdas(False, posicion + 1)
+    
+    def largo(self):
+        """Número de celdas mapeadas (las dos mitades)."""
+        return len(self._negativas) + len(self._positivas)
+    
+    def _codigo(self, posicion):
+        """Byte guardado en una posición lógica (0, el blanco, fuera de los mapas)."""
+        if posicion >= 0:
+            return self._positivas[posicion] if posicion < len(self._positivas) else 0
+        posicion = -posicion - 1
+        return self._negativas[posicion] if posicion < len(self._negativas) else 0
+    
+    def leer(self):
+        """Lee el símbolo en la posición actual del cabezal (sin expandir la cinta)."""
+        return self._simbolo[self._codigo(self.posicion_logica())]
+    
+    def escribir(self, simbolo):
+        """Escribe un símbolo en la posición actual del cabezal."""
+        codigo = self.codigos.get(simbolo)
+        if codigo is None:
+            raise ValueError(f"Símbolo fuera del alfabeto de la cinta: {simbolo!r}")
+        posicion = self.posicion_logica()
+        anterior = self._codigo(posicion)
+        if anterior == codigo:
+            return
+        self.asegurar_posicion()
+        if posicion >= 0:
+            self._positivas[posicion] = codigo
+        else:
+            self._negativas[-posicion - 1] = codigo
+        self.registrar_escritura(self.posicion_cabezal, self._simbolo[anterior], simbolo)
+    
+    def _leer(self, inicio, fin):
+        """Bytes de las posiciones lógicas [inicio, fin), con ceros fuera de los mapas."""
+        partes = []
+        if inicio < 0:
+            desde, hasta = -min(fin, 0), -inicio
+            tramo = self._negativas[desde:hasta]
+            partes.append((tramo + bytes(hasta - desde - len(tramo)))[::-1])
+        if fin > 0:
+            desde = max(inicio, 0)
+            tramo = self._positivas[desde:fin]
+            partes.append(tramo + bytes(fin - desde - len(tramo)))
+        return b''.join(partes)
+    
+    def _escribir(self, inicio, datos):
+        """
+        Escribe bytes desde la posición lógica inicio.
+        
+        Solo hace crecer la cinta si hay que escribir algo distinto del
+        blanco fuera de los mapas. No actualiza límites ni conteos.
+        """
+        if inicio < 0:
+            izquierda = datos[:-inicio][::-1]
+            desde = max(-inicio - len(datos), 0)
+            self._asegurar_celdas(True, desde + len(izquierda.rstrip(b'\0')))
+            tramo = izquierda[:max(len(self._negativas) - desde, 0)]
+            self._negativas[desde:desde + len(tramo)] = tramo
+            datos, inicio = datos[-inicio:], 0
+        if datos:
+            self._asegurar_celdas(False, inicio + len(datos.rstrip(b'\0')))
+            tramo = datos[:max(len(self._positivas) - inicio, 0)]
+            self._positivas[inicio:inicio + len(tramo)] = tramo
+    
+    def _liberar_tramo(self, inicio, fin):
+        """Deja de mantener residentes las páginas de las posiciones lógicas [inicio, fin)."""
+        if inicio < 0:
+            _liberar(self._negativas, -min(fin, 0), -inicio + min(fin, 0))
+        if fin > 0:
+            _liberar(self._positivas, max(inicio, 0), fin - max(inicio, 0))
+    
+    def buscar_no_blanco(self, inicio, fin):
+        """Índice de la primera celda no blanca en [inicio, fin), o fin si no hay."""
+        origen = self.origen
+        desde, hasta = inicio - origen, fin - origen
+        if desde < 0:
+            i = _ultimo_no_cero(self._negativas, -min(hasta, 0), min(-desde, len(self._negativas)))
+            if i is not None:
+                return origen - i - 1
+        if hasta > 0:
+            i = _primer_no_cero(self._positivas, max(desde, 0), min(hasta, len(self._positivas)))
+            if i is not None:
+                return origen + i
+        return fin
+    
+    def buscar_no_blanco_inverso(self, inicio, fin):
+        """Índice de la última celda no blanca en [inicio, fin), o inicio - 1 si no hay."""
+        origen = self.origen
+        desde, hasta = inicio - origen, fin - origen
+        if hasta > 0:
+            i = _ultimo_no_cero(self._positivas, max(desde, 0), min(hasta, len(self._positivas)))
+            if i is not None:
+                return origen + i
+        if desde < 0:
+            i = _primer_no_cero(self._negativas, -min(hasta, 0), min(-desde, len(self._negativas)))
+            if i is not None:
+                return origen - i - 1
+        return inicio - 1
+    
+    def recalcular_limites(self):
+        """Recalcula límites y conteos recorriendo los mapas por bloques."""
+        codigos = {simbolo: bytes([codigo]) for simbolo, codigo in self.codigos.items() if codigo}
+        conteos = Counter()
+        for mapa in (self._negativas, self._positivas):
+            for desde in range(0, len(mapa), TAMANO_BLOQUE):
+                bloque = mapa[desde:desde + TAMANO_BLOQUE]
+                if bloque.count(0) != len(bloque):
+                    for simbolo, codigo in codigos.items():
+                        conteos[simbolo] += bloque.count(codigo)
+                _liberar(mapa, desde, TAMANO_BLOQUE)
+        self.conteos = {simbolo: cantidad for simbolo, cantidad in conteos.items() if cantidad}
+        self._ajustar_limites()
+    
+    def _ajustar_limites(self):
+        """Busca los extremos no blancos (el costo depende de la distancia a los bordes)."""
+        if self.cantidad_no_blancos() == 0:
+            self.izquierda = self.derecha = 0
+        else:
+            self.izquierda = self.buscar_no_blanco(0, self.largo())
+            self.derecha = self.buscar_no_blanco_inverso(self.izquierda, self.largo()) + 1
+    
+    def contar(self, simbolo):
+        """Número de celdas que contienen el símbolo dado (O(1))."""
+        if simbolo == self.simbolo_blanco:
+            return self.largo() - self.cantidad_no_blancos()
+        return self.conteos.get(simbolo, 0)
+    
+    def _decodificar(self, inicio, fin):
+        """Símbolos de las posiciones lógicas [inicio, fin) como cadena."""
+        return self._leer(inicio, fin).translate(self._traduccion).decode('latin-1')
+    
+    def obtener_contenido(self):
+        """Retorna el contenido de la cinta como string, sin espacios en blanco en los extremos."""
+        if self.izquierda >= self.derecha:
+            return self.simbolo_blanco
+        return self._decodificar(*self.rango_usado())
+    
+    def simbolos(self):
+        """Retorna todas las celdas mapeadas como cadena (una letra por celda)."""
+        return self._decodificar(-self.origen, len(self._positivas))
+    
+    def tramo(self, inicio, fin):
+        """Símbolos de las posiciones lógicas [inicio, fin), con blancos fuera de la cinta."""
+        return list(self._decodificar(inicio, fin)) if fin > inicio else []
+    
+    def exportar(self, ruta):
+        """
+        Escribe el contenido de la cinta en un archivo, de a un bloque por vez.
+        
+        Args:
+            ruta (str): Archivo de destino (latin-1, un byte por celda)
+        """
+        inicio, fin = self.rango_usado() if self.izquierda < self.derecha else (0, 0)
+        with open(ruta, 'wb') as f:
+            if inicio == fin:
+                f.write(self.simbolo_blanco.encode('latin-1'))
+            for desde in range(inicio, fin, TAMANO_BLOQUE):
+                f.write(self._leer(desde, min(desde + TAMANO_BLOQUE, fin)).translate(self._traduccion))
+                if desde >= 0:
+                    _liberar(self._positivas, desde, TAMANO_BLOQUE)
+    
+    def reemplazar(self, simbolos, posicion_cabezal, origen):
+        """
+        Reemplaza el contenido completo de la cinta.
+        
+        Args:
+            simbolos (list): Nuevas celdas de la cinta
+            posicion_cabezal (int): Índice del cabezal en las nuevas celdas
+            origen (int): Índice de la primera celda de la entrada
+        """
+        datos = self._codificar(simbolos)
+        self.cerrar()
+        self._negativas = self._crear_mapa()
+        self._positivas = self._crear_mapa()
+        self.origen = len(self._negativas)
+        self.posicion_cabezal = posicion_cabezal - origen + self.origen
+        self.izquierda = self.derecha = 0
+        self._escribir(-origen, datos)
+        self.recalcular_limites()
+    
+    def ejecutar_compilado(self, tabla, estado, pasos, max_pasos, macro_pasos=False):
+        """
+        Ejecuta el motor compilado sobre la cinta, de a una ventana por vez.
+        
+        Se copia al motor una ventana centrada en el cabezal (de hasta
+        TAMANO_VENTANA celdas); cuando el cabezal sale de ella, los cambios
+        se escriben en el mapa (actualizando conteos y límites) y se toma
+        otra ventana.
+        
+        Args:
+            tabla (TablaCompilada): Tabla de la máquina
+            estado (int): Identificador del estado actual
+            pasos (int): Pasos ya ejecutados
+            max_pasos (int): Número máximo de pasos
+            macro_pasos (bool): Si True, agrupa las rachas de bucles en macro pasos
         
-        cinta_visible = ''.join(self.cinta[inicio:fin])
-        posicion_relativa = self.posicion_cabezal - inicio
+        Returns:
+            tuple: (estado, pasos, motivo), o None si la cinta tiene
+            símbolos que la tabla no conoce
+        """
+        if any(simbolo not in tabla.id_simbolo for simbolo, cantidad in self.conteos.items() if cantidad):
+            return None
+        # Códigos de la cinta <-> identificadores de la tabla
+        a_tabla = bytearray(256)
+        a_tabla[0] = tabla.blanco
+        de_tabla = bytearray(256)
+        simbolos = []
+        for simbolo, codigo in self.codigos.items():
+            if simbolo in tabla.id_simbolo:
+                a_tabla[codigo] = tabla.id_simbolo[simbolo]
+                de_tabla[tabla.id_simbolo[simbolo]] = codigo
+                if codigo:
+                    simbolos.append(simbolo)
         
-        # Crear indicador del cabezal
-        indicador = ' ' * posicion_relativa + '^'
+        posicion = self.posicion_logica()
+        motivo = 'borde'
+        # La ventana empieza en una página (las ejecuciones cortas no copian más) y se duplica en cada tramo
+        tamano = min(PAGINA, TAMANO_VENTANA)
+        while motivo == 'borde':
+            inicio = posicion - tamano // 2
+            original = self._leer(inicio, inicio + tamano)
+            ventana, relativa, estado, pasos, _, motivo = ejecutar_compilado(
+                tabla, bytearray(original.translate(a_tabla)), posicion - inicio, estado, pasos, max_pasos,
+                macro_pasos=macro_pasos, crecer=False
+            )
+            nueva = bytes(ventana.translate(de_tabla))
+            if nueva != original:
+                self._actualizar_ventana(inicio, original, nueva, simbolos)
+            self._liberar_tramo(inicio, inicio + tamano)
+            posicion = inicio + relativa
+            tamano = min(2 * tamano, TAMANO_VENTANA)
+        self.posicion_cabezal = posicion + self.origen
+        return estado, pasos, motivo
+    
+    def _actualizar_ventana(self, inicio, original, nueva, simbolos):
+        """Escribe una ventana modificada y actualiza conteos y límites con la diferencia."""
+        for simbolo in simbolos:
+            codigo = bytes([self.codigos[simbolo]])
+            diferencia = nueva.count(codigo) - original.count(codigo)
+            if diferencia:
+                self.conteos[simbolo] = self.conteos.get(simbolo, 0) + diferencia
+        vacia = self.izquierda >= self.derecha
+        self._escribir(inicio, nueva)
         
-        return f"Cinta: {cinta_visible}\n       {indicador}"
\ No newline at end of file
+        if self.cantidad_no_blancos() == 0:
+            self.izquierda = self.derecha = 0
+            return
+        desde, hasta = inicio + self.origen, inicio + len(nueva) + self.origen
+        if vacia:
+            # Todo lo no blanco está en la ventana
+            self.izquierda = self.buscar_no_blanco(desde, hasta)
+            self.derecha = self.buscar_no_blanco_inverso(self.izquierda, hasta) + 1
+            return
+        # Un extremo fuera de la ventana no cambió; uno dentro se busca de nuevo
+        if self.izquierda >= desde:
+            self.izquierda = self.buscar_no_blanco(desde, max(hasta, self.derecha))
+        if self.derecha <= hasta:
+            self.derecha = self.buscar_no_blanco_inverso(min(desde, self.izquierda), hasta) + 1
+    
+    def cerrar(self):
+        """Libera los mapas de la cinta (los archivos temporales se borran solos)."""
+        for mapa in (self._negativas, self._positivas):
+            mapa.close()
+    
+    def __str__(self):
+        """Representación visual de la cinta con el cabezal."""
+        posicion = self.posicion_logica()
+        return formatear_ventana(self._decodificar(posicion - 20, posicion + 20), 20)
+
+
+# Implementaciones de cinta disponibles para MaquinaTuring.inicializar
+TIPOS_CINTA = {
+    'lista': Cinta,
+    'compacta': CintaCompacta,
+    'mmap': CintaMmap,
+}
+
+
+def leer_entrada(ruta):
+    """Lee una entrada desde un archivo (latin-1, un byte por celda), sin el salto de línea final."""
+    with open(ruta, 'r', encoding='latin-1', newline='') as f:
+        return f.read().removesuffix('\n').removesuffix('\r')
+
+
+def crear_cinta(tipo, entrada="", simbolo_blanco="_", simbolos=None):
+    """
+    Crea una cinta del tipo indicado.
+    
+    Args:
+        tipo (str): Clave de TIPOS_CINTA ('lista', 'compacta' o 'mmap')
+        entrada (str | os.PathLike): Cadena inicial en la cinta, o archivo
+            que la contiene (la cinta 'mmap' lo copia por bloques; las
+            demás lo leen completo con leer_entrada)
+        simbolo_blanco (str): Símbolo que representa una celda vacía
+        simbolos (list): Alfabeto de la cinta
+    
+    Returns:
+        Cinta: Nueva cinta con el cabezal en la primera celda de la entrada
+    """
+    if tipo not in TIPOS_CINTA:
+        raise ValueError(f"Tipo de cinta desconocido: {tipo!r} (use uno de {', '.join(TIPOS_CINTA)})")
+    clase = TIPOS_CINTA[tipo]
+    if isinstance(entrada, os.PathLike) and not issubclass(clase, CintaMmap):
+        entrada = leer_entrada(entrada)
+    return clase(entrada, simbolo_blanco=simbolo_blanco, simbolos=simbolos)
@@ -0,0 +1,202 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from types import MappingProxyType
+
+from src.motor_compilado import TablaCompilada
+from src.optimizador import optimizar_configuracion
+from src.tabla_binaria import guardar_binario, leer_binario, ruta_binaria
+from src.validacion import validar_configuracion
+
+
+# Máximo de definiciones que se mantienen cargadas por proceso
+TAMANO_CACHE = 32
+
+# Transiciones a partir de las cuales cargar_definicion() guarda el archivo binario
+UMBRAL_BINARIO = 1000
+
+_cache = OrderedDict()
+
+
+class DefinicionMT:
+    """
+    Programa de una Máquina de Turing ya cargado y compilado, de solo lectura.
+
+    Se puede compartir entre muchas ejecuciones: ninguna de ellas lo modifica.
+
+    Las máquinas de varias cintas (``num_cintas`` > 1 en el JSON) leen,
+    escriben y mueven una lista de símbolos y direcciones, una por cinta: sus
+    transiciones se indexan por (estado, tupla de símbolos leídos) y no tienen
+    tabla compilada (tabla es None).
+
+    La configuración se valida al construirla (ver validar_configuracion):
+    una máquina inválida lanza ErrorConfiguracion. Los pares (estado,
+    símbolo) sin transición no son un error, pero quedan en
+    transiciones_faltantes.
+    """
+
+    __slots__ = ('ruta', 'huella', 'nombre', 'descripcion', 'estados', 'estado_inicial',
+                 'estados_finales', 'simbolos_cinta', 'num_cintas', 'cinta_salida', 'transiciones',
+                 'transiciones_faltantes', 'tabla', 'optimizacion', '_diferidos')
+
+    def __init__(self, config, ruta=None, huella=None, optimizacion=None):
+        """
+        Construye la definición a partir del diccionario de configuración.
+
+        Args:
+            config (dict): Contenido del archivo JSON de la máquina
+            ruta (str): Ruta del archivo de origen, si lo hay
+            huella (str): Hash SHA-256 del contenido del archivo; si se omite
+                se calcula sobre la configuración serializada
+            optimizacion (ReporteOptimizacion): Reporte, si config es el
+                resultado de optimizar_configuracion()
+
+        Raises:
+            ErrorConfiguracion: Si la configuración no es válida
+        """
+        faltantes = validar_configuracion(config, ruta)
+        if huella is None:
+            huella = hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+
+        num_cintas = config.get('num_cintas', 1)
+        cinta_salida = config.get('cinta_salida', 0)
+
+        transiciones = {}
+        for t in config['transiciones']:
+            leido, escrito, direccion = t['simbolo_leido'], t['simbolo_escribir'], t['direccion']
+            if num_cintas > 1:
+                leido, escrito, direccion = tuple(leido), tuple(escrito), tuple(direccion)
+            transiciones[(t['estado_actual'], leido)] = (t['nuevo_estado'], escrito, direccion)
+
+        asignar = super().__setattr__
+        asignar('ruta', ruta)
+        asignar('huella', huella)
+        asignar('nombre', config.get('nombre', 'Máquina de Turing'))
+        asignar('descripcion', config.get('descripcion', ''))
+        asignar('estados', tuple(config['estados']))
+        asignar('estado_inicial', config['estado_inicial'])
+        asignar('estados_finales', frozenset(config['estados_finales']))
+        asignar('simbolos_cinta', tuple(config['simbolos_cinta']))
+        asignar('num_cintas', num_cintas)
+        asignar('cinta_salida', cinta_salida)
+        asignar('transiciones', MappingProxyType(transiciones))
+        asignar('transiciones_faltantes', tuple(faltantes))
+        # Los motores compilado y vectorizado son de una sola cinta
+        asignar('tabla', TablaCompilada(
+            self.estados, self.simbolos_cinta, self.transiciones,
+            self.estados_finales, simbolo_blanco='_'
+        ) if num_cintas == 1 else None)
+        asignar('optimizacion', optimizacion)
+        asignar('_diferidos', None)
+
+    @classmethod
+    def desde_campos(cls, ruta=None, optimizacion=None, diferidos=None, **campos):
+        """
+        Construye una definición con sus campos ya calculados, sin validar
+        ni compilar (los de un archivo binario ya validado, ver leer_binario()).
+
+        Args:
+            ruta (str): Ruta del archivo JSON de origen
+            optimizacion (ReporteOptimizacion): Reporte de optimización, si lo hay
+            diferidos (callable): Función que retorna un dict con los campos
+                que faltan en campos; se llama la primera vez que se lee
+                alguno de ellos
+            **campos: Valor de los demás atributos
+
+        Returns:
+            DefinicionMT: Definición de solo lectura
+        """
+        definicion = cls.__new__(cls)
+        campos.update(ruta=ruta, optimizacion=optimizacion, _diferidos=diferidos)
+        for nombre, valor in campos.items():
+            object.__setattr__(definicion, nombre, valor)
+        return definicion
+
+    def __getattr__(self, nombre):
+        # Solo se llama para un atributo sin valor: los diferidos se calculan al
+        # primer uso y después quedan en su slot, sin costo en cada acceso
+        diferidos = self._diferidos if nombre in self.__slots__ and nombre != '_diferidos' else None
+        if diferidos is None:
+            raise AttributeError(f"DefinicionMT no tiene el atributo {nombre!r}")
+        for campo, valor in diferidos().items():
+            object.__setattr__(self, campo, valor)
+        object.__setattr__(self, '_diferidos', None)
+        return object.__getattribute__(self, nombre)
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("DefinicionMT es de solo lectura")
+
+    def __delattr__(self, nombre):
+        raise AttributeError("DefinicionMT es de solo lectura")
+
+    def __repr__(self):
+        cintas = f", cintas={self.num_cintas}" if self.num_cintas > 1 else ""
+        return (f"DefinicionMT({self.nombre!r}, estados={len(self.estados)}, "
+                f"transiciones={len(self.transiciones)}{cintas})")
+
+
+def cargar_definicion(ruta, optimizar=False, preservar_pasos=True, binario=True):
+    """
+    Carga una definición desde un archivo JSON, reutilizando la ya cargada.
+
+    La caché es de todo el proceso y se indexa por ruta absoluta, fecha de
+    modificación y tamaño del archivo, así que un archivo editado se vuelve
+    a leer. Se descarta la definición usada hace más tiempo cuando hay más
+    de TAMANO_CACHE.
+
+    Las máquinas de una cinta con UMBRAL_BINARIO transiciones o más se
+    guardan además, ya validadas y compiladas, en un archivo binario junto
+    al JSON (ver src.tabla_binaria). Las siguientes cargas, también desde
+    otros procesos, lo mapean en memoria en vez de leer y validar el JSON.
+
+    Args:
+        ruta (str): Ruta al archivo JSON de configuración
+        optimizar (bool): Si True, optimiza la tabla al cargarla (ver
+            optimizar_configuracion); el reporte queda en definicion.optimizacion
+            y la huella es la de la configuración optimizada
+        preservar_pasos (bool): Con optimizar, si False también compone
+            cadenas de transiciones (la máquina da menos pasos)
+        binario (bool): Si False, no lee ni guarda el archivo binario
+
+    Returns:
+        DefinicionMT: Definición compartida (no se debe modificar)
+
+    Raises:
+        ErrorConfiguracion: Si la configuración no es válida
+    """
+    ruta = os.path.abspath(ruta)
+    info = os.stat(ruta)
+    clave = (ruta, info.st_mtime_ns, info.st_size, optimizar, optimizar and preservar_pasos)
+
+    definicion = _cache.get(clave)
+    if definicion is not None:
+        _cache.move_to_end(clave)
+        return definicion
+
+    campos = leer_binario(ruta_binaria(ruta), info) if binario and not optimizar else None
+    if campos is not None:
+        definicion = DefinicionMT.desde_campos(ruta=ruta, **campos)
+    else:
+        with open(ruta, 'rb') as f:
+            datos = f.read()
+        if optimizar:
+            config, reporte = optimizar_configuracion(json.loads(datos), preservar_pasos)
+            definicion = DefinicionMT(config, ruta=ruta, optimizacion=reporte)
+        else:
+            definicion = DefinicionMT(json.loads(datos), ruta=ruta, huella=hashlib.sha256(datos).hexdigest())
+            if binario and definicion.tabla is not None and len(definicion.transiciones) >= UMBRAL_BINARIO:
+                guardar_binario(definicion, info)
+
+    # Una versión anterior del mismo archivo ya no sirve
+    for anterior in [c for c in _cache if c[0] == ruta and c[1:3] != clave[1:3]]:
+        del _cache[anterior]
+    _cache[clave] = definicion
+    while len(_cache) > TAMANO_CACHE:
+        _cache.popitem(last=False)
+    return definicion
+
+
+def limpiar_cache():
+    """Vacía la caché de definiciones del proceso."""
+    _cache.clear()
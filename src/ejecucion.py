@@ -0,0 +1,483 @@
+import time
+from collections import namedtuple
+from itertools import islice
+
+from src.checkpoint import guardar_checkpoint, leer_checkpoint
+from src.ciclos import DetectorCiclos
+from src.cinta import CintaMmap, crear_cinta
+from src.definicion import cargar_definicion
+from src.historial import RegistroHistorial
+from src.motor_compilado import ejecutar_compilado
+from src.traza import TrazaDelta
+
+
+# Evento de un paso ejecutado; paso y posicion (lógica) son los de después del paso
+EventoPaso = namedtuple('EventoPaso', ['paso', 'estado', 'simbolo_leido', 'nuevo_estado',
+                                       'simbolo_escrito', 'direccion', 'posicion'])
+
+
+class Ejecucion:
+    """
+    Estado de una ejecución de una Máquina de Turing sobre una entrada.
+    
+    Solo guarda lo que cambia al ejecutar (cinta, estado, pasos e historial);
+    el programa está en la DefinicionMT, que se comparte entre ejecuciones.
+    """
+    
+    __slots__ = ('definicion', 'mostrar_avisos', 'cinta', 'estado_actual', 'pasos', 'motivo_parada',
+                 'registro_historial', 'historial', 'traza', 'detector', 'perfilador')
+    
+    def __init__(self, definicion, entrada=None, mostrar_avisos=True, **opciones):
+        """
+        Crea una ejecución de la definición dada.
+        
+        Args:
+            definicion (DefinicionMT): Programa de la máquina
+            entrada (str): Si se indica, inicializa la cinta con ella
+            mostrar_avisos (bool): Si False, no imprime los avisos de parada
+            **opciones: Argumentos adicionales para inicializar()
+        """
+        self.definicion = definicion
+        self.mostrar_avisos = mostrar_avisos
+        self.cinta = None
+        self.estado_actual = None
+        self.pasos = 0
+        self.motivo_parada = None
+        self.registro_historial = RegistroHistorial()
+        self.historial = self.registro_historial.configuraciones
+        self.traza = None
+        self.detector = None
+        self.perfilador = None
+        if entrada is not None:
+            self.inicializar(entrada, **opciones)
+    
+    def inicializar(self, entrada, historial='completo', tamano_historial=100, muestreo_historial=10,
+                    intervalo_checkpoint=1000, tipo_cinta='lista'):
+        """
+        Inicializa la máquina con una cadena de entrada.
+        
+        Args:
+            entrada (str | os.PathLike): Cadena de entrada para la cinta, o
+                archivo que la contiene (ver crear_cinta)
+            historial (str): Modo del historial: 'completo', 'anillo',
+                'muestreo', 'delta' o 'ninguno'
+            tamano_historial (int): Configuraciones que guarda el modo 'anillo'
+            muestreo_historial (int): Cada cuántos pasos guarda el modo 'muestreo'
+            intervalo_checkpoint (int): Pasos entre copias completas de la
+                cinta en el modo 'delta'
+            tipo_cinta (str): Implementación de la cinta: 'lista',
+                'compacta' (un byte por celda) o 'mmap' (un byte por celda
+                en archivos mapeados en memoria, para cintas muy grandes)
+        """
+        self.cinta = crear_cinta(tipo_cinta, entrada, simbolo_blanco='_', simbolos=self.definicion.simbolos_cinta)
+        self.estado_actual = self.definicion.estado_inicial
+        self.pasos = 0
+        self.motivo_parada = None
+        self.configurar_historial(historial, tamano_historial, muestreo_historial, intervalo_checkpoint)
+        
+        # Guardar configuración inicial
+        self.guardar_configuracion()
+    
+    def configurar_historial(self, modo='completo', tamano=100, cada=10, intervalo_checkpoint=1000):
+        """
+        Reinicia el historial con el modo de registro indicado.
+        
+        Args:
+            modo (str): 'completo', 'anillo', 'muestreo', 'delta' o 'ninguno'
+            tamano (int): Configuraciones que guarda el modo 'anillo'
+            cada (int): Cada cuántos pasos guarda el modo 'muestreo'
+            intervalo_checkpoint (int): Pasos entre checkpoints del modo 'delta'
+        """
+        self.registro_historial = RegistroHistorial(modo, tamano=tamano, cada=cada)
+        self.historial = self.registro_historial.configuraciones
+        self.traza = None
+        if modo == 'delta':
+            self.traza = TrazaDelta(self.definicion.tabla, intervalo_checkpoint=intervalo_checkpoint)
+            self.historial = self.traza
+            if self.cinta is not None:
+                self.traza.checkpoint(self.pasos, self.estado_actual, self.cinta)
+    
+    def paso(self):
+        """
+        Ejecuta un paso de la máquina de Turing.
+        
+        Returns:
+            bool: True si la máquina continúa, False si se detiene
+        """
+        if self.estado_actual in self.definicion.estados_finales:
+            self.motivo_parada = 'final'
+            return False
+        
+        simbolo_actual = self.cinta.leer()
+        clave = (self.estado_actual, simbolo_actual)
+        
+        if clave not in self.definicion.transiciones:
+            self.motivo_parada = 'sin_transicion'
+            self.avisar(f"⚠️  No hay transición definida para ({self.estado_actual}, '{simbolo_actual}')")
+            return False
+        
+        nuevo_estado, simbolo_escribir, direccion = self.definicion.transiciones[clave]
+        
+        # Ejecutar transición
+        self.cinta.escribir(simbolo_escribir)
+        self.cinta.mover_cabezal(direccion)
+        self.estado_actual = nuevo_estado
+        self.pasos += 1
+        
+        # Guardar configuración
+        if self.traza is not None:
+            self.traza.registrar(nuevo_estado, direccion, simbolo_escribir)
+            if self.traza.necesita_checkpoint():
+                self.traza.checkpoint(self.pasos, self.estado_actual, self.cinta)
+        else:
+            self.guardar_configuracion()
+        
+        return True
+    
+    def iterar(self, max_pasos=1000):
+        """
+        Ejecuta la máquina paso a paso, entregando un evento por cada paso.
+        
+        Es perezoso: cada paso se ejecuta cuando el consumidor pide el
+        siguiente evento, así que se puede detener en cualquier momento. El
+        historial se registra igual que con ejecutar(). Al terminar, el motivo
+        de parada queda en self.motivo_parada (sin imprimir el aviso de límite).
+        
+        Args:
+            max_pasos (int): Número máximo de pasos a ejecutar
+        
+        Yields:
+            EventoPaso: Datos del paso recién ejecutado
+        """
+        transiciones = self.definicion.transiciones
+        cinta = self.cinta
+        while self.pasos < max_pasos:
+            estado = self.estado_actual
+            simbolo = cinta.leer()
+            if not self.paso():
+                self.guardar_configuracion(final=True)
+                return
+            nuevo_estado, simbolo_escrito, direccion = transiciones[(estado, simbolo)]
+            yield EventoPaso(self.pasos, estado, simbolo, nuevo_estado, simbolo_escrito,
+                             direccion, cinta.posicion_logica())
+        self.motivo_parada = 'limite_pasos'
+    
+    def iterar_bloques(self, tamano_bloque=1000, max_pasos=1000):
+        """
+        Igual que iterar(), pero entrega los eventos en listas de tamano_bloque.
+        
+        Yields:
+            list: Hasta tamano_bloque eventos EventoPaso consecutivos
+        """
+        if tamano_bloque < 1:
+            raise ValueError("El tamaño de bloque debe ser al menos 1")
+        eventos = self.iterar(max_pasos)
+        while True:
+            bloque = list(islice(eventos, tamano_bloque))
+            if not bloque:
+                return
+            yield bloque
+    
+    def ejecutar(self, max_pasos=1000, mostrar_pasos=False, compilado=False, historial=None, macro_pasos=False,
+                 checkpoint_cada=None, ruta_checkpoint=None, detectar_ciclos=False, perfilador=None):
+        """
+        Ejecuta la máquina hasta que se detenga o alcance el máximo de pasos.
+        
+        Args:
+            max_pasos (int): Número máximo de pasos a ejecutar
+            mostrar_pasos (bool): Si True, muestra cada paso en la consola
+            compilado (bool): Si True, usa el motor de tabla compilada. El
+                historial solo recibe la configuración final. Se ignora si
+                mostrar_pasos es True o si el historial está en modo 'delta'.
+            historial (str): Si se indica y es distinto del actual, reinicia
+                el historial con ese modo antes de ejecutar (ver configurar_historial)
+            macro_pasos (bool): Con el motor compilado, ejecuta las rachas de
+                transiciones que no cambian de estado en un solo macro paso.
+                Conviene en máquinas que recorren rachas largas (entradas
+                unarias); con rachas de pocas celdas el costo extra por paso
+                lo hace más lento.
+            checkpoint_cada (int): Si se indica, guarda un checkpoint en
+                ruta_checkpoint cada tantos pasos y al detenerse
+            ruta_checkpoint (str): Archivo del checkpoint automático
+            detectar_ciclos (bool): Si True, detiene la ejecución en cuanto
+                detecta que no terminará (ver DetectorCiclos). Usa el motor
+                interpretado aunque compilado sea True.
+            perfilador (Perfilador): Si se indica, registra en él cada paso
+                (transiciones, tiempo por estado, recorrido y crecimientos de
+                la cinta). También usa el motor interpretado.
+        
+        Returns:
+            bool: True si terminó exitosamente, False si excedió el límite o
+            se detectó un ciclo. El motivo ('final', 'sin_transicion',
+            'limite_pasos', 'ciclo' o 'ciclo_trasladado') queda en
+            self.motivo_parada y los datos del ciclo en self.detector.
+        """
+        if historial is not None and historial != self.registro_historial.modo:
+            registro = self.registro_historial
+            self.configurar_historial(historial, registro.tamano, registro.cada)
+        
+        self.detector = DetectorCiclos(self) if detectar_ciclos else None
+        self.perfilador = perfilador
+        if perfilador is not None:
+            perfilador.conectar(self)
+        
+        try:
+            terminado = self._ejecutar_tramos(max_pasos, mostrar_pasos, compilado, macro_pasos,
+                                              checkpoint_cada, ruta_checkpoint)
+        finally:
+            if perfilador is not None:
+                perfilador.desconectar(self)
+        
+        if self.motivo_parada == 'limite_pasos':
+            self.avisar(f"⚠️  Se alcanzó el límite de {max_pasos} pasos")
+        elif not terminado:
+            self.avisar(f"🔁 La máquina no se detendrá ({self.motivo_parada} de {self.detector.periodo} "
+                        f"pasos desde el paso {self.detector.inicio_ciclo})")
+        return terminado
+    
+    def _ejecutar_tramos(self, max_pasos, mostrar_pasos, compilado, macro_pasos, checkpoint_cada, ruta_checkpoint):
+        """Ejecuta de una vez o, con checkpoint_cada, por tramos guardando un checkpoint tras cada uno."""
+        if not checkpoint_cada:
+            return self._ejecutar_hasta(max_pasos, mostrar_pasos, compilado, macro_pasos)
+        
+        if ruta_checkpoint is None:
+            raise ValueError("checkpoint_cada requiere ruta_checkpoint")
+        # Ejecutar por tramos que terminan en múltiplos de checkpoint_cada
+        while True:
+            limite = min(max_pasos, (self.pasos // checkpoint_cada + 1) * checkpoint_cada)
+            terminado = self._ejecutar_hasta(limite, mostrar_pasos, compilado, macro_pasos)
+            self.guardar_checkpoint(ruta_checkpoint)
+            if self.motivo_parada != 'limite_pasos' or limite >= max_pasos:
+                return terminado
+    
+    def _ejecutar_hasta(self, max_pasos, mostrar_pasos, compilado, macro_pasos):
+        """Ejecuta hasta detenerse o llegar a max_pasos, sin avisar del límite."""
+        if self.detector is not None or self.perfilador is not None:
+            return self._ejecutar_instrumentado(max_pasos, mostrar_pasos)
+        
+        if compilado and not mostrar_pasos and self.traza is None:
+            resultado = self._ejecutar_compilado(max_pasos, macro_pasos)
+            if resultado is not None:
+                return resultado
+        
+        while self.pasos < max_pasos:
+            if mostrar_pasos:
+                self.mostrar_configuracion()
+            
+            if not self.paso():
+                if mostrar_pasos:
+                    self.mostrar_configuracion()
+                self.guardar_configuracion(final=True)
+                return True
+        
+        self.motivo_parada = 'limite_pasos'
+        return False
+    
+    def _ejecutar_instrumentado(self, max_pasos, mostrar_pasos):
+        """Bucle interpretado que informa cada paso al detector de ciclos y al perfilador."""
+        transiciones = self.definicion.transiciones
+        detector = self.detector
+        perfilador = self.perfilador
+        cinta = self.cinta
+        reloj = time.perf_counter
+        while self.pasos < max_pasos:
+            if mostrar_pasos:
+                self.mostrar_configuracion()
+            
+            estado = self.estado_actual
+            posicion = cinta.posicion_logica()
+            leido = cinta.leer()
+            inicio = reloj()
+            continua = self.paso()
+            duracion = reloj() - inicio
+            if not continua:
+                if mostrar_pasos:
+                    self.mostrar_configuracion()
+                self.guardar_configuracion(final=True)
+                return True
+            
+            if perfilador is not None:
+                perfilador.registrar(estado, leido, duracion, posicion, cinta.posicion_logica())
+            if detector is not None:
+                escrito = transiciones[(estado, leido)][1]
+                motivo = detector.registrar(self.pasos, self.estado_actual, posicion, leido, escrito, cinta)
+                if motivo is not None:
+                    self.motivo_parada = motivo
+                    self.guardar_configuracion(final=True)
+                    return False
+        
+        self.motivo_parada = 'limite_pasos'
+        return False
+    
+    def ejecutar_compilado(self, max_pasos=1000, macro_pasos=False):
+        """
+        Ejecuta la máquina con el motor compilado y vuelca el resultado en la cinta.
+        
+        Args:
+            max_pasos (int): Número máximo de pasos a ejecutar
+            macro_pasos (bool): Si True, agrupa las rachas de bucles en macro pasos
+        
+        Returns:
+            bool: Igual que ejecutar(), o None si la cinta contiene símbolos
+            fuera del alfabeto y hay que usar el motor interpretado
+        """
+        resultado = self._ejecutar_compilado(max_pasos, macro_pasos)
+        if resultado is False:
+            self.avisar(f"⚠️  Se alcanzó el límite de {max_pasos} pasos")
+        return resultado
+    
+    def _ejecutar_compilado(self, max_pasos, macro_pasos):
+        """Igual que ejecutar_compilado(), pero sin avisar del límite de pasos."""
+        tabla = self.definicion.tabla
+        if self.estado_actual not in tabla.id_estado:
+            return None
+        pasos_iniciales = self.pasos
+        
+        if isinstance(self.cinta, CintaMmap):
+            # La cinta mapeada no se copia entera: el motor recorre ventanas sobre el mapa
+            resultado = self.cinta.ejecutar_compilado(tabla, tabla.id_estado[self.estado_actual],
+                                                      self.pasos, max_pasos, macro_pasos)
+            if resultado is None:
+                return None
+            estado, pasos, motivo = resultado
+        else:
+            contenido = tabla.codificar(self.cinta.simbolos())
+            if contenido is None:
+                return None
+            
+            # El cabezal puede haber quedado justo fuera de la cinta
+            posicion = self.cinta.posicion_cabezal
+            relleno = 0
+            if posicion < 0:
+                relleno = 10
+                contenido[0:0] = bytes([tabla.blanco]) * relleno
+                posicion += relleno
+            elif posicion >= len(contenido):
+                contenido.extend(bytes([tabla.blanco]) * 10)
+            
+            contenido, posicion, estado, pasos, desplazamiento, motivo = ejecutar_compilado(
+                tabla, contenido, posicion, tabla.id_estado[self.estado_actual],
+                self.pasos, max_pasos, macro_pasos=macro_pasos
+            )
+            self.cinta.reemplazar(tabla.decodificar(contenido), posicion,
+                                  self.cinta.origen + relleno + desplazamiento)
+        
+        self.estado_actual = tabla.estados[estado]
+        self.pasos = pasos
+        self.motivo_parada = motivo
+        if pasos > pasos_iniciales:
+            self.guardar_configuracion(final=motivo != 'limite_pasos')
+        
+        if motivo == 'sin_transicion':
+            self.avisar(f"⚠️  No hay transición definida para ({self.estado_actual}, '{self.cinta.leer()}')")
+        return motivo != 'limite_pasos'
+    
+    def guardar_checkpoint(self, ruta):
+        """
+        Guarda el estado de la ejecución (estado, cabezal, cinta y pasos) en disco.
+        
+        Args:
+            ruta (str): Archivo de destino (ver checkpoint.guardar_checkpoint)
+        """
+        guardar_checkpoint(self, ruta)
+    
+    @classmethod
+    def desde_checkpoint(cls, ruta, definicion=None, mostrar_avisos=True, historial='ninguno', **opciones):
+        """
+        Reanuda una ejecución guardada con guardar_checkpoint().
+        
+        El historial empieza vacío a partir de la configuración restaurada.
+        
+        Args:
+            ruta (str): Archivo del checkpoint
+            definicion (DefinicionMT): Máquina a usar; si se omite se carga
+                desde la ruta de configuración guardada en el checkpoint
+            mostrar_avisos (bool): Si False, no imprime los avisos de parada
+            historial (str): Modo del historial de la ejecución reanudada
+            **opciones: Argumentos adicionales para configurar_historial()
+        
+        Returns:
+            Ejecucion: Ejecución lista para continuar con ejecutar()
+        """
+        datos = leer_checkpoint(ruta)
+        if definicion is None:
+            if datos.ruta_config is None:
+                raise ValueError("El checkpoint no guarda la ruta de su configuración; indique la definición")
+            definicion = cargar_definicion(datos.ruta_config)
+        if definicion.huella != datos.huella:
+            raise ValueError("El checkpoint corresponde a otra definición de la máquina")
+        
+        tabla = definicion.tabla
+        ejecucion = cls(definicion, mostrar_avisos=mostrar_avisos)
+        ejecucion.cinta = crear_cinta(datos.tipo_cinta, simbolo_blanco='_', simbolos=definicion.simbolos_cinta)
+        ejecucion.cinta.reemplazar(tabla.decodificar(datos.celdas), datos.posicion_cabezal, datos.origen)
+        ejecucion.estado_actual = tabla.estados[datos.estado]
+        ejecucion.pasos = datos.pasos
+        ejecucion.configurar_historial(historial, **opciones)
+        ejecucion.guardar_configuracion()
+        return ejecucion
+    
+    def avisar(self, mensaje):
+        """Imprime un aviso de la ejecución, salvo que estén desactivados."""
+        if self.mostrar_avisos:
+            print(mensaje)
+    
+    def guardar_configuracion(self, final=False):
+        """
+        Guarda la configuración actual en el historial, si el modo lo pide.
+        
+        Args:
+            final (bool): True si es la configuración en la que se detuvo la máquina
+        """
+        if not self.registro_historial.debe_registrar(self.pasos, final):
+            return
+        
+        config = {
+            'paso': self.pasos,
+            'estado': self.estado_actual,
+            'posicion': self.cinta.posicion_logica(),
+            'cinta': self.cinta.obtener_contenido(),
+            'simbolo_actual': self.cinta.leer()
+        }
+        self.registro_historial.agregar(config)
+    
+    def mostrar_configuracion(self):
+        """Muestra la configuración actual de la máquina."""
+        print(f"\n--- Paso {self.pasos} ---")
+        print(f"Estado: {self.estado_actual}")
+        print(str(self.cinta))
+        print(f"Símbolo leído: '{self.cinta.leer()}'")
+    
+    def obtener_resultado(self):
+        """Retorna el contenido final de la cinta."""
+        return self.cinta.obtener_contenido()
+    
+    def obtener_historial(self):
+        """
+        Retorna las configuraciones guardadas según el modo del historial.
+        
+        En el modo 'delta' retorna la TrazaDelta, que reconstruye cada
+        configuración bajo demanda al indexarla o recorrerla.
+        """
+        if self.traza is not None:
+            return self.traza
+        return self.registro_historial.como_lista()
+
+
+def crear_ejecucion(definicion, entrada=None, mostrar_avisos=True, **opciones):
+    """
+    Crea la ejecución adecuada para la definición (de una o de varias cintas).
+    
+    Args:
+        definicion (DefinicionMT): Programa de la máquina
+        entrada (str): Si se indica, inicializa la cinta de entrada con ella
+        mostrar_avisos (bool): Si False, no imprime los avisos de parada
+        **opciones: Argumentos adicionales para inicializar()
+    
+    Returns:
+        Ejecucion: Ejecucion o EjecucionMulticinta
+    """
+    if definicion.num_cintas > 1:
+        from src.multicinta import EjecucionMulticinta
+        return EjecucionMulticinta(definicion, entrada, mostrar_avisos, **opciones)
+    return Ejecucion(definicion, entrada, mostrar_avisos, **opciones)
@@ -11,13 +11,17 @@ def cargar_configuracion(archivo):
         return json.load(f)
 
 
-def crear_diagrama_estados(config, archivo_salida='docs/diagrama_estados.png'):
+def crear_diagrama_estados(config, archivo_salida='docs/diagrama_estados.png', calor=None, etiqueta_calor='Pasos'):
     """
     Crea un diagrama visual de estados de la Máquina de Turing.
     
     Args:
         config (dict): Configuración de la máquina
         archivo_salida (str): Ruta donde guardar el diagrama
+        calor (dict): Si se indica, colorea cada estado según su valor
+            (por ejemplo Perfilador.calor_estados()); el borde sigue
+            distinguiendo el estado inicial y los finales
+        etiqueta_calor (str): Título de la barra de colores
     """
     # Crear grafo dirigido
     G = nx.MultiDiGraph()
@@ -59,23 +63,34 @@ def crear_diagrama_estados(config, archivo_salida='docs/diagrama_estados.png'):
     estado_inicial = config['estado_inicial']
     estados_finales = config['estados_finales']
     
-    # Separar tipos de nodos
-    nodos_normales = [n for n in G.nodes() if n != estado_inicial and n not in estados_finales]
-    
-    # Dibujar nodos normales
-    nx.draw_networkx_nodes(G, pos, nodelist=nodos_normales, 
-                          node_color='lightblue', node_size=3000, 
-                          node_shape='o', edgecolors='black', linewidths=2)
-    
-    # Dibujar estado inicial
-    nx.draw_networkx_nodes(G, pos, nodelist=[estado_inicial], 
-                          node_color='lightgreen', node_size=3500, 
-                          node_shape='o', edgecolors='darkgreen', linewidths=3)
-    
-    # Dibujar estados finales
-    nx.draw_networkx_nodes(G, pos, nodelist=estados_finales, 
-                          node_color='lightcoral', node_size=3500, 
-                          node_shape='o', edgecolors='darkred', linewidths=3)
+    if calor is not None:
+        # Mapa de calor: el relleno indica el valor y el borde el tipo de estado
+        nodos = list(G.nodes())
+        valores = [calor.get(n, 0) for n in nodos]
+        bordes = ['darkgreen' if n == estado_inicial else 'darkred' if n in estados_finales else 'black'
+                  for n in nodos]
+        dibujo = nx.draw_networkx_nodes(G, pos, nodelist=nodos, node_color=valores,
+                                        cmap=plt.cm.YlOrRd, vmin=0, vmax=max(valores) or 1,
+                                        node_size=3000, node_shape='o', edgecolors=bordes, linewidths=3)
+        plt.colorbar(dibujo, label=etiqueta_calor, shrink=0.6)
+    else:
+        # Separar tipos de nodos
+        nodos_normales = [n for n in G.nodes() if n != estado_inicial and n not in estados_finales]
+        
+        # Dibujar nodos normales
+        nx.draw_networkx_nodes(G, pos, nodelist=nodos_normales, 
+                              node_color='lightblue', node_size=3000, 
+                              node_shape='o', edgecolors='black', linewidths=2)
+        
+        # Dibujar estado inicial
+        nx.draw_networkx_nodes(G, pos, nodelist=[estado_inicial], 
+                              node_color='lightgreen', node_size=3500, 
+                              node_shape='o', edgecolors='darkgreen', linewidths=3)
+        
+        # Dibujar estados finales
+        nx.draw_networkx_nodes(G, pos, nodelist=estados_finales, 
+                              node_color='lightcoral', node_size=3500, 
+                              node_shape='o', edgecolors='darkred', linewidths=3)
     
     # Doble círculo para estados finales
     for estado in estados_finales:
@@ -95,14 +110,22 @@ def crear_diagrama_estados(config, archivo_salida='docs/diagrama_estados.png'):
     plt.title(config['nombre'], fontsize=20, fontweight='bold', pad=20)
     
     # Crear leyenda
-    legend_elements = [
-        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='lightgreen', 
-                  markersize=15, label='Estado Inicial', markeredgecolor='darkgreen', markeredgewidth=2),
-        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='lightcoral', 
-                  markersize=15, label='Estado Final', markeredgecolor='darkred', markeredgewidth=2),
-        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='lightblue', 
-                  markersize=15, label='Estado Normal', markeredgecolor='black', markeredgewidth=2)
-    ]
+    if calor is not None:
+        legend_elements = [
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='white', 
+                      markersize=15, label='Estado Inicial', markeredgecolor='darkgreen', markeredgewidth=2),
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='white', 
+                      markersize=15, label='Estado Final', markeredgecolor='darkred', markeredgewidth=2),
+        ]
+    else:
+        legend_elements = [
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='lightgreen', 
+                      markersize=15, label='Estado Inicial', markeredgecolor='darkgreen', markeredgewidth=2),
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='lightcoral', 
+                      markersize=15, label='Estado Final', markeredgecolor='darkred', markeredgewidth=2),
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='lightblue', 
+                      markersize=15, label='Estado Normal', markeredgecolor='black', markeredgewidth=2)
+        ]
     plt.legend(handles=legend_elements, loc='upper left', fontsize=12)
     
     plt.axis('off')
@@ -112,6 +135,32 @@ def crear_diagrama_estados(config, archivo_salida='docs/diagrama_estados.png'):
     plt.close()
 
 
+def crear_diagrama_calor(definicion, perfilador, archivo_salida, metrica='pasos'):
+    """
+    Crea el diagrama de estados coloreado con el perfil de una ejecución.
+    
+    Args:
+        definicion (DefinicionMT): Máquina ejecutada (con la tabla que se
+            ejecutó, optimizada o no)
+        perfilador (Perfilador): Perfil de la ejecución
+        archivo_salida (str): Ruta donde guardar el diagrama
+        metrica (str): 'pasos' o 'tiempo' (ver Perfilador.calor_estados)
+    """
+    config = {
+        'nombre': definicion.nombre,
+        'estados': list(definicion.estados),
+        'estado_inicial': definicion.estado_inicial,
+        'estados_finales': sorted(definicion.estados_finales),
+        'transiciones': [
+            {'estado_actual': estado, 'simbolo_leido': leido, 'nuevo_estado': nuevo_estado,
+             'simbolo_escribir': escrito, 'direccion': direccion}
+            for (estado, leido), (nuevo_estado, escrito, direccion) in definicion.transiciones.items()
+        ],
+    }
+    etiqueta = 'Pasos' if metrica == 'pasos' else 'Tiempo (s)'
+    crear_diagrama_estados(config, archivo_salida, calor=perfilador.calor_estados(metrica), etiqueta_calor=etiqueta)
+
+
 def crear_tabla_transiciones(config, archivo_salida='docs/tabla_transiciones.png'):
     """
     Crea una tabla visual de las transiciones.
@@ -0,0 +1,303 @@
+"""
+Generador de las máquinas adicionales (binarias y de varias cintas).
+
+Las definiciones se construyen aquí y se guardan como JSON en config/, igual
+que la máquina unaria; el JSON es lo que cargan el simulador y los motores.
+Para regenerarlas:
+
+    python -m src.generar_maquinas
+"""
+import json
+import os
+
+
+BLANCO = '_'
+
+# Celda de tres pistas (n, x, y): un bit de cada número por celda. Los
+# símbolos '0' y '1' son las celdas con x = y = 0, así que la entrada en
+# binario ya es la pista n sin conversión.
+SIMBOLOS_PISTAS = '01abcdef'
+
+
+def _celda(n, x, y):
+    """Símbolo de la celda con los bits (n, x, y)."""
+    return SIMBOLOS_PISTAS[n + 2 * x + 4 * y]
+
+
+def _bits(simbolo):
+    """Bits (n, x, y) de una celda de tres pistas."""
+    indice = SIMBOLOS_PISTAS.index(simbolo)
+    return indice & 1, (indice >> 1) & 1, (indice >> 2) & 1
+
+
+def _transicion(estado, leido, nuevo_estado, escrito, direccion):
+    return {
+        'estado_actual': estado,
+        'simbolo_leido': leido,
+        'nuevo_estado': nuevo_estado,
+        'simbolo_escribir': escrito,
+        'direccion': direccion,
+    }
+
+
+def _definicion(nombre, descripcion, estados, simbolos, transiciones, **extra):
+    return {
+        'nombre': nombre,
+        'descripcion': descripcion,
+        **extra,
+        'estados': estados,
+        'estado_inicial': estados[0],
+        'estados_finales': ['q_halt'],
+        'simbolos_cinta': simbolos,
+        'transiciones': transiciones,
+    }
+
+
+def maquina_fibonacci_binario():
+    """
+    Máquina que calcula F(n) con n y el resultado en binario (bit más significativo primero).
+
+    Cada celda guarda un bit de tres números alineados por el bit menos
+    significativo, que queda a la derecha: el contador n y el par
+    (x, y) = (F(k-1), F(k)), que empieza en (1, 0). Cada pasada va de derecha
+    a izquierda restando 1 a n y haciendo (x, y) <- (y, x + y) a la vez; el
+    préstamo y el acarreo viajan en el estado q_paso_<préstamo><acarreo>. Si
+    el préstamo llega al extremo izquierdo, n ya era 0 y x = F(n); si sobra
+    acarreo, se agrega una celda. Una pasada cuesta O(bits de F(n)) pasos, así
+    que el total es O(n²) en lugar de crecer como F(n).
+
+    Returns:
+        dict: Configuración en el formato de config/maquina_fibonacci.json
+    """
+    pasos = [f'q_paso_{p}{a}' for p in (0, 1) for a in (0, 1)]
+    estados = ['q0', 'q_lsb'] + pasos + ['q_volver', 'q_salida_ceros', 'q_salida_bits', 'q_cero', 'q_halt']
+    transiciones = []
+
+    # Ir al bit menos significativo y poner x = 1 (F(-1)); entrada vacía = n 0
+    for simbolo in '01':
+        transiciones.append(_transicion('q0', simbolo, 'q0', simbolo, 'R'))
+    transiciones.append(_transicion('q0', BLANCO, 'q_lsb', BLANCO, 'L'))
+    for simbolo in '01' + BLANCO:
+        n = 1 if simbolo == '1' else 0
+        transiciones.append(_transicion('q_lsb', simbolo, 'q_paso_10', _celda(n, 1, 0), 'N'))
+
+    # Pasada: n - 1 y (x, y) <- (y, x + y), de derecha a izquierda
+    for prestamo in (0, 1):
+        for acarreo in (0, 1):
+            estado = f'q_paso_{prestamo}{acarreo}'
+            for simbolo in SIMBOLOS_PISTAS:
+                n, x, y = _bits(simbolo)
+                nuevo_prestamo = prestamo and not n
+                suma = x + y + acarreo
+                escrito = _celda(n ^ prestamo, y, suma & 1)
+                transiciones.append(_transicion(estado, simbolo, f'q_paso_{int(nuevo_prestamo)}{suma >> 1}',
+                                                escrito, 'L'))
+            if prestamo:
+                transiciones.append(_transicion(estado, BLANCO, 'q_salida_ceros', BLANCO, 'R'))
+            elif acarreo:
+                transiciones.append(_transicion(estado, BLANCO, 'q_volver', _celda(0, 0, 1), 'R'))
+            else:
+                transiciones.append(_transicion(estado, BLANCO, 'q_volver', BLANCO, 'R'))
+
+    for simbolo in SIMBOLOS_PISTAS:
+        transiciones.append(_transicion('q_volver', simbolo, 'q_volver', simbolo, 'R'))
+    transiciones.append(_transicion('q_volver', BLANCO, 'q_paso_10', BLANCO, 'L'))
+
+    # Salida: dejar solo la pista x, sin ceros a la izquierda
+    for simbolo in SIMBOLOS_PISTAS:
+        x = _bits(simbolo)[1]
+        if x:
+            transiciones.append(_transicion('q_salida_ceros', simbolo, 'q_salida_bits', '1', 'R'))
+        else:
+            transiciones.append(_transicion('q_salida_ceros', simbolo, 'q_salida_ceros', BLANCO, 'R'))
+        transiciones.append(_transicion('q_salida_bits', simbolo, 'q_salida_bits', str(x), 'R'))
+    transiciones.append(_transicion('q_salida_ceros', BLANCO, 'q_cero', BLANCO, 'L'))
+    transiciones.append(_transicion('q_salida_bits', BLANCO, 'q_halt', BLANCO, 'N'))
+    transiciones.append(_transicion('q_cero', BLANCO, 'q_halt', '0', 'N'))
+
+    return _definicion(
+        "Máquina de Turing - Fibonacci Binario",
+        "Calcula F(n) con la entrada y la salida en binario (bit más significativo primero)",
+        estados, [BLANCO] + list(SIMBOLOS_PISTAS), transiciones,
+    )
+
+
+def maquina_unario_a_binario():
+    """
+    Máquina que convierte un número de unario a binario.
+
+    Borra los 1 de la entrada desde la derecha y por cada uno incrementa un
+    contador binario a la izquierda de la entrada, escrito con 'o' (0) e
+    'i' (1) para no confundirlo con los 1 unarios; al final lo pasa a '0'/'1'.
+
+    Returns:
+        dict: Configuración de la máquina
+    """
+    estados = ['q_buscar_fin', 'q_borrar', 'q_incrementar', 'q_convertir', 'q_halt']
+    transiciones = []
+    for simbolo in '1oi':
+        transiciones.append(_transicion('q_buscar_fin', simbolo, 'q_buscar_fin', simbolo, 'R'))
+    transiciones.append(_transicion('q_buscar_fin', BLANCO, 'q_borrar', BLANCO, 'L'))
+
+    transiciones.append(_transicion('q_borrar', '1', 'q_incrementar', BLANCO, 'L'))
+    transiciones.append(_transicion('q_borrar', 'o', 'q_convertir', '0', 'L'))
+    transiciones.append(_transicion('q_borrar', 'i', 'q_convertir', '1', 'L'))
+    transiciones.append(_transicion('q_borrar', BLANCO, 'q_halt', '0', 'N'))
+
+    transiciones.append(_transicion('q_incrementar', '1', 'q_incrementar', '1', 'L'))
+    transiciones.append(_transicion('q_incrementar', 'o', 'q_buscar_fin', 'i', 'R'))
+    transiciones.append(_transicion('q_incrementar', 'i', 'q_incrementar', 'o', 'L'))
+    transiciones.append(_transicion('q_incrementar', BLANCO, 'q_buscar_fin', 'i', 'R'))
+
+    transiciones.append(_transicion('q_convertir', 'o', 'q_convertir', '0', 'L'))
+    transiciones.append(_transicion('q_convertir', 'i', 'q_convertir', '1', 'L'))
+    transiciones.append(_transicion('q_convertir', BLANCO, 'q_halt', BLANCO, 'R'))
+
+    return _definicion(
+        "Conversor de unario a binario",
+        "Convierte n en unario a n en binario (bit más significativo primero)",
+        estados, [BLANCO, '1', 'o', 'i', '0'], transiciones,
+    )
+
+
+def maquina_binario_a_unario():
+    """
+    Máquina que convierte un número de binario a unario.
+
+    Marca los dígitos como 'o'/'i' y luego repite: restar 1 al número binario
+    y agregar un 1 al final de la salida unaria a su derecha. Cuando la resta
+    pide prestado más allá del primer dígito, el número era 0 y se borra.
+
+    Returns:
+        dict: Configuración de la máquina
+    """
+    estados = ['q_marcar', 'q_restar', 'q_agregar', 'q_limpiar', 'q_halt']
+    transiciones = [
+        _transicion('q_marcar', '0', 'q_marcar', 'o', 'R'),
+        _transicion('q_marcar', '1', 'q_marcar', 'i', 'R'),
+        _transicion('q_marcar', BLANCO, 'q_restar', BLANCO, 'L'),
+
+        _transicion('q_restar', '1', 'q_restar', '1', 'L'),
+        _transicion('q_restar', 'i', 'q_agregar', 'o', 'R'),
+        _transicion('q_restar', 'o', 'q_restar', 'i', 'L'),
+        _transicion('q_restar', BLANCO, 'q_limpiar', BLANCO, 'R'),
+    ]
+    for simbolo in 'oi1':
+        transiciones.append(_transicion('q_agregar', simbolo, 'q_agregar', simbolo, 'R'))
+    transiciones.append(_transicion('q_agregar', BLANCO, 'q_restar', '1', 'L'))
+
+    for simbolo in 'oi':
+        transiciones.append(_transicion('q_limpiar', simbolo, 'q_limpiar', BLANCO, 'R'))
+    transiciones.append(_transicion('q_limpiar', '1', 'q_halt', '1', 'N'))
+    transiciones.append(_transicion('q_limpiar', BLANCO, 'q_halt', BLANCO, 'N'))
+
+    return _definicion(
+        "Conversor de binario a unario",
+        "Convierte n en binario (bit más significativo primero) a n en unario",
+        estados, [BLANCO, '0', '1', 'o', 'i'], transiciones,
+    )
+
+
+def maquina_fibonacci_multicinta():
+    """
+    Máquina de tres cintas que calcula F(n) en unario.
+
+    La cinta 0 tiene la entrada n; las cintas 1 y 2 guardan dos Fibonacci
+    consecutivos X = F(k) e Y = F(k+1) (empiezan en 0 y 1). Por cada 1 de la
+    entrada se suma una cinta a la otra, alternando: X += Y, luego Y += X,
+    etc. Sumar es copiar 1 a 1 con los dos cabezales avanzando juntos, y
+    luego la cinta que creció rebobina al principio, así que cada suma cuesta
+    O(F(k)) pasos y el total es O(F(n)), contra O(F(n)²) o más en una cinta.
+    Al agotar la entrada, el destino de la siguiente suma (la menor de las
+    dos cintas) es F(n) y se copia a la cinta 0, que es la de salida.
+
+    Returns:
+        dict: Configuración de la máquina (num_cintas = 3)
+    """
+    estados = ['q0', 'q_x', 'q_suma_x', 'q_rebobinar_x', 'q_y', 'q_suma_y', 'q_rebobinar_y',
+               'q_copiar_x', 'q_copiar_y', 'q_halt']
+    transiciones = []
+
+    def agregar(estado, leido, nuevo_estado, escrito, direccion):
+        transiciones.append(_transicion(estado, list(leido), nuevo_estado, list(escrito), list(direccion)))
+
+    # Y = 1; la entrada puede estar vacía
+    for entrada in '1' + BLANCO:
+        agregar('q0', (entrada, BLANCO, BLANCO), 'q_x', (entrada, BLANCO, '1'), 'NNN')
+
+    # Fases simétricas: la fase 'x' suma Y a X (cintas 2 -> 1) y la 'y' suma X a Y (1 -> 2).
+    # En q_<fase> el destino está al final (en blanco) y el origen al principio.
+    for fase, destino, origen, siguiente in (('x', 1, 2, 'y'), ('y', 2, 1, 'x')):
+        def celdas(en_entrada, en_destino, en_origen, destino=destino, origen=origen):
+            celda = [en_entrada, None, None]
+            celda[destino], celda[origen] = en_destino, en_origen
+            return tuple(celda)
+
+        def mover(en_entrada, en_destino, en_origen, destino=destino, origen=origen):
+            movimiento = [en_entrada, 'N', 'N']
+            movimiento[destino], movimiento[origen] = en_destino, en_origen
+            return ''.join(movimiento)
+
+        # Consumir un 1 de la entrada; si se agotó, el destino es el menor: F(n)
+        agregar(f'q_{fase}', celdas('1', BLANCO, '1'), f'q_suma_{fase}', celdas(BLANCO, BLANCO, '1'),
+                mover('R', 'N', 'N'))
+        agregar(f'q_{fase}', celdas(BLANCO, BLANCO, '1'), f'q_copiar_{fase}', celdas(BLANCO, BLANCO, '1'),
+                mover('N', 'L', 'N'))
+
+        for entrada in '1' + BLANCO:
+            # Sumar: copiar cada 1 del origen al final del destino
+            agregar(f'q_suma_{fase}', celdas(entrada, BLANCO, '1'), f'q_suma_{fase}', celdas(entrada, '1', '1'),
+                    mover('N', 'R', 'R'))
+            # El destino, que ahora es el mayor, vuelve a su principio para ser el siguiente origen
+            agregar(f'q_suma_{fase}', celdas(entrada, BLANCO, BLANCO), f'q_rebobinar_{fase}',
+                    celdas(entrada, BLANCO, BLANCO), mover('N', 'L', 'N'))
+            agregar(f'q_rebobinar_{fase}', celdas(entrada, '1', BLANCO), f'q_rebobinar_{fase}',
+                    celdas(entrada, '1', BLANCO), mover('N', 'L', 'N'))
+            agregar(f'q_rebobinar_{fase}', celdas(entrada, BLANCO, BLANCO), f'q_{siguiente}',
+                    celdas(entrada, BLANCO, BLANCO), mover('N', 'R', 'N'))
+
+        # Copiar el destino a la cinta 0, recorriéndolo desde su final hacia la izquierda
+        agregar(f'q_copiar_{fase}', celdas(BLANCO, '1', '1'), f'q_copiar_{fase}', celdas('1', '1', '1'),
+                mover('R', 'L', 'N'))
+        agregar(f'q_copiar_{fase}', celdas(BLANCO, BLANCO, '1'), 'q_halt', celdas(BLANCO, BLANCO, '1'),
+                mover('N', 'N', 'N'))
+
+    return _definicion(
+        "Máquina de Turing - Fibonacci Multicinta",
+        "Calcula F(n) en unario con tres cintas: entrada/salida, F(k) y F(k+1)",
+        estados, ['1', BLANCO], transiciones, num_cintas=3, cinta_salida=0,
+    )
+
+
+# Archivo de config/ de cada máquina generada
+MAQUINAS = {
+    'maquina_fibonacci_binario.json': maquina_fibonacci_binario,
+    'maquina_fibonacci_multicinta.json': maquina_fibonacci_multicinta,
+    'unario_a_binario.json': maquina_unario_a_binario,
+    'binario_a_unario.json': maquina_binario_a_unario,
+}
+
+
+def guardar_maquinas(directorio='config'):
+    """
+    Escribe las máquinas binarias como JSON.
+
+    Args:
+        directorio (str): Carpeta de destino
+
+    Returns:
+        list: Rutas escritas
+    """
+    rutas = []
+    for archivo, construir in MAQUINAS.items():
+        ruta = os.path.join(directorio, archivo)
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump(construir(), f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        rutas.append(ruta)
+    return rutas
+
+
+if __name__ == "__main__":
+    for ruta in guardar_maquinas():
+        print(f"✅ Máquina guardada en: {ruta}")
@@ -0,0 +1,67 @@
+from collections import deque
+
+
+class RegistroHistorial:
+    """
+    Decide qué configuraciones de la máquina se guardan en el historial.
+
+    Modos disponibles:
+        - 'completo': guarda todas las configuraciones
+        - 'anillo': guarda solo las últimas ``tamano`` configuraciones
+        - 'muestreo': guarda una configuración cada ``cada`` pasos (y la final)
+        - 'ninguno': no guarda nada
+        - 'delta': no guarda diccionarios; la máquina registra una TrazaDelta
+    """
+
+    MODOS = ('completo', 'anillo', 'muestreo', 'ninguno', 'delta')
+
+    def __init__(self, modo='completo', tamano=100, cada=10):
+        """
+        Inicializa el registro.
+
+        Args:
+            modo (str): Uno de RegistroHistorial.MODOS
+            tamano (int): Capacidad del buffer circular (modo 'anillo')
+            cada (int): Intervalo de muestreo en pasos (modo 'muestreo')
+        """
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo de historial desconocido: {modo!r} (use uno de {', '.join(self.MODOS)})")
+        if modo == 'anillo' and tamano < 1:
+            raise ValueError("El tamaño del anillo debe ser al menos 1")
+        if modo == 'muestreo' and cada < 1:
+            raise ValueError("El intervalo de muestreo debe ser al menos 1")
+
+        self.modo = modo
+        self.tamano = tamano
+        self.cada = cada
+        self.configuraciones = deque(maxlen=tamano) if modo == 'anillo' else []
+        self.ultimo_paso = None
+
+    def debe_registrar(self, paso, final=False):
+        """
+        Indica si la configuración del paso dado debe guardarse.
+
+        Args:
+            paso (int): Número de paso de la configuración
+            final (bool): True si es la configuración en la que se detuvo la máquina
+        """
+        if self.modo in ('ninguno', 'delta') or paso == self.ultimo_paso:
+            return False
+        if self.modo == 'muestreo':
+            return final or paso % self.cada == 0
+        return True
+
+    def agregar(self, configuracion):
+        """Agrega una configuración al historial."""
+        self.configuraciones.append(configuracion)
+        self.ultimo_paso = configuracion['paso']
+
+    def como_lista(self):
+        """Retorna las configuraciones guardadas como lista."""
+        return list(self.configuraciones)
+
+    def __len__(self):
+        return len(self.configuraciones)
+
+    def __iter__(self):
+        return iter(self.configuraciones)
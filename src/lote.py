@@ -0,0 +1,114 @@
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from src.definicion import cargar_definicion
+from src.maquina_turing import MaquinaTuring
+
+
+# Resultado de una entrada del lote; indice es su posición en la secuencia de entradas
+ResultadoLote = namedtuple('ResultadoLote', ['indice', 'entrada', 'salida', 'pasos', 'motivo', 'tiempo'])
+
+# Máquina de cada proceso trabajador, cargada una sola vez por el inicializador
+_maquina = None
+
+
+def _inicializar_trabajador(archivo_config, optimizar=False, preservar_pasos=True):
+    """Carga la configuración de la máquina una vez por proceso trabajador."""
+    global _maquina
+    _maquina = MaquinaTuring(archivo_config, mostrar_avisos=False, optimizar=optimizar,
+                             preservar_pasos=preservar_pasos)
+
+
+def _simular_bloque(bloque, max_pasos, compilado, macro_pasos):
+    """
+    Simula un bloque de entradas con la máquina del proceso actual.
+
+    Args:
+        bloque (list): Pares (indice, entrada)
+
+    Returns:
+        list: Un ResultadoLote por entrada
+    """
+    resultados = []
+    for indice, entrada in bloque:
+        _maquina.inicializar(entrada, historial='ninguno')
+        tiempo_inicio = time.perf_counter()
+        _maquina.ejecutar(max_pasos=max_pasos, compilado=compilado, macro_pasos=macro_pasos)
+        tiempo = time.perf_counter() - tiempo_inicio
+        resultados.append(ResultadoLote(
+            indice, entrada, _maquina.obtener_resultado(), _maquina.pasos, _maquina.motivo_parada, tiempo
+        ))
+    return resultados
+
+
+def _bloques(entradas, tamano_bloque):
+    """Agrupa las entradas numeradas en listas de tamano_bloque elementos."""
+    numeradas = enumerate(entradas)
+    while True:
+        bloque = list(islice(numeradas, tamano_bloque))
+        if not bloque:
+            return
+        yield bloque
+
+
+def ejecutar_lote(archivo_config, entradas, workers=None, max_pasos=100000, compilado=True,
+                  macro_pasos=False, tamano_bloque=1, en_vuelo=None, optimizar=False, preservar_pasos=True):
+    """
+    Ejecuta muchas entradas de una misma máquina repartidas en varios procesos.
+
+    Las entradas se consumen de forma perezosa y se mantienen como máximo
+    ``en_vuelo`` bloques pendientes, así que la memoria no depende del
+    tamaño del lote. Los resultados se entregan a medida que terminan, no en
+    el orden de entrada (el campo ``indice`` permite reordenarlos).
+
+    Args:
+        archivo_config (str): Ruta al archivo JSON de la máquina
+        entradas (iterable): Cadenas de entrada para la cinta
+        workers (int): Número de procesos; None usa os.cpu_count() y 1
+            ejecuta todo en el proceso actual
+        max_pasos (int): Límite de pasos por entrada
+        compilado (bool): Si True, usa el motor compilado
+        macro_pasos (bool): Si True, el motor compilado usa macro pasos
+        tamano_bloque (int): Entradas que procesa cada tarea enviada al pool
+        en_vuelo (int): Máximo de bloques pendientes (por defecto 4 por proceso)
+        optimizar (bool): Si True, cada proceso optimiza la tabla al cargarla
+        preservar_pasos (bool): Con optimizar, si False también compone cadenas
+
+    Yields:
+        ResultadoLote: Resultado de cada entrada en cuanto termina
+    """
+    workers = workers or os.cpu_count() or 1
+    if tamano_bloque < 1:
+        raise ValueError("El tamaño de bloque debe ser al menos 1")
+
+    if workers == 1:
+        _inicializar_trabajador(archivo_config, optimizar, preservar_pasos)
+        for bloque in _bloques(entradas, tamano_bloque):
+            yield from _simular_bloque(bloque, max_pasos, compilado, macro_pasos)
+        return
+
+    # Cargar antes en este proceso: una configuración inválida se informa una sola vez
+    # y los trabajadores ya encuentran la definición en caché o su archivo binario
+    cargar_definicion(archivo_config, optimizar, preservar_pasos)
+    en_vuelo = en_vuelo or 4 * workers
+    bloques = _bloques(entradas, tamano_bloque)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_trabajador,
+                             initargs=(archivo_config, optimizar, preservar_pasos)) as pool:
+        pendientes = set()
+        try:
+            for bloque in islice(bloques, en_vuelo):
+                pendientes.add(pool.submit(_simular_bloque, bloque, max_pasos, compilado, macro_pasos))
+
+            while pendientes:
+                terminados, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in terminados:
+                    yield from futuro.result()
+                for bloque in islice(bloques, len(terminados)):
+                    pendientes.add(pool.submit(_simular_bloque, bloque, max_pasos, compilado, macro_pasos))
+        finally:
+            # Si el consumidor deja de leer, no esperar a los bloques que faltan
+            for futuro in pendientes:
+                futuro.cancel()
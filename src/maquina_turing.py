@@ -1,133 +1,160 @@
-import json
-from src.cinta import Cinta
+from src.definicion import cargar_definicion
+from src.ejecucion import Ejecucion, crear_ejecucion
+
+
+def _delegar(nombre):
+    """Crea una propiedad que lee y escribe el atributo de la ejecución actual."""
+    return property(
+        lambda self: getattr(self.ejecucion, nombre),
+        lambda self, valor: setattr(self.ejecucion, nombre, valor),
+        doc=f"Atributo '{nombre}' de la ejecución actual."
+    )
 
 
 class MaquinaTuring:
     """
     Implementación de una Máquina de Turing determinista.
+    
+    Combina una DefinicionMT (el programa, compartido y de solo lectura) con
+    una Ejecucion (la cinta y el estado de la corrida actual). Para muchas
+    corridas concurrentes conviene crear varias Ejecucion de la misma definición.
     """
     
-    def __init__(self, archivo_config):
+    cinta = _delegar('cinta')
+    estado_actual = _delegar('estado_actual')
+    pasos = _delegar('pasos')
+    motivo_parada = _delegar('motivo_parada')
+    mostrar_avisos = _delegar('mostrar_avisos')
+    registro_historial = _delegar('registro_historial')
+    historial = _delegar('historial')
+    traza = _delegar('traza')
+    detector = _delegar('detector')
+    perfilador = _delegar('perfilador')
+    # Propiedad para no decodificar las transiciones de un archivo binario antes de usarlas
+    transiciones = property(lambda self: self.definicion.transiciones,
+                            doc="Transiciones (estado, símbolo) -> (nuevo_estado, símbolo, dirección).")
+    
+    def __init__(self, archivo_config, mostrar_avisos=True, optimizar=False, preservar_pasos=True):
         """
         Inicializa la máquina de Turing desde un archivo de configuración.
         
         Args:
             archivo_config (str): Ruta al archivo JSON de configuración
+            mostrar_avisos (bool): Si False, no imprime los avisos de parada
+                (útil en ejecuciones por lotes)
+            optimizar (bool): Si True, optimiza la tabla al cargarla
+            preservar_pasos (bool): Con optimizar, si False también compone
+                cadenas de transiciones (ver optimizar_configuracion)
         """
-        self.cargar_configuracion(archivo_config)
-        self.cinta = None
-        self.estado_actual = None
-        self.pasos = 0
-        self.historial = []
-    
-    def cargar_configuracion(self, archivo_config):
-        """Carga la configuración de la máquina desde un archivo JSON."""
-        with open(archivo_config, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
-        self.nombre = config.get('nombre', 'Máquina de Turing')
-        self.estados = config['estados']
-        self.estado_inicial = config['estado_inicial']
-        self.estados_finales = config['estados_finales']
-        self.simbolos_cinta = config['simbolos_cinta']
-        
-        # Convertir transiciones a diccionario
-        self.transiciones = {}
-        for t in config['transiciones']:
-            clave = (t['estado_actual'], t['simbolo_leido'])
-            valor = (t['nuevo_estado'], t['simbolo_escribir'], t['direccion'])
-            self.transiciones[clave] = valor
-    
-    def inicializar(self, entrada):
+        self.cargar_configuracion(archivo_config, optimizar, preservar_pasos)
+        self.ejecucion = crear_ejecucion(self.definicion, mostrar_avisos=mostrar_avisos)
+    
+    def cargar_configuracion(self, archivo_config, optimizar=False, preservar_pasos=True):
         """
-        Inicializa la máquina con una cadena de entrada.
+        Carga la configuración de la máquina desde un archivo JSON.
         
-        Args:
-            entrada (str): Cadena de entrada para la cinta
+        La definición se toma de la caché del proceso (ver cargar_definicion),
+        así que crear varias máquinas del mismo archivo no lo vuelve a leer.
+        Si ya había una ejecución, se reemplaza por una nueva sin inicializar.
         """
-        self.cinta = Cinta(entrada, simbolo_blanco='_')
-        self.estado_actual = self.estado_inicial
-        self.pasos = 0
-        self.historial = []
-        
-        # Guardar configuración inicial
-        self.guardar_configuracion()
+        self.definicion = cargar_definicion(archivo_config, optimizar, preservar_pasos)
+        self.nombre = self.definicion.nombre
+        self.estados = self.definicion.estados
+        self.estado_inicial = self.definicion.estado_inicial
+        self.estados_finales = self.definicion.estados_finales
+        self.simbolos_cinta = self.definicion.simbolos_cinta
+        self.num_cintas = self.definicion.num_cintas
+        self.tabla_compilada = self.definicion.tabla
+        if 'ejecucion' in self.__dict__:
+            self.ejecucion = crear_ejecucion(self.definicion, mostrar_avisos=self.mostrar_avisos)
     
-    def paso(self):
+    def compilar(self):
         """
-        Ejecuta un paso de la máquina de Turing.
+        Retorna la tabla de transiciones compilada a enteros.
         
         Returns:
-            bool: True si la máquina continúa, False si se detiene
+            TablaCompilada: Tabla usada por el motor compilado (None en
+            máquinas de varias cintas)
         """
-        if self.estado_actual in self.estados_finales:
-            return False
-        
-        simbolo_actual = self.cinta.leer()
-        clave = (self.estado_actual, simbolo_actual)
-        
-        if clave not in self.transiciones:
-            print(f"⚠️  No hay transición definida para ({self.estado_actual}, '{simbolo_actual}')")
-            return False
-        
-        nuevo_estado, simbolo_escribir, direccion = self.transiciones[clave]
-        
-        # Ejecutar transición
-        self.cinta.escribir(simbolo_escribir)
-        self.cinta.mover_cabezal(direccion)
-        self.estado_actual = nuevo_estado
-        self.pasos += 1
-        
-        # Guardar configuración
-        self.guardar_configuracion()
-        
-        return True
+        return self.tabla_compilada
     
-    def ejecutar(self, max_pasos=1000, mostrar_pasos=False):
+    def nueva_ejecucion(self, entrada=None, **opciones):
         """
-        Ejecuta la máquina hasta que se detenga o alcance el máximo de pasos.
+        Crea una ejecución independiente que comparte la definición de la máquina.
         
         Args:
-            max_pasos (int): Número máximo de pasos a ejecutar
-            mostrar_pasos (bool): Si True, muestra cada paso en la consola
+            entrada (str): Si se indica, inicializa la cinta con ella
+            **opciones: Argumentos adicionales para Ejecucion.inicializar()
         
         Returns:
-            bool: True si terminó exitosamente, False si excedió el límite
+            Ejecucion: Ejecución nueva (no reemplaza a la actual)
         """
-        while self.pasos < max_pasos:
-            if mostrar_pasos:
-                self.mostrar_configuracion()
-            
-            if not self.paso():
-                if mostrar_pasos:
-                    self.mostrar_configuracion()
-                return True
+        return crear_ejecucion(self.definicion, entrada, mostrar_avisos=self.mostrar_avisos, **opciones)
+    
+    def inicializar(self, entrada, historial='completo', tamano_historial=100, muestreo_historial=10,
+                    intervalo_checkpoint=1000, tipo_cinta='lista'):
+        """Inicializa la máquina con una cadena de entrada (ver Ejecucion.inicializar)."""
+        self.ejecucion.inicializar(entrada, historial, tamano_historial, muestreo_historial,
+                                   intervalo_checkpoint, tipo_cinta)
+    
+    def configurar_historial(self, modo='completo', tamano=100, cada=10, intervalo_checkpoint=1000):
+        """Reinicia el historial con el modo indicado (ver Ejecucion.configurar_historial)."""
+        self.ejecucion.configurar_historial(modo, tamano, cada, intervalo_checkpoint)
+    
+    def paso(self):
+        """Ejecuta un paso de la máquina (ver Ejecucion.paso)."""
+        return self.ejecucion.paso()
+    
+    def iterar(self, max_pasos=1000):
+        """Ejecuta la máquina entregando un EventoPaso por paso (ver Ejecucion.iterar)."""
+        return self.ejecucion.iterar(max_pasos)
+    
+    def iterar_bloques(self, tamano_bloque=1000, max_pasos=1000):
+        """Igual que iterar(), pero en listas de tamano_bloque eventos (ver Ejecucion.iterar_bloques)."""
+        return self.ejecucion.iterar_bloques(tamano_bloque, max_pasos)
+    
+    def ejecutar(self, max_pasos=1000, mostrar_pasos=False, compilado=False, historial=None, macro_pasos=False,
+                 checkpoint_cada=None, ruta_checkpoint=None, detectar_ciclos=False, perfilador=None):
+        """Ejecuta la máquina hasta que se detenga o alcance el máximo de pasos (ver Ejecucion.ejecutar)."""
+        return self.ejecucion.ejecutar(max_pasos, mostrar_pasos, compilado, historial, macro_pasos,
+                                       checkpoint_cada, ruta_checkpoint, detectar_ciclos, perfilador)
+    
+    def ejecutar_compilado(self, max_pasos=1000, macro_pasos=False):
+        """Ejecuta la máquina con el motor compilado (ver Ejecucion.ejecutar_compilado)."""
+        return self.ejecucion.ejecutar_compilado(max_pasos, macro_pasos)
+    
+    def guardar_checkpoint(self, ruta):
+        """Guarda el estado de la ejecución actual en disco (ver Ejecucion.guardar_checkpoint)."""
+        self.ejecucion.guardar_checkpoint(ruta)
+    
+    def reanudar(self, ruta, historial='ninguno', **opciones):
+        """
+        Reemplaza la ejecución actual por la guardada en un checkpoint.
         
-        print(f"⚠️  Se alcanzó el límite de {max_pasos} pasos")
-        return False
-    
-    def guardar_configuracion(self):
-        """Guarda la configuración actual en el historial."""
-        config = {
-            'paso': self.pasos,
-            'estado': self.estado_actual,
-            'posicion': self.cinta.posicion_cabezal,
-            'cinta': self.cinta.obtener_contenido(),
-            'simbolo_actual': self.cinta.leer()
-        }
-        self.historial.append(config)
+        Args:
+            ruta (str): Archivo del checkpoint (debe ser de esta misma máquina)
+            historial (str): Modo del historial de la ejecución reanudada
+            **opciones: Argumentos adicionales para configurar_historial()
+        """
+        self.ejecucion = Ejecucion.desde_checkpoint(ruta, self.definicion, self.mostrar_avisos,
+                                                    historial, **opciones)
+    
+    def avisar(self, mensaje):
+        """Imprime un aviso de la ejecución, salvo que estén desactivados."""
+        self.ejecucion.avisar(mensaje)
+    
+    def guardar_configuracion(self, final=False):
+        """Guarda la configuración actual en el historial, si el modo lo pide."""
+        self.ejecucion.guardar_configuracion(final)
     
     def mostrar_configuracion(self):
         """Muestra la configuración actual de la máquina."""
-        print(f"\n--- Paso {self.pasos} ---")
-        print(f"Estado: {self.estado_actual}")
-        print(str(self.cinta))
-        print(f"Símbolo leído: '{self.cinta.leer()}'")
+        self.ejecucion.mostrar_configuracion()
     
     def obtener_resultado(self):
         """Retorna el contenido final de la cinta."""
-        return self.cinta.obtener_contenido()
+        return self.ejecucion.obtener_resultado()
     
     def obtener_historial(self):
-        """Retorna el historial completo de configuraciones."""
-        return self.historial
\ No newline at end of file
+        """Retorna las configuraciones guardadas según el modo del historial."""
+        return self.ejecucion.obtener_historial()
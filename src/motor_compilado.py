@@ -0,0 +1,315 @@
+import re
+from array import array
+
+
+# Desplazamiento del cabezal para cada dirección de la configuración
+DESPLAZAMIENTOS = {'L': -1, 'R': 1, 'N': 0}
+
+
+class TablaCompilada:
+    """
+    Tabla de transiciones de una Máquina de Turing compilada a enteros.
+
+    Los estados y los símbolos se numeran una sola vez al cargar la máquina y
+    las transiciones se guardan en arreglos planos indexados por
+    ``estado * num_simbolos + simbolo``. Las celdas sin transición (y todas
+    las de los estados finales) guardan -1 como siguiente estado.
+    """
+
+    def __init__(self, estados, simbolos, transiciones, estados_finales, simbolo_blanco='_'):
+        """
+        Compila la tabla de transiciones.
+
+        Args:
+            estados (list): Nombres de los estados
+            simbolos (list): Alfabeto de la cinta
+            transiciones (dict): (estado, símbolo) -> (nuevo_estado, símbolo, dirección)
+            estados_finales (list): Estados de aceptación
+            simbolo_blanco (str): Símbolo que representa una celda vacía
+        """
+        self.estados = list(estados)
+        self.simbolos = list(simbolos)
+        self.id_estado = {e: i for i, e in enumerate(self.estados)}
+        self.id_simbolo = {s: i for i, s in enumerate(self.simbolos)}
+
+        # Incluir estados y símbolos que solo aparecen en las transiciones
+        for (estado, simbolo), (nuevo_estado, simbolo_escribir, _) in transiciones.items():
+            for e in (estado, nuevo_estado):
+                if e not in self.id_estado:
+                    self.id_estado[e] = len(self.estados)
+                    self.estados.append(e)
+            for s in (simbolo, simbolo_escribir):
+                if s not in self.id_simbolo:
+                    self.id_simbolo[s] = len(self.simbolos)
+                    self.simbolos.append(s)
+        if simbolo_blanco not in self.id_simbolo:
+            self.id_simbolo[simbolo_blanco] = len(self.simbolos)
+            self.simbolos.append(simbolo_blanco)
+
+        self.blanco = self.id_simbolo[simbolo_blanco]
+        self.num_simbolos = len(self.simbolos)
+
+        self.final = bytearray(len(self.estados))
+        for e in estados_finales:
+            if e in self.id_estado:
+                self.final[self.id_estado[e]] = 1
+
+        tamano = len(self.estados) * self.num_simbolos
+        self.siguiente = array('i', [-1]) * tamano
+        self.escribir = array('B', [0]) * tamano
+        self.mover = array('b', [0]) * tamano
+
+        for (estado, simbolo), (nuevo_estado, simbolo_escribir, direccion) in transiciones.items():
+            q = self.id_estado[estado]
+            if self.final[q]:
+                continue  # Los estados finales no ejecutan transiciones
+            i = q * self.num_simbolos + self.id_simbolo[simbolo]
+            self.siguiente[i] = self.id_estado[nuevo_estado]
+            self.escribir[i] = self.id_simbolo[simbolo_escribir]
+            self.mover[i] = DESPLAZAMIENTOS.get(direccion, 0)
+
+        # Los barridos solo los usa el motor de macro pasos: se detectan al primer uso
+        self.barridos = None
+        self.tiene_bucles = None
+
+    @classmethod
+    def desde_arreglos(cls, estados, simbolos, blanco, final, siguiente, escribir, mover):
+        """
+        Reconstruye una tabla ya compilada a partir de sus arreglos.
+
+        Los arreglos no se copian: pueden ser vistas (memoryview) de un
+        archivo mapeado en memoria, como las de src.tabla_binaria.
+
+        Args:
+            estados (list): Nombres de los estados, en orden de identificador
+            simbolos (list): Símbolos, en orden de identificador
+            blanco (int): Identificador del símbolo blanco
+            final, siguiente, escribir, mover: Arreglos de la tabla, con los
+                mismos tipos que los atributos del mismo nombre
+
+        Returns:
+            TablaCompilada: Tabla lista para los motores
+        """
+        tabla = cls.__new__(cls)
+        tabla.estados = list(estados)
+        tabla.simbolos = list(simbolos)
+        tabla.id_estado = {e: i for i, e in enumerate(tabla.estados)}
+        tabla.id_simbolo = {s: i for i, s in enumerate(tabla.simbolos)}
+        tabla.blanco = blanco
+        tabla.num_simbolos = len(tabla.simbolos)
+        tabla.final = final
+        tabla.siguiente = siguiente
+        tabla.escribir = escribir
+        tabla.mover = mover
+        tabla.barridos = None
+        tabla.tiene_bucles = None
+        return tabla
+
+    def detectar_bucles(self):
+        """
+        Detecta los barridos: transiciones (q, s) -> (q, w, d) que no cambian de estado.
+
+        Mientras la máquina esté en q y lea símbolos con bucle en la misma
+        dirección d, recorre la cinta sin cambiar de estado, así que el motor
+        puede ejecutar la racha completa en un macro paso. Para cada (q, d) se
+        precompilan patrones que localizan el fin de la racha con un recorrido
+        en C sobre la cinta, y una tabla de traducción para las reescrituras.
+
+        barridos[i] es None si la transición i no es un bucle; en otro caso es
+        (miembros, patron_directo, patron_inverso, traduccion), con miembros
+        None para los bucles sin movimiento ni cambio, que no terminan nunca.
+        """
+        self.barridos = [None] * len(self.siguiente)
+        grupos = {}
+        for i, nuevo_estado in enumerate(self.siguiente):
+            estado, simbolo = divmod(i, self.num_simbolos)
+            if nuevo_estado != estado:
+                continue
+            if self.mover[i] == 0:
+                if self.escribir[i] == simbolo:
+                    self.barridos[i] = (None, None, None, None)
+                continue
+            grupos.setdefault((estado, self.mover[i]), []).append(i)
+
+        for indices in grupos.values():
+            simbolos = bytes(i % self.num_simbolos for i in indices)
+            clase = b'[' + b''.join(re.escape(bytes([c])) for c in simbolos) + b']'
+            distinto = b'[^' + clase[1:]
+            traduccion = None
+            if any(self.escribir[i] != i % self.num_simbolos for i in indices):
+                traduccion = bytearray(range(256))
+                for i in indices:
+                    traduccion[i % self.num_simbolos] = self.escribir[i]
+                traduccion = bytes(traduccion)
+            barrido = (simbolos, re.compile(distinto), re.compile(distinto + clase + b'*\\Z'), traduccion)
+            for i in indices:
+                self.barridos[i] = barrido
+        self.tiene_bucles = any(b is not None for b in self.barridos)
+
+    def codificar(self, simbolos):
+        """
+        Convierte una secuencia de símbolos a un bytearray de identificadores.
+
+        Returns:
+            bytearray: Identificadores, o None si aparece un símbolo desconocido
+        """
+        try:
+            return bytearray(map(self.id_simbolo.__getitem__, simbolos))
+        except KeyError:
+            return None
+
+    def decodificar(self, datos):
+        """Convierte identificadores de símbolos de vuelta a una lista de símbolos."""
+        return list(map(self.simbolos.__getitem__, datos))
+
+
+def ejecutar_compilado(tabla, cinta, posicion, estado, pasos, max_pasos, macro_pasos=False, crecer=True):
+    """
+    Ejecuta la máquina sobre una cinta de identificadores enteros.
+
+    El ciclo interno solo usa variables locales y arreglos planos; la cinta
+    crece de forma geométrica cuando el cabezal sale por cualquiera de los
+    extremos.
+
+    Args:
+        tabla (TablaCompilada): Tabla de transiciones compilada
+        cinta (bytearray): Cinta codificada (se modifica en sitio)
+        posicion (int): Índice del cabezal en la cinta
+        estado (int): Identificador del estado actual
+        pasos (int): Pasos ejecutados hasta ahora
+        max_pasos (int): Número máximo de pasos
+        macro_pasos (bool): Si True, ejecuta las rachas de transiciones que
+            no cambian de estado como un solo macro paso (ver
+            TablaCompilada.detectar_bucles). El número de pasos contado es
+            el mismo.
+        crecer (bool): Si False, la cinta es una ventana de una cinta más
+            grande: en vez de crecer, se retorna con motivo 'borde' cuando
+            el cabezal sale de ella (posicion queda en -1 o len(cinta))
+
+    Returns:
+        tuple: (cinta, posicion, estado, pasos, desplazamiento, motivo) donde
+        desplazamiento es el número de celdas añadidas a la izquierda y motivo
+        es 'final', 'sin_transicion', 'limite_pasos' o 'borde'
+    """
+    if macro_pasos and tabla.barridos is None:
+        tabla.detectar_bucles()
+    if macro_pasos and tabla.tiene_bucles:
+        return _ejecutar_macro(tabla, cinta, posicion, estado, pasos, max_pasos, crecer)
+
+    siguiente = tabla.siguiente
+    escribir = tabla.escribir
+    mover = tabla.mover
+    num_simbolos = tabla.num_simbolos
+    blanco = bytes([tabla.blanco])
+    limite = len(cinta)
+    desplazamiento = 0
+
+    while pasos < max_pasos:
+        i = estado * num_simbolos + cinta[posicion]
+        nuevo_estado = siguiente[i]
+        if nuevo_estado < 0:
+            motivo = 'final' if tabla.final[estado] else 'sin_transicion'
+            return cinta, posicion, estado, pasos, desplazamiento, motivo
+
+        cinta[posicion] = escribir[i]
+        posicion += mover[i]
+        estado = nuevo_estado
+        pasos += 1
+
+        if posicion < 0:
+            if not crecer:
+                return cinta, posicion, estado, pasos, desplazamiento, 'borde'
+            extension = max(10, limite)
+            cinta[0:0] = blanco * extension
+            posicion += extension
+            desplazamiento += extension
+            limite += extension
+        elif posicion >= limite:
+            if not crecer:
+                return cinta, posicion, estado, pasos, desplazamiento, 'borde'
+            extension = max(10, limite)
+            cinta.extend(blanco * extension)
+            limite += extension
+
+    return cinta, posicion, estado, pasos, desplazamiento, 'limite_pasos'
+
+
+def _ejecutar_macro(tabla, cinta, posicion, estado, pasos, max_pasos, crecer=True):
+    """Igual que ejecutar_compilado, pero ejecutando cada barrido en un macro paso."""
+    siguiente = tabla.siguiente
+    escribir = tabla.escribir
+    mover = tabla.mover
+    barridos = tabla.barridos
+    num_simbolos = tabla.num_simbolos
+    blanco = bytes([tabla.blanco])
+    limite = len(cinta)
+    desplazamiento = 0
+
+    while pasos < max_pasos:
+        i = estado * num_simbolos + cinta[posicion]
+        nuevo_estado = siguiente[i]
+        if nuevo_estado < 0:
+            motivo = 'final' if tabla.final[estado] else 'sin_transicion'
+            return cinta, posicion, estado, pasos, desplazamiento, motivo
+
+        barrido = barridos[i]
+        direccion = mover[i]
+        vecino = posicion + direccion
+        # Las rachas cortas no compensan el costo del macro paso: solo se
+        # entra si la celda vecina y la de 8 posiciones más allá pertenecen
+        # al barrido (la longitud real de la racha se calcula después)
+        lejano = posicion + 8 * direccion
+        if barrido is None or (barrido[0] is not None
+                               and not (0 <= lejano < limite and cinta[vecino] in barrido[0]
+                                        and cinta[lejano] in barrido[0])):
+            cinta[posicion] = escribir[i]
+            posicion = vecino
+            estado = nuevo_estado
+            pasos += 1
+        else:
+            miembros, directo, inverso, traduccion = barrido
+            if miembros is None:
+                # Bucle sin movimiento ni cambio: se repite hasta el límite
+                pasos = max_pasos
+                break
+
+            restantes = max_pasos - pasos
+            if direccion == 1:
+                # La racha termina en la primera celda ajena (o en el borde)
+                hasta = min(limite, posicion + restantes)
+                ajena = directo.search(cinta, posicion, hasta)
+                inicio, fin = posicion, ajena.start() if ajena else hasta
+                posicion = fin
+            else:
+                # Buscar hacia atrás en ventanas crecientes para que el costo
+                # sea proporcional a la longitud de la racha
+                cota = max(0, posicion + 1 - restantes)
+                ventana = 64
+                while True:
+                    desde = max(cota, posicion + 1 - ventana)
+                    ajena = inverso.search(cinta, desde, posicion + 1)
+                    if ajena or desde == cota:
+                        break
+                    ventana *= 2
+                inicio, fin = (ajena.start() + 1 if ajena else cota), posicion + 1
+                posicion = inicio - 1
+            if traduccion is not None:
+                cinta[inicio:fin] = cinta[inicio:fin].translate(traduccion)
+            pasos += fin - inicio
+
+        if posicion < 0:
+            if not crecer:
+                return cinta, posicion, estado, pasos, desplazamiento, 'borde'
+            extension = max(10, limite)
+            cinta[0:0] = blanco * extension
+            posicion += extension
+            desplazamiento += extension
+            limite += extension
+        elif posicion >= limite:
+            if not crecer:
+                return cinta, posicion, estado, pasos, desplazamiento, 'borde'
+            extension = max(10, limite)
+            cinta.extend(blanco * extension)
+            limite += extension
+
+    return cinta, posicion, estado, pasos, desplazamiento, 'limite_pasos'
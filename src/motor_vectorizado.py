@@ -0,0 +1,113 @@
+import time
+
+import numpy as np
+
+from src.lote import ResultadoLote
+
+
+# Códigos de motivo de parada usados dentro del motor
+_MOTIVOS = {1: 'final', 2: 'sin_transicion', 3: 'limite_pasos'}
+
+
+def ejecutar_vectorizado(maquina, entradas, max_pasos=100000):
+    """
+    Ejecuta muchas entradas de la misma máquina en paralelo, paso a paso.
+
+    Todas las cintas viven en un arreglo 2-D de NumPy (una fila por entrada)
+    y en cada iteración se aplica la tabla de transiciones densa a todas las
+    filas activas con indexación avanzada. Las filas que se detienen salen
+    del conjunto activo, así que el costo por paso baja a medida que terminan.
+
+    Args:
+        maquina (MaquinaTuring): Máquina cuya tabla se usa (no se modifica su cinta)
+        entradas (list): Cadenas de entrada
+        max_pasos (int): Límite de pasos por entrada
+
+    Returns:
+        list: Un ResultadoLote por entrada, en el orden de entrada. El campo
+        tiempo es el tiempo total del lote dividido entre el número de entradas.
+    """
+    tabla = maquina.compilar()
+    if tabla is None:
+        raise ValueError("El motor vectorizado solo está disponible para máquinas de una cinta")
+    cantidad = len(entradas)
+    if cantidad == 0:
+        return []
+
+    siguiente = np.frombuffer(tabla.siguiente, dtype=np.int32)
+    escribir = np.frombuffer(tabla.escribir, dtype=np.uint8)
+    mover = np.frombuffer(tabla.mover, dtype=np.int8).astype(np.int64)
+    final = np.frombuffer(bytes(tabla.final), dtype=np.uint8).astype(bool)
+    num_simbolos = tabla.num_simbolos
+
+    # Cinta 2-D con el mismo relleno inicial que Cinta
+    codificadas = []
+    for entrada in entradas:
+        codificada = tabla.codificar(entrada if entrada else tabla.simbolos[tabla.blanco])
+        if codificada is None:
+            raise ValueError(f"La entrada {entrada!r} contiene símbolos fuera del alfabeto")
+        codificadas.append(codificada)
+    origen = 10
+    ancho = max(len(c) for c in codificadas) + 2 * origen
+    cinta = np.full((cantidad, ancho), tabla.blanco, dtype=np.uint8)
+    for fila, codificada in enumerate(codificadas):
+        cinta[fila, origen:origen + len(codificada)] = np.frombuffer(bytes(codificada), dtype=np.uint8)
+
+    # Estado de las filas activas (compactado) y resultados de todas las filas
+    filas = np.arange(cantidad)
+    cabezal = np.full(cantidad, origen, dtype=np.int64)
+    estado = np.full(cantidad, tabla.id_estado[maquina.estado_inicial], dtype=np.int64)
+    cabezal_final = np.zeros(cantidad, dtype=np.int64)
+    pasos_final = np.full(cantidad, max_pasos, dtype=np.int64)
+    motivo_final = np.full(cantidad, 3, dtype=np.int8)
+
+    tiempo_inicio = time.perf_counter()
+    for paso in range(max_pasos):
+        indice = estado * num_simbolos + cinta[filas, cabezal]
+        nuevo_estado = siguiente[indice]
+
+        parados = nuevo_estado < 0
+        if parados.any():
+            salen = filas[parados]
+            pasos_final[salen] = paso
+            cabezal_final[salen] = cabezal[parados]
+            motivo_final[salen] = np.where(final[estado[parados]], 1, 2)
+            sigue = ~parados
+            filas, cabezal, indice, nuevo_estado = filas[sigue], cabezal[sigue], indice[sigue], nuevo_estado[sigue]
+            if filas.size == 0:
+                break
+
+        cinta[filas, cabezal] = escribir[indice]
+        cabezal += mover[indice]
+        estado = nuevo_estado.astype(np.int64)
+
+        # Crecer todas las cintas a la vez si algún cabezal salió por un borde;
+        # en un mismo paso pueden salir cabezales por los dos lados
+        if cabezal.min() < 0:
+            extension = ancho
+            cinta = np.concatenate([np.full((cantidad, extension), tabla.blanco, dtype=np.uint8), cinta], axis=1)
+            cabezal += extension
+            cabezal_final += extension
+            origen += extension
+            ancho += extension
+        if cabezal.max() >= ancho:
+            extension = ancho
+            cinta = np.concatenate([cinta, np.full((cantidad, extension), tabla.blanco, dtype=np.uint8)], axis=1)
+            ancho += extension
+    else:
+        cabezal_final[filas] = cabezal
+    tiempo = (time.perf_counter() - tiempo_inicio) / cantidad
+
+    resultados = []
+    blanco = tabla.simbolos[tabla.blanco]
+    for fila in range(cantidad):
+        no_blancos = np.flatnonzero(cinta[fila] != tabla.blanco)
+        if no_blancos.size:
+            celdas = cinta[fila, no_blancos[0]:no_blancos[-1] + 1].tobytes()
+            salida = ''.join(tabla.decodificar(celdas))
+        else:
+            salida = blanco
+        resultados.append(ResultadoLote(
+            fila, entradas[fila], salida, int(pasos_final[fila]), _MOTIVOS[int(motivo_final[fila])], tiempo
+        ))
+    return resultados
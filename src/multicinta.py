@@ -0,0 +1,130 @@
+from src.cinta import crear_cinta
+from src.ejecucion import Ejecucion, EventoPaso
+
+
+class EjecucionMulticinta(Ejecucion):
+    """
+    Ejecución de una máquina de varias cintas, cada una con su propio cabezal.
+
+    La entrada se escribe en la cinta 0 y las demás empiezan en blanco. En
+    cada paso se leen todos los cabezales y la transición escribe y mueve
+    cada uno. ``cinta`` es la cinta de salida (``cinta_salida`` de la
+    definición), así que obtener_resultado() funciona igual que con una cinta.
+
+    Solo hay motor interpretado: con compilado=True se ejecuta igual paso a
+    paso. El historial 'delta', los checkpoints, la detección de ciclos y el
+    perfilador son de una sola cinta.
+    """
+
+    __slots__ = ('cintas',)
+
+    def __init__(self, definicion, entrada=None, mostrar_avisos=True, **opciones):
+        self.cintas = ()
+        super().__init__(definicion, entrada, mostrar_avisos, **opciones)
+
+    def inicializar(self, entrada, historial='completo', tamano_historial=100, muestreo_historial=10,
+                    intervalo_checkpoint=1000, tipo_cinta='lista'):
+        """Inicializa las cintas (la entrada va en la cinta 0); ver Ejecucion.inicializar()."""
+        simbolos = self.definicion.simbolos_cinta
+        self.cintas = tuple(
+            crear_cinta(tipo_cinta, entrada if i == 0 else '', simbolo_blanco='_', simbolos=simbolos)
+            for i in range(self.definicion.num_cintas)
+        )
+        self.cinta = self.cintas[self.definicion.cinta_salida]
+        self.estado_actual = self.definicion.estado_inicial
+        self.pasos = 0
+        self.motivo_parada = None
+        self.configurar_historial(historial, tamano_historial, muestreo_historial, intervalo_checkpoint)
+        self.guardar_configuracion()
+
+    def configurar_historial(self, modo='completo', tamano=100, cada=10, intervalo_checkpoint=1000):
+        if modo == 'delta':
+            raise ValueError("El historial 'delta' solo está disponible para máquinas de una cinta")
+        super().configurar_historial(modo, tamano, cada, intervalo_checkpoint)
+
+    def leer(self):
+        """Retorna la tupla de símbolos bajo los cabezales."""
+        return tuple([cinta.leer() for cinta in self.cintas])
+
+    def paso(self):
+        """
+        Ejecuta un paso sobre todas las cintas.
+
+        Returns:
+            bool: True si la máquina continúa, False si se detiene
+        """
+        if self.estado_actual in self.definicion.estados_finales:
+            self.motivo_parada = 'final'
+            return False
+
+        leidos = self.leer()
+        transicion = self.definicion.transiciones.get((self.estado_actual, leidos))
+        if transicion is None:
+            self.motivo_parada = 'sin_transicion'
+            self.avisar(f"⚠️  No hay transición definida para ({self.estado_actual}, {leidos})")
+            return False
+
+        nuevo_estado, escritos, direcciones = transicion
+        for cinta, simbolo, direccion in zip(self.cintas, escritos, direcciones):
+            cinta.escribir(simbolo)
+            cinta.mover_cabezal(direccion)
+        self.estado_actual = nuevo_estado
+        self.pasos += 1
+        self.guardar_configuracion()
+        return True
+
+    def iterar(self, max_pasos=1000):
+        """
+        Igual que Ejecucion.iterar(); los símbolos, direcciones y posiciones
+        de cada evento son tuplas con un valor por cinta.
+        """
+        transiciones = self.definicion.transiciones
+        while self.pasos < max_pasos:
+            estado = self.estado_actual
+            leidos = self.leer()
+            if not self.paso():
+                self.guardar_configuracion(final=True)
+                return
+            nuevo_estado, escritos, direcciones = transiciones[(estado, leidos)]
+            yield EventoPaso(self.pasos, estado, leidos, nuevo_estado, escritos, direcciones,
+                             tuple(cinta.posicion_logica() for cinta in self.cintas))
+        self.motivo_parada = 'limite_pasos'
+
+    def ejecutar(self, max_pasos=1000, mostrar_pasos=False, compilado=False, historial=None, macro_pasos=False,
+                 checkpoint_cada=None, ruta_checkpoint=None, detectar_ciclos=False, perfilador=None):
+        """Igual que Ejecucion.ejecutar(), sin checkpoints, detección de ciclos ni perfilador."""
+        if checkpoint_cada or detectar_ciclos or perfilador is not None:
+            raise ValueError("Los checkpoints, la detección de ciclos y el perfilador son de una sola cinta")
+        return super().ejecutar(max_pasos, mostrar_pasos, compilado, historial, macro_pasos)
+
+    def _ejecutar_compilado(self, max_pasos, macro_pasos):
+        # Sin tabla compilada: _ejecutar_hasta() sigue con el bucle interpretado
+        return None
+
+    def ejecutar_compilado(self, max_pasos=1000, macro_pasos=False):
+        raise ValueError("El motor compilado solo está disponible para máquinas de una cinta")
+
+    def guardar_checkpoint(self, ruta):
+        raise ValueError("Los checkpoints solo están disponibles para máquinas de una cinta")
+
+    def guardar_configuracion(self, final=False):
+        """Guarda la configuración actual; posicion, cinta y simbolo_actual son tuplas por cinta."""
+        if not self.registro_historial.debe_registrar(self.pasos, final):
+            return
+
+        config = {
+            'paso': self.pasos,
+            'estado': self.estado_actual,
+            'posicion': tuple(cinta.posicion_logica() for cinta in self.cintas),
+            'cinta': tuple(cinta.obtener_contenido() for cinta in self.cintas),
+            'simbolo_actual': self.leer()
+        }
+        self.registro_historial.agregar(config)
+
+    def mostrar_configuracion(self):
+        """Muestra la configuración actual con una línea por cinta."""
+        print(f"\n--- Paso {self.pasos} ---")
+        print(f"Estado: {self.estado_actual}")
+        for i, cinta in enumerate(self.cintas):
+            print(f"Cinta {i}: {cinta}")
+        print(f"Símbolos leídos: {self.leer()}")
@@ -0,0 +1,288 @@
+import argparse
+import json
+
+
+# Desplazamiento de cada dirección y dirección de cada desplazamiento
+DESPLAZAMIENTOS = {'L': -1, 'R': 1, 'N': 0}
+DIRECCIONES = {-1: 'L', 1: 'R', 0: 'N'}
+
+
+class ReporteOptimizacion:
+    """Lo que cambió optimizar_configuracion() en la tabla de una máquina."""
+
+    def __init__(self, estados, transiciones):
+        self.estados_antes = estados
+        self.transiciones_antes = transiciones
+        self.estados_despues = estados
+        self.transiciones_despues = transiciones
+        self.inalcanzables = []
+        self.transiciones_muertas = 0
+        self.fusionados = {}
+        self.compuestas = 0
+        self.preserva_pasos = True
+
+    def hubo_cambios(self):
+        return (self.estados_despues, self.transiciones_despues) != (self.estados_antes, self.transiciones_antes)
+
+    def reporte(self):
+        """
+        Resume los cambios en estructuras simples (listas y diccionarios).
+
+        Returns:
+            dict: Totales antes y después y el detalle de cada optimización
+        """
+        return {
+            'estados_antes': self.estados_antes,
+            'estados_despues': self.estados_despues,
+            'transiciones_antes': self.transiciones_antes,
+            'transiciones_despues': self.transiciones_despues,
+            'estados_inalcanzables': list(self.inalcanzables),
+            'transiciones_muertas': self.transiciones_muertas,
+            'estados_fusionados': dict(self.fusionados),
+            'transiciones_compuestas': self.compuestas,
+            'preserva_pasos': self.preserva_pasos,
+        }
+
+    def mostrar(self):
+        """Imprime el resumen de la optimización."""
+        print("="*60)
+        print("OPTIMIZACIÓN DE LA TABLA DE TRANSICIONES")
+        print("="*60)
+        print(f"Estados: {self.estados_antes} -> {self.estados_despues}   "
+              f"Transiciones: {self.transiciones_antes} -> {self.transiciones_despues}")
+        if self.inalcanzables:
+            print(f"Estados inalcanzables eliminados: {', '.join(self.inalcanzables)}")
+        if self.transiciones_muertas:
+            print(f"Transiciones que nunca se ejecutan eliminadas: {self.transiciones_muertas}")
+        for estado, representante in self.fusionados.items():
+            print(f"Estado {estado} fusionado con {representante} (equivalente)")
+        if self.compuestas:
+            print(f"Transiciones compuestas: {self.compuestas} (cada una ahorra un paso al ejecutarse; "
+                  f"cambia el número de pasos)")
+        if not self.hubo_cambios():
+            print("La tabla ya era mínima: no hubo cambios")
+
+
+def _alcanzables(inicial, transiciones):
+    """Estados alcanzables desde el inicial siguiendo la tabla."""
+    salidas = {}
+    for (estado, _), (nuevo_estado, _, _) in transiciones.items():
+        salidas.setdefault(estado, set()).add(nuevo_estado)
+    alcanzados = {inicial}
+    pendientes = [inicial]
+    while pendientes:
+        for siguiente in salidas.get(pendientes.pop(), ()):
+            if siguiente not in alcanzados:
+                alcanzados.add(siguiente)
+                pendientes.append(siguiente)
+    return alcanzados
+
+
+def _podar(estados, inicial, finales, transiciones, reporte):
+    """
+    Elimina las transiciones de estados finales y los estados inalcanzables.
+
+    Los estados finales se conservan aunque no se alcancen: ya no tienen
+    transiciones y una configuración válida debe declarar al menos uno.
+    """
+    for clave in [c for c in transiciones if c[0] in finales]:
+        del transiciones[clave]
+        reporte.transiciones_muertas += 1
+
+    alcanzados = _alcanzables(inicial, transiciones)
+    for estado in [e for e in estados if e not in alcanzados and e not in finales]:
+        estados.remove(estado)
+        reporte.inalcanzables.append(estado)
+    for clave in [c for c in transiciones if c[0] not in alcanzados]:
+        del transiciones[clave]
+        reporte.transiciones_muertas += 1
+
+
+def _fusionar(estados, inicial, finales, transiciones, reporte, alfabeto=()):
+    """
+    Fusiona los estados equivalentes (refinamiento de particiones de Moore).
+
+    Dos estados son equivalentes si se detienen con los mismos símbolos (los
+    del alfabeto o de la tabla para los que no tienen transición) y con cada
+    uno de los demás escriben lo mismo, se mueven igual y pasan a estados
+    equivalentes. La salida y los pasos no cambian, pero si la máquina se
+    detiene por falta de transición en un estado fusionado, el estado
+    reportado es el representante de su bloque. Los estados finales
+    conservan su nombre y no se fusionan.
+    """
+    simbolos = sorted({simbolo for _, simbolo in transiciones} | set(alfabeto), key=repr)
+    # Bloques iniciales: cada estado final por separado y el resto según los
+    # símbolos con los que se detiene
+    bloque = {
+        e: ('final', e) if e in finales
+        else ('parada',) + tuple(simbolo for simbolo in simbolos if (e, simbolo) not in transiciones)
+        for e in estados
+    }
+    while True:
+        firmas = {}
+        for estado in estados:
+            firma = [bloque[estado]]
+            for simbolo in simbolos:
+                transicion = transiciones.get((estado, simbolo))
+                if transicion is not None:
+                    nuevo_estado, escrito, direccion = transicion
+                    transicion = (bloque[nuevo_estado], escrito, direccion)
+                firma.append(transicion)
+            firmas[estado] = tuple(firma)
+        # Numerar las firmas: el bloque nuevo solo depende de la firma
+        numeros = {}
+        nuevo = {e: numeros.setdefault(firmas[e], len(numeros)) for e in estados}
+        # Cada ronda solo divide bloques: si no aumentaron, la partición es estable
+        if len(numeros) == len(set(bloque.values())):
+            break
+        bloque = nuevo
+
+    # Representante de cada bloque: el inicial si está, si no el primero en orden
+    representantes = {}
+    for estado in estados:
+        representantes.setdefault(bloque[estado], estado)
+    representantes[bloque[inicial]] = inicial
+    renombre = {e: representantes[bloque[e]] for e in estados}
+
+    for estado in list(estados):
+        if renombre[estado] != estado:
+            estados.remove(estado)
+            reporte.fusionados[estado] = renombre[estado]
+    for (estado, simbolo), (nuevo_estado, escrito, direccion) in list(transiciones.items()):
+        del transiciones[(estado, simbolo)]
+        if renombre[estado] == estado:
+            transiciones[(estado, simbolo)] = (renombre[nuevo_estado], escrito, direccion)
+
+
+def _componer(finales, simbolos, transiciones, reporte):
+    """
+    Compone cadenas de transiciones que no necesitan leer la cinta.
+
+    Tras un movimiento 'N' el símbolo bajo el cabezal es el que se acaba de
+    escribir, así que la transición siguiente se conoce de antemano y se
+    puede aplicar en el mismo paso. Lo mismo con un estado que no lee (con
+    cualquier símbolo vuelve a escribir el mismo, se mueve igual y pasa al
+    mismo estado) si los dos movimientos juntos siguen siendo de una celda
+    como máximo. Cada composición ahorra un paso.
+    """
+    no_leen = {}
+    for estado in {e for e, _ in transiciones}:
+        acciones = {transiciones.get((estado, s)) for s in simbolos}
+        if None in acciones:
+            continue
+        if len({(nuevo, direccion) for nuevo, _, direccion in acciones}) == 1 and \
+                all(transiciones[(estado, s)][1] == s for s in simbolos):
+            nuevo_estado, _, direccion = next(iter(acciones))
+            no_leen[estado] = (nuevo_estado, DESPLAZAMIENTOS[direccion])
+
+    limite = len(transiciones) + 1
+    for clave, (nuevo_estado, escrito, direccion) in list(transiciones.items()):
+        desplazamiento = DESPLAZAMIENTOS[direccion]
+        compuestas = 0
+        while nuevo_estado not in finales and compuestas <= limite:
+            if desplazamiento == 0 and (nuevo_estado, escrito) in transiciones:
+                nuevo_estado, escrito, direccion = transiciones[(nuevo_estado, escrito)]
+                desplazamiento = DESPLAZAMIENTOS[direccion]
+            elif nuevo_estado in no_leen and abs(desplazamiento + no_leen[nuevo_estado][1]) <= 1:
+                nuevo_estado, extra = no_leen[nuevo_estado]
+                desplazamiento += extra
+            else:
+                break
+            compuestas += 1
+        # Una cadena más larga que la tabla es un bucle sin fin: se deja como estaba
+        if 0 < compuestas <= limite:
+            transiciones[clave] = (nuevo_estado, escrito, DIRECCIONES[desplazamiento])
+            reporte.compuestas += compuestas
+
+
+def optimizar_configuracion(config, preservar_pasos=True):
+    """
+    Optimiza la tabla de transiciones de una configuración de máquina.
+
+    Siempre elimina los estados inalcanzables y las transiciones que nunca
+    se ejecutan, y fusiona los estados equivalentes: la máquina optimizada
+    da la misma salida con el mismo número de pasos. Con preservar_pasos=False
+    además compone las cadenas de transiciones que no necesitan leer la cinta
+    (ver _componer), así que la salida es la misma pero con menos pasos.
+
+    Args:
+        config (dict): Configuración de la máquina (no se modifica)
+        preservar_pasos (bool): Si False, también compone cadenas
+
+    Returns:
+        tuple: (configuración optimizada, ReporteOptimizacion)
+    """
+    num_cintas = config.get('num_cintas', 1)
+    congelar = tuple if num_cintas > 1 else (lambda valor: valor)
+    transiciones = {}
+    for t in config['transiciones']:
+        transiciones[(t['estado_actual'], congelar(t['simbolo_leido']))] = (
+            t['nuevo_estado'], congelar(t['simbolo_escribir']), congelar(t['direccion'])
+        )
+
+    estados = list(config['estados'])
+    for (estado, _), (nuevo_estado, _, _) in transiciones.items():
+        for e in (estado, nuevo_estado):
+            if e not in estados:
+                estados.append(e)
+    inicial = config['estado_inicial']
+    finales = set(config['estados_finales'])
+    reporte = ReporteOptimizacion(len(estados), len(config['transiciones']))
+
+    # Alfabeto de la cinta (con una cinta; con varias basta con los símbolos de la tabla)
+    simbolos = set()
+    if num_cintas == 1:
+        simbolos = set(config['simbolos_cinta']) | {'_'}
+        for (_, leido), (_, escrito, _) in transiciones.items():
+            simbolos.update((leido, escrito))
+
+    _podar(estados, inicial, finales, transiciones, reporte)
+    _fusionar(estados, inicial, finales, transiciones, reporte, simbolos)
+    if not preservar_pasos and num_cintas == 1:
+        reporte.preserva_pasos = False
+        _componer(finales, simbolos, transiciones, reporte)
+        if reporte.compuestas:
+            _podar(estados, inicial, finales, transiciones, reporte)
+            _fusionar(estados, inicial, finales, transiciones, reporte, simbolos)
+
+    descongelar = list if num_cintas > 1 else (lambda valor: valor)
+    optimizada = dict(config)
+    optimizada['estados'] = estados
+    optimizada['estados_finales'] = [e for e in config['estados_finales'] if e in estados]
+    optimizada['transiciones'] = [
+        {
+            'estado_actual': estado,
+            'simbolo_leido': descongelar(leido),
+            'nuevo_estado': nuevo_estado,
+            'simbolo_escribir': descongelar(escrito),
+            'direccion': descongelar(direccion),
+        }
+        for (estado, leido), (nuevo_estado, escrito, direccion) in transiciones.items()
+    ]
+    reporte.estados_despues = len(estados)
+    reporte.transiciones_despues = len(transiciones)
+    return optimizada, reporte
+
+
+def main(argumentos=None):
+    """Optimiza un archivo de máquina e imprime (o guarda) el resultado."""
+    parser = argparse.ArgumentParser(description="Optimizador de tablas de transiciones")
+    parser.add_argument('config', help="Archivo JSON de la máquina")
+    parser.add_argument('--componer', action='store_true',
+                        help="Compone cadenas de transiciones (cambia el número de pasos)")
+    parser.add_argument('--salida', help="Guarda la máquina optimizada en este archivo JSON")
+    args = parser.parse_args(argumentos)
+
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    optimizada, reporte = optimizar_configuracion(config, preservar_pasos=not args.componer)
+    reporte.mostrar()
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump(optimizada, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ Máquina optimizada guardada en: {args.salida}")
+    return reporte
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import csv
+import json
+from collections import Counter
+
+
+class Perfilador:
+    """
+    Mide dónde se van los pasos de una ejecución.
+
+    Cuenta cuántas veces se usa cada transición (estado, símbolo), cuántos
+    pasos y cuánto tiempo se pasa en cada estado, la distancia total que
+    recorre el cabezal y cada vez que la cinta crece. Solo tiene costo
+    cuando se pasa a ejecutar(perfilador=...): el bucle normal no lo consulta.
+    """
+
+    def __init__(self):
+        self.transiciones = Counter()
+        self.pasos_por_estado = Counter()
+        self.tiempo_por_estado = Counter()
+        self.pasos = 0
+        self.recorrido = 0
+        self.minimo = None
+        self.maximo = None
+        self.crecimientos = []
+
+    def conectar(self, ejecucion):
+        """
+        Empieza a registrar los crecimientos de la cinta de la ejecución.
+
+        Reemplaza expandir_izquierda/expandir_derecha solo en esa instancia
+        de la cinta; desconectar() restaura los métodos de la clase.
+        """
+        cinta = ejecucion.cinta
+        posicion = cinta.posicion_logica()
+        if self.minimo is None:
+            self.minimo = self.maximo = posicion
+
+        for lado in ('izquierda', 'derecha'):
+            nombre = f'expandir_{lado}'
+            original = getattr(cinta, nombre)
+
+            def envoltura(cantidad=10, original=original, lado=lado):
+                self.crecimientos.append((ejecucion.pasos, lado, cantidad))
+                return original(cantidad)
+
+            setattr(cinta, nombre, envoltura)
+
+    def desconectar(self, ejecucion):
+        """Deja de registrar los crecimientos de la cinta."""
+        for nombre in ('expandir_izquierda', 'expandir_derecha'):
+            vars(ejecucion.cinta).pop(nombre, None)
+
+    def registrar(self, estado, simbolo, segundos, posicion_anterior, posicion):
+        """
+        Registra un paso ejecutado.
+
+        Args:
+            estado (str): Estado en el que se ejecutó el paso
+            simbolo (str): Símbolo leído
+            segundos (float): Duración del paso
+            posicion_anterior (int): Posición lógica antes del paso
+            posicion (int): Posición lógica después del paso
+        """
+        self.transiciones[(estado, simbolo)] += 1
+        self.pasos_por_estado[estado] += 1
+        self.tiempo_por_estado[estado] += segundos
+        self.pasos += 1
+        self.recorrido += abs(posicion - posicion_anterior)
+        if posicion < self.minimo:
+            self.minimo = posicion
+        elif posicion > self.maximo:
+            self.maximo = posicion
+
+    def calor_estados(self, metrica='pasos'):
+        """
+        Valor por estado para colorear el diagrama de estados.
+
+        Args:
+            metrica (str): 'pasos' o 'tiempo'
+
+        Returns:
+            dict: estado -> pasos o segundos
+        """
+        if metrica == 'pasos':
+            return dict(self.pasos_por_estado)
+        if metrica == 'tiempo':
+            return dict(self.tiempo_por_estado)
+        raise ValueError(f"Métrica desconocida: {metrica!r} (use 'pasos' o 'tiempo')")
+
+    def reporte(self):
+        """
+        Resume el perfil en estructuras simples (listas y diccionarios).
+
+        Returns:
+            dict: Totales, estados y transiciones ordenados de más a menos usados
+        """
+        tiempo_total = sum(self.tiempo_por_estado.values())
+        estados = [
+            {
+                'estado': estado,
+                'pasos': pasos,
+                'tiempo_s': self.tiempo_por_estado[estado],
+                'fraccion_pasos': pasos / self.pasos,
+            }
+            for estado, pasos in self.pasos_por_estado.most_common()
+        ]
+        transiciones = [
+            {'estado': estado, 'simbolo': simbolo, 'veces': veces}
+            for (estado, simbolo), veces in self.transiciones.most_common()
+        ]
+        return {
+            'pasos': self.pasos,
+            'tiempo_s': tiempo_total,
+            'recorrido_cabezal': self.recorrido,
+            'posicion_minima': self.minimo,
+            'posicion_maxima': self.maximo,
+            'crecimientos': [
+                {'paso': paso, 'lado': lado, 'celdas': celdas} for paso, lado, celdas in self.crecimientos
+            ],
+            'estados': estados,
+            'transiciones': transiciones,
+        }
+
+    def mostrar(self, limite=10):
+        """Imprime los estados y transiciones más usados."""
+        reporte = self.reporte()
+        print("="*60)
+        print("PERFIL DE LA EJECUCIÓN")
+        print("="*60)
+        print(f"Pasos: {reporte['pasos']}   Recorrido del cabezal: {reporte['recorrido_cabezal']} celdas")
+        print(f"Posiciones visitadas: {reporte['posicion_minima']} a {reporte['posicion_maxima']}   "
+              f"Crecimientos de la cinta: {len(reporte['crecimientos'])}")
+
+        print(f"\n{'Estado':<20} {'Pasos':<10} {'% pasos':<10} {'Tiempo (ms)':<12}")
+        print("-"*60)
+        for fila in reporte['estados'][:limite]:
+            print(f"{fila['estado']:<20} {fila['pasos']:<10} {fila['fraccion_pasos']*100:<10.1f} "
+                  f"{fila['tiempo_s']*1000:<12.3f}")
+
+        print(f"\n{'Transición':<30} {'Veces':<10}")
+        print("-"*60)
+        for fila in reporte['transiciones'][:limite]:
+            print(f"{'(' + fila['estado'] + ', ' + repr(fila['simbolo']) + ')':<30} {fila['veces']:<10}")
+
+    def exportar_json(self, ruta):
+        """Guarda el reporte completo en JSON."""
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump(self.reporte(), f, indent=2, ensure_ascii=False)
+
+    def exportar_csv(self, ruta):
+        """Guarda el conteo de transiciones en CSV (estado, símbolo, veces)."""
+        with open(ruta, 'w', newline='', encoding='utf-8') as f:
+            escritor = csv.DictWriter(f, fieldnames=['estado', 'simbolo', 'veces'])
+            escritor.writeheader()
+            escritor.writerows(self.reporte()['transiciones'])
@@ -0,0 +1,524 @@
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.definicion import cargar_definicion
+from src.ejecucion import crear_ejecucion
+from src.simulador import (CONFIGURACIONES, MAXIMO_N_UNARIO, MOTORES, binario_a_numero, numero_a_binario,
+                           numero_a_unario, unario_a_numero)
+from src.validacion import ErrorConfiguracion
+
+
+# Trabajo de simulación: sin config se usa la máquina de Fibonacci (binaria con binario=True;
+# con binario=None, la binaria solo si n > MAXIMO_N_UNARIO); con n, la entrada es n
+# codificado y el resultado incluye el número decodificado
+Trabajo = namedtuple('Trabajo', ['id', 'config', 'entrada', 'n', 'binario', 'max_pasos', 'tiempo_max', 'motor'],
+                     defaults=(None, None, '', None, None, 100000, None, 'compilado'))
+
+# Dónde se ejecutan los trabajos: en el bucle de eventos, en hilos o en procesos
+EJECUTORES = ('local', 'hilos', 'procesos')
+
+# Campos que acepta una línea del protocolo (además de 'cancelar')
+CAMPOS_PEDIDO = frozenset(Trabajo._fields)
+
+# Marca de cancelación de cada ranura de ejecución, compartida con los procesos trabajadores
+_cancelados = None
+
+
+class ServicioOcupado(Exception):
+    """La cola de trabajos está llena (ver ServicioSimulacion.enviar_sin_esperar)."""
+
+
+def _inicializar_trabajador(cancelados):
+    """Recibe en cada proceso trabajador las marcas de cancelación compartidas."""
+    global _cancelados
+    _cancelados = cancelados
+
+
+def validar_trabajo(trabajo):
+    """
+    Revisa n y decide la codificación de un trabajo.
+
+    Returns:
+        Trabajo: El trabajo con binario resuelto a True o False
+
+    Raises:
+        ValueError: Si n no es un entero no negativo, binario no es booleano
+            o se pide la máquina unaria de Fibonacci para n > MAXIMO_N_UNARIO
+    """
+    n = trabajo.n
+    if n is not None and (not isinstance(n, int) or isinstance(n, bool) or n < 0):
+        raise ValueError(f"n debe ser un entero no negativo: {n!r}")
+    binario = trabajo.binario
+    if binario is None:
+        binario = n is not None and n > MAXIMO_N_UNARIO
+    elif not isinstance(binario, bool):
+        raise ValueError(f"binario debe ser true o false: {binario!r}")
+    if not binario and trabajo.config is None and n is not None and n > MAXIMO_N_UNARIO:
+        raise ValueError(f"La máquina unaria de Fibonacci solo calcula n ≤ {MAXIMO_N_UNARIO}; "
+                         f"use binario=true u omita binario")
+    return trabajo._replace(binario=binario)
+
+
+def _preparar(trabajo):
+    """Carga la máquina del trabajo y crea su ejecución."""
+    entrada = trabajo.entrada
+    if trabajo.n is not None:
+        entrada = numero_a_binario(trabajo.n) if trabajo.binario else numero_a_unario(trabajo.n)
+    definicion = cargar_definicion(trabajo.config or CONFIGURACIONES[trabajo.binario])
+    return crear_ejecucion(definicion, entrada, mostrar_avisos=False, historial='ninguno'), entrada
+
+
+def _avanzar(ejecucion, trabajo, cada_pasos):
+    """
+    Ejecuta hasta cada_pasos pasos más del trabajo.
+
+    Returns:
+        str: Motivo de parada si la ejecución terminó (también al llegar a
+        trabajo.max_pasos), o None si puede seguir
+    """
+    limite = min(ejecucion.pasos + cada_pasos, trabajo.max_pasos)
+    ejecucion.ejecutar(max_pasos=limite, **MOTORES[trabajo.motor])
+    if ejecucion.motivo_parada != 'limite_pasos' or ejecucion.pasos >= trabajo.max_pasos:
+        return ejecucion.motivo_parada
+    return None
+
+
+def _interrumpir(trabajo, inicio, cancelado):
+    """Motivo para cortar un trabajo que todavía puede seguir ('cancelado' o 'limite_tiempo'), o None."""
+    if cancelado:
+        return 'cancelado'
+    if trabajo.tiempo_max is not None and time.monotonic() - inicio >= trabajo.tiempo_max:
+        return 'limite_tiempo'
+    return None
+
+
+def _resultado(trabajo, ejecucion, entrada, motivo, tiempo):
+    """Resultado de un trabajo como diccionario listo para JSON."""
+    resultado = {
+        'id': trabajo.id,
+        'entrada': entrada,
+        'salida': ejecucion.obtener_resultado(),
+        'pasos': ejecucion.pasos,
+        'motivo': motivo,
+        'estado': ejecucion.estado_actual,
+        'tiempo_s': tiempo,
+    }
+    if trabajo.n is not None and motivo == 'final':
+        convertir = binario_a_numero if trabajo.binario else unario_a_numero
+        resultado['resultado'] = convertir(resultado['salida'])
+    return resultado
+
+
+def _error(trabajo, error):
+    """Resultado de un trabajo que no se pudo ejecutar."""
+    return {'id': trabajo.id, 'error': str(error)}
+
+
+def ejecutar_trabajo(trabajo, cada_pasos=10000, ranura=0, cancelados=None):
+    """
+    Ejecuta un trabajo completo de forma bloqueante (en un hilo o proceso del ejecutor).
+
+    Avanza de a cada_pasos pasos y entre tramos revisa el límite de tiempo y
+    la marca de cancelación de su ranura, así que un trabajo cancelado o sin
+    tiempo se detiene a lo sumo cada_pasos pasos después.
+
+    Args:
+        trabajo (Trabajo): Trabajo a ejecutar
+        cada_pasos (int): Pasos entre revisiones
+        ranura (int): Índice de la marca de cancelación del trabajo
+        cancelados (bytearray): Marcas de cancelación; None usa las que
+            recibió el proceso trabajador
+
+    Returns:
+        dict: Resultado del trabajo, o {'id', 'error'} si no se pudo ejecutar
+    """
+    cancelados = _cancelados if cancelados is None else cancelados
+    try:
+        trabajo = validar_trabajo(trabajo)
+        ejecucion, entrada = _preparar(trabajo)
+        inicio = time.monotonic()
+        motivo = None
+        while motivo is None:
+            motivo = _avanzar(ejecucion, trabajo, cada_pasos)
+            if motivo is None:
+                motivo = _interrumpir(trabajo, inicio, cancelados[ranura])
+    except (ErrorConfiguracion, ValueError, KeyError, OSError) as e:
+        return _error(trabajo, e)
+    return _resultado(trabajo, ejecucion, entrada, motivo, time.monotonic() - inicio)
+
+
+class ServicioSimulacion:
+    """
+    Servicio asyncio que ejecuta trabajos de simulación con concurrencia acotada.
+
+    Los trabajos entran en una cola acotada: cuando está llena, enviar()
+    espera (contrapresión) y enviar_sin_esperar() lanza ServicioOcupado.
+    max_concurrentes tareas toman trabajos de la cola y los ejecutan:
+
+    - 'procesos': en un ProcessPoolExecutor (en paralelo, una máquina cargada
+      por proceso gracias a la caché de cargar_definicion). Los procesos se
+      crean con forkserver o spawn, así que el script que use el servicio
+      necesita la guarda ``if __name__ == "__main__"``
+    - 'hilos': en un ThreadPoolExecutor (el bucle de eventos sigue atendiendo,
+      pero los trabajos comparten el GIL)
+    - 'local': en el mismo bucle de eventos, cediendo el control cada
+      cada_pasos pasos
+
+    Cada trabajo tiene un límite de pasos y, opcionalmente, de tiempo. Cada
+    tarea usa siempre la misma ranura de cancelación, una marca compartida
+    que el trabajo revisa entre tramos de cada_pasos pasos.
+    """
+
+    def __init__(self, max_concurrentes=None, tamano_cola=64, ejecutor='procesos', cada_pasos=10000):
+        """
+        Args:
+            max_concurrentes (int): Trabajos en ejecución a la vez (por defecto os.cpu_count())
+            tamano_cola (int): Trabajos que pueden esperar en la cola
+            ejecutor (str): Uno de EJECUTORES
+            cada_pasos (int): Pasos entre revisiones de cancelación y tiempo
+                (y entre cesiones del control en el modo 'local')
+        """
+        if ejecutor not in EJECUTORES:
+            raise ValueError(f"Ejecutor desconocido: {ejecutor!r} (use uno de {', '.join(EJECUTORES)})")
+        if cada_pasos < 1:
+            raise ValueError("cada_pasos debe ser al menos 1")
+        self.max_concurrentes = max_concurrentes or os.cpu_count() or 1
+        self.tamano_cola = tamano_cola
+        self.ejecutor = ejecutor
+        self.cada_pasos = cada_pasos
+        self.completados = 0
+
+        self._cola = None
+        self._tareas = []
+        self._pool = None
+        self._cancelados = None
+        # id -> futuro del resultado, y id -> ranura para los que se están ejecutando
+        self._pendientes = {}
+        self._en_curso = {}
+        self._ids = itertools.count()
+
+    async def iniciar(self):
+        """Crea la cola, el ejecutor y las tareas que atienden los trabajos."""
+        self._cola = asyncio.Queue(self.tamano_cola)
+        if self.ejecutor == 'procesos':
+            # Con fork, los trabajadores heredarían los sockets abiertos de las conexiones y
+            # el cliente no vería el cierre; forkserver (o spawn) los crea sin esos descriptores
+            contexto = multiprocessing.get_context(
+                'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+            self._cancelados = contexto.RawArray('b', self.max_concurrentes)
+            self._pool = ProcessPoolExecutor(self.max_concurrentes, mp_context=contexto,
+                                             initializer=_inicializar_trabajador, initargs=(self._cancelados,))
+        else:
+            self._cancelados = bytearray(self.max_concurrentes)
+            if self.ejecutor == 'hilos':
+                self._pool = ThreadPoolExecutor(self.max_concurrentes)
+        self._tareas = [asyncio.create_task(self._atender(ranura)) for ranura in range(self.max_concurrentes)]
+
+    async def cerrar(self):
+        """Cancela los trabajos pendientes y en curso y libera el ejecutor."""
+        for trabajo_id in list(self._pendientes):
+            self.cancelar(trabajo_id)
+        for tarea in self._tareas:
+            tarea.cancel()
+        await asyncio.gather(*self._tareas, return_exceptions=True)
+        self._tareas = []
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    async def __aenter__(self):
+        await self.iniciar()
+        return self
+
+    async def __aexit__(self, *excepcion):
+        await self.cerrar()
+
+    def _registrar(self, trabajo):
+        """Valida el trabajo, le asigna un id si no tiene y crea el futuro de su resultado."""
+        trabajo = validar_trabajo(trabajo)
+        if trabajo.id is None:
+            trabajo = trabajo._replace(id=next(self._ids))
+        if trabajo.id in self._pendientes:
+            raise ValueError(f"Ya hay un trabajo pendiente con id {trabajo.id!r}")
+        if trabajo.motor not in MOTORES:
+            raise ValueError(f"Motor desconocido: {trabajo.motor!r} (use uno de {', '.join(MOTORES)})")
+        futuro = asyncio.get_running_loop().create_future()
+        self._pendientes[trabajo.id] = futuro
+        return trabajo, futuro
+
+    async def enviar(self, trabajo):
+        """
+        Encola un trabajo, esperando si la cola está llena.
+
+        Args:
+            trabajo (Trabajo): Trabajo a ejecutar
+
+        Returns:
+            asyncio.Future: Futuro con el resultado (ver ejecutar_trabajo)
+
+        Raises:
+            ValueError: Si el trabajo no es válido (ver validar_trabajo), su
+                motor no existe o ya hay uno pendiente con el mismo id
+        """
+        trabajo, futuro = self._registrar(trabajo)
+        try:
+            await self._cola.put(trabajo)
+        except asyncio.CancelledError:
+            del self._pendientes[trabajo.id]
+            raise
+        return futuro
+
+    def enviar_sin_esperar(self, trabajo):
+        """
+        Encola un trabajo sin esperar.
+
+        Returns:
+            asyncio.Future: Futuro con el resultado
+
+        Raises:
+            ServicioOcupado: Si la cola está llena
+        """
+        if self._cola.full():
+            raise ServicioOcupado(f"La cola de trabajos está llena ({self.tamano_cola})")
+        trabajo, futuro = self._registrar(trabajo)
+        self._cola.put_nowait(trabajo)
+        return futuro
+
+    async def ejecutar(self, trabajo):
+        """
+        Encola un trabajo y espera su resultado.
+
+        Si se cancela la tarea que espera, también se cancela el trabajo.
+
+        Returns:
+            dict: Resultado del trabajo
+        """
+        if trabajo.id is None:
+            trabajo = trabajo._replace(id=next(self._ids))
+        futuro = await self.enviar(trabajo)
+        try:
+            return await asyncio.shield(futuro)
+        except asyncio.CancelledError:
+            self.cancelar(trabajo.id)
+            raise
+
+    def cancelar(self, trabajo_id):
+        """
+        Cancela un trabajo en espera o en ejecución.
+
+        Un trabajo en espera se descarta al salir de la cola; uno en
+        ejecución se detiene en su próxima revisión y su resultado tiene
+        motivo 'cancelado'.
+
+        Returns:
+            bool: True si el trabajo estaba pendiente
+        """
+        if trabajo_id not in self._pendientes:
+            return False
+        ranura = self._en_curso.get(trabajo_id)
+        if ranura is not None:
+            self._cancelados[ranura] = 1
+        else:
+            futuro = self._pendientes.pop(trabajo_id)
+            if not futuro.done():
+                futuro.set_result({'id': trabajo_id, 'motivo': 'cancelado'})
+        return True
+
+    async def _atender(self, ranura):
+        """Toma trabajos de la cola y los ejecuta de a uno, usando siempre la misma ranura."""
+        while True:
+            trabajo = await self._cola.get()
+            try:
+                futuro = self._pendientes.get(trabajo.id)
+                if futuro is None or futuro.done():
+                    continue  # Cancelado mientras esperaba
+                self._cancelados[ranura] = 0
+                self._en_curso[trabajo.id] = ranura
+                try:
+                    if self._pool is None:
+                        resultado = await self._ejecutar_local(trabajo, ranura)
+                    else:
+                        argumentos = (trabajo, self.cada_pasos, ranura)
+                        if self.ejecutor == 'hilos':
+                            argumentos += (self._cancelados,)
+                        resultado = await asyncio.get_running_loop().run_in_executor(
+                            self._pool, ejecutar_trabajo, *argumentos)
+                except asyncio.CancelledError:
+                    # El servicio se cierra: el trabajo en el ejecutor ve su marca y termina solo
+                    self._cancelados[ranura] = 1
+                    if not futuro.done():
+                        futuro.set_result({'id': trabajo.id, 'motivo': 'cancelado'})
+                    raise
+                except Exception as e:
+                    resultado = _error(trabajo, e)
+                finally:
+                    self._en_curso.pop(trabajo.id, None)
+                    futuro = self._pendientes.pop(trabajo.id, None)
+                self.completados += 1
+                if futuro is not None and not futuro.done():
+                    futuro.set_result(resultado)
+            finally:
+                self._cola.task_done()
+
+    async def _ejecutar_local(self, trabajo, ranura):
+        """Igual que ejecutar_trabajo(), en el bucle de eventos y cediendo el control entre tramos."""
+        try:
+            ejecucion, entrada = _preparar(trabajo)
+        except (ErrorConfiguracion, ValueError, KeyError, OSError) as e:
+            return _error(trabajo, e)
+        inicio = time.monotonic()
+        motivo = None
+        while motivo is None:
+            try:
+                motivo = _avanzar(ejecucion, trabajo, self.cada_pasos)
+            except (ValueError, KeyError) as e:
+                return _error(trabajo, e)
+            if motivo is None:
+                await asyncio.sleep(0)
+                motivo = _interrumpir(trabajo, inicio, self._cancelados[ranura])
+        return _resultado(trabajo, ejecucion, entrada, motivo, time.monotonic() - inicio)
+
+    def estadisticas(self):
+        """Trabajos en cola, en ejecución y completados."""
+        return {
+            'en_cola': self._cola.qsize() if self._cola is not None else 0,
+            'en_curso': len(self._en_curso),
+            'completados': self.completados,
+        }
+
+
+def trabajo_desde_pedido(pedido):
+    """
+    Convierte una línea del protocolo (un objeto JSON) en un Trabajo.
+
+    Raises:
+        ValueError: Si el pedido no es un objeto, tiene campos desconocidos
+            o un n que no es un entero no negativo (ver validar_trabajo)
+    """
+    if not isinstance(pedido, dict):
+        raise ValueError("Cada línea debe ser un objeto JSON")
+    desconocidos = set(pedido) - CAMPOS_PEDIDO
+    if desconocidos:
+        raise ValueError(f"Campos desconocidos: {', '.join(sorted(desconocidos))}")
+    return validar_trabajo(Trabajo(**pedido))
+
+
+async def atender_conexion(servicio, leer_linea, escribir_linea):
+    """
+    Atiende un flujo de pedidos JSON por líneas y responde una línea por trabajo.
+
+    Cada línea es un trabajo (campos de Trabajo, todos opcionales) o
+    {"cancelar": id}. Las respuestas salen en cuanto termina cada trabajo,
+    no en el orden de los pedidos. Con la cola llena se deja de leer hasta
+    que haya lugar, así que la contrapresión llega hasta quien escribe.
+
+    Args:
+        servicio (ServicioSimulacion): Servicio ya iniciado
+        leer_linea (coroutine function): Retorna la próxima línea (bytes o
+            str), vacía al terminar la entrada
+        escribir_linea (coroutine function): Envía una línea de respuesta
+    """
+    respuestas = set()
+
+    async def responder(futuro):
+        await escribir_linea(json.dumps(await futuro, ensure_ascii=False))
+
+    while True:
+        linea = await leer_linea()
+        if not linea:
+            break
+        if not linea.strip():
+            continue
+        pedido = None
+        try:
+            pedido = json.loads(linea)
+            if isinstance(pedido, dict) and 'cancelar' in pedido:
+                cancelado = servicio.cancelar(pedido['cancelar'])
+                await escribir_linea(json.dumps({'cancelar': pedido['cancelar'], 'pendiente': cancelado}))
+                continue
+            futuro = await servicio.enviar(trabajo_desde_pedido(pedido))
+        except (ValueError, TypeError) as e:
+            error = {'error': str(e)}
+            if isinstance(pedido, dict) and 'id' in pedido:
+                error = {'id': pedido['id'], **error}
+            await escribir_linea(json.dumps(error, ensure_ascii=False))
+            continue
+        tarea = asyncio.create_task(responder(futuro))
+        respuestas.add(tarea)
+        tarea.add_done_callback(respuestas.discard)
+    await asyncio.gather(*respuestas)
+
+
+async def servir_stdin(servicio):
+    """Atiende pedidos por stdin y responde por stdout (una línea JSON por trabajo)."""
+    async def leer_linea():
+        # La lectura bloqueante va a un hilo: funciona igual con tuberías y archivos
+        return await asyncio.to_thread(sys.stdin.buffer.readline)
+
+    async def escribir_linea(linea):
+        sys.stdout.write(linea + '\n')
+        sys.stdout.flush()
+
+    await atender_conexion(servicio, leer_linea, escribir_linea)
+
+
+async def servir_unix(servicio, ruta):
+    """Atiende conexiones en un socket Unix, cada una con el protocolo de atender_conexion()."""
+    async def conexion(lector, escritor):
+        async def escribir_linea(linea):
+            escritor.write(linea.encode('utf-8') + b'\n')
+            await escritor.drain()
+
+        try:
+            await atender_conexion(servicio, lector.readline, escribir_linea)
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    servidor = await asyncio.start_unix_server(conexion, ruta)
+    async with servidor:
+        await servidor.serve_forever()
+
+
+async def _principal(args):
+    async with ServicioSimulacion(args.concurrentes, args.tamano_cola, args.ejecutor, args.cada_pasos) as servicio:
+        servidor = asyncio.create_task(
+            servir_unix(servicio, args.socket) if args.socket else servir_stdin(servicio))
+        # SIGTERM cierra el servicio en orden (cancela los trabajos y libera el ejecutor)
+        if hasattr(signal, 'SIGTERM'):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, servidor.cancel)
+        try:
+            await servidor
+        except asyncio.CancelledError:
+            pass
+
+
+def main(argumentos=None):
+    """Servidor local de simulaciones (JSON por líneas en stdin/stdout o en un socket Unix)."""
+    parser = argparse.ArgumentParser(description="Servicio de simulación con concurrencia acotada")
+    parser.add_argument('--socket', help="Ruta del socket Unix (por defecto, stdin/stdout)")
+    parser.add_argument('--ejecutor', choices=EJECUTORES, default='procesos')
+    parser.add_argument('--concurrentes', type=int, help="Trabajos a la vez (por defecto, uno por CPU)")
+    parser.add_argument('--tamano-cola', type=int, default=64, help="Trabajos en espera antes de dejar de leer")
+    parser.add_argument('--cada-pasos', type=int, default=10000,
+                        help="Pasos entre revisiones de cancelación y tiempo")
+    args = parser.parse_args(argumentos)
+    try:
+        asyncio.run(_principal(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,34 @@
+import argparse
+import contextlib
+import json
+import os
+import pathlib
+import sys
 import time
+from src.cache_resultados import CacheResultados, ResultadoCache
+from src.cinta import TIPOS_CINTA
+from src.definicion import cargar_definicion
+from src.ejecucion import Ejecucion, crear_ejecucion
 from src.maquina_turing import MaquinaTuring
-import os
+from src.perfilador import Perfilador
+from src.validacion import ErrorConfiguracion
+
+
+# Opciones de ejecutar() de cada motor disponible en la línea de comandos
+MOTORES = {
+    'interpretado': {'compilado': False},
+    'compilado': {'compilado': True},
+    'macro': {'compilado': True, 'macro_pasos': True},
+}
+
+# Máquina de Fibonacci según la codificación (False = unario, True = binario)
+CONFIGURACIONES = {
+    False: 'config/maquina_fibonacci.json',
+    True: 'config/maquina_fibonacci_binario.json',
+}
+
+# Mayor n para el que la máquina unaria de Fibonacci da el resultado correcto
+MAXIMO_N_UNARIO = 5
 
 
 # Función para verificar y generar diagramas automáticamente
@@ -56,6 +84,37 @@ def unario_a_numero(unario):
     return unario.count('1')
 
 
+def numero_a_binario(n):
+    """
+    Convierte un número entero a binario (bit más significativo primero).
+    
+    Args:
+        n (int): Número a convertir
+    
+    Returns:
+        str: Representación binaria (ej: 6 -> '110')
+    """
+    if n <= 0:
+        return '0'
+    return format(n, 'b')
+
+
+def binario_a_numero(binario):
+    """
+    Convierte una representación binaria a número entero.
+    
+    Args:
+        binario (str): Cadena en binario (los blancos de los extremos se ignoran)
+    
+    Returns:
+        int: Número entero
+    """
+    binario = binario.strip('_')
+    if binario == '':
+        return 0
+    return int(binario, 2)
+
+
 def fibonacci_python(n):
     """Calcula Fibonacci usando Python normal (para verificar resultados)."""
     if n <= 0:
@@ -69,13 +128,29 @@ def fibonacci_python(n):
     return b
 
 
-def simular_fibonacci(n, mostrar_pasos=False):
+def mostrar_traza(traza):
+    """
+    Muestra paso a paso las configuraciones guardadas en una traza.
+    
+    Args:
+        traza (TrazaDelta): Traza de la ejecución
+    """
+    for config, vista in traza.iterar_vistas():
+        print(f"\n--- Paso {config['paso']} ---")
+        print(f"Estado: {config['estado']}")
+        print(vista)
+        print(f"Símbolo leído: '{config['simbolo_actual']}'")
+
+
+def simular_fibonacci(n, mostrar_pasos=False, cache=None):
     """
     Simula el cálculo de Fibonacci usando la Máquina de Turing.
     
     Args:
         n (int): El índice del número de Fibonacci a calcular
         mostrar_pasos (bool): Si True, muestra cada paso de la simulación
+        cache (CacheResultados): Si se indica y no se muestran los pasos,
+            reutiliza el resultado de una simulación anterior de la misma entrada
     
     Returns:
         tuple: (resultado, tiempo_ejecución, numero_pasos)
@@ -91,26 +166,52 @@ def simular_fibonacci(n, mostrar_pasos=False):
     
     # Inicializar máquina
     maquina = MaquinaTuring('config/maquina_fibonacci.json')
-    maquina.inicializar(entrada)
     
-    # Medir tiempo de ejecución
-    tiempo_inicio = time.time()
-    exito = maquina.ejecutar(max_pasos=100000, mostrar_pasos=mostrar_pasos)
-    tiempo_fin = time.time()
+    en_cache = None
+    if cache is not None and not mostrar_pasos:
+        en_cache = cache.obtener(maquina.definicion.huella, entrada, max_pasos=100000)
     
-    tiempo_ejecucion = tiempo_fin - tiempo_inicio
+    if en_cache is not None:
+        tiempo_ejecucion = 0.0
+        exito = True
+        resultado_unario, pasos = en_cache.salida, en_cache.pasos
+    else:
+        # El historial solo se consulta al mostrar los pasos, y entonces basta
+        # con la traza delta que reconstruye cada configuración al recorrerla
+        maquina.inicializar(entrada, historial='delta' if mostrar_pasos else 'ninguno')
+        
+        # Medir tiempo de ejecución
+        tiempo_inicio = time.perf_counter()
+        exito = maquina.ejecutar(max_pasos=100000)
+        tiempo_fin = time.perf_counter()
+        
+        tiempo_ejecucion = tiempo_fin - tiempo_inicio
+        resultado_unario, pasos = maquina.obtener_resultado(), maquina.pasos
+        
+        if cache is not None:
+            cache.guardar(maquina.definicion.huella, entrada,
+                          ResultadoCache(resultado_unario, pasos, maquina.motivo_parada))
+        
+        if mostrar_pasos:
+            mostrar_traza(maquina.obtener_historial())
     
     if exito:
-        resultado_unario = maquina.obtener_resultado()
-        resultado = unario_a_numero(resultado_unario)
+        if en_cache is not None:
+            resultado = unario_a_numero(resultado_unario)
+        else:
+            # La cinta lleva la cuenta de cada símbolo, no hace falta recorrer la cadena
+            resultado = maquina.cinta.contar('1')
         
         print(f"\n{'='*60}")
         print(f"Simulación completada!!")
         print(f"{'='*60}")
         print(f"Resultado (unario): {resultado_unario}")
         print(f"Resultado (decimal): {resultado}")
-        print(f"Número de pasos: {maquina.pasos}")
-        print(f"Tiempo de ejecución: {tiempo_ejecucion:.6f} segundos")
+        print(f"Número de pasos: {pasos}")
+        if en_cache is not None:
+            print("Tiempo de ejecución: resultado tomado de la caché")
+        else:
+            print(f"Tiempo de ejecución: {tiempo_ejecucion:.6f} segundos")
         
         # Verificar
         esperado = fibonacci_python(n)
@@ -119,10 +220,57 @@ def simular_fibonacci(n, mostrar_pasos=False):
         else:
             print(f"✗ Error: Se esperaba {esperado} pero se obtuvo {resultado}")
         
-        return resultado, tiempo_ejecucion, maquina.pasos
+        return resultado, tiempo_ejecucion, pasos
     else:
         print("La simulación no completó exitosamente")
-        return None, tiempo_ejecucion, maquina.pasos
+        return None, tiempo_ejecucion, pasos
+
+
+def simular_fibonacci_binario(n, max_pasos=10**8):
+    """
+    Calcula F(n) con la máquina binaria, que no tiene el límite n ≤ 5.
+    
+    Args:
+        n (int): El índice del número de Fibonacci a calcular
+        max_pasos (int): Límite de pasos
+    
+    Returns:
+        tuple: (resultado, tiempo_ejecución, numero_pasos)
+    """
+    entrada = numero_a_binario(n)
+    
+    print(f"\n{'='*60}")
+    print(f"Calculando F({n}) usando Máquina de Turing (binario)")
+    print(f"{'='*60}")
+    print(f"Entrada (binario): {entrada}")
+    
+    ejecucion = Ejecucion(cargar_definicion('config/maquina_fibonacci_binario.json'), entrada,
+                          historial='ninguno')
+    tiempo_inicio = time.perf_counter()
+    exito = ejecucion.ejecutar(max_pasos=max_pasos, compilado=True)
+    tiempo_ejecucion = time.perf_counter() - tiempo_inicio
+    
+    if not exito:
+        print("La simulación no completó exitosamente")
+        return None, tiempo_ejecucion, ejecucion.pasos
+    
+    resultado_binario = ejecucion.obtener_resultado()
+    resultado = binario_a_numero(resultado_binario)
+    print(f"\n{'='*60}")
+    print(f"Simulación completada!!")
+    print(f"{'='*60}")
+    print(f"Resultado (binario): {resultado_binario}")
+    print(f"Resultado (decimal): {resultado}")
+    print(f"Número de pasos: {ejecucion.pasos}")
+    print(f"Tiempo de ejecución: {tiempo_ejecucion:.6f} segundos")
+    
+    esperado = fibonacci_python(n)
+    if resultado == esperado:
+        print(f"✓ Resultado correcto!")
+    else:
+        print(f"✗ Error: Se esperaba {esperado} pero se obtuvo {resultado}")
+    
+    return resultado, tiempo_ejecucion, ejecucion.pasos
 
 
 def menu_principal():
@@ -131,6 +279,9 @@ def menu_principal():
     # Generar diagramas automáticamente si no existen
     verificar_y_generar_diagramas()
     
+    # Las entradas repetidas en el menú no se vuelven a simular
+    cache = CacheResultados()
+    
     while True:
         print("\n" + "="*60)
         print("SIMULADOR DE MÁQUINA DE TURING - FIBONACCI")
@@ -138,7 +289,8 @@ def menu_principal():
         print("1. Calcular un número de Fibonacci")
         print("2. Calcular con visualización paso a paso")
         print("3. Ejecutar análisis empírico")
-        print("4. Salir")
+        print("4. Calcular en binario (n grande)")
+        print("5. Salir")
         print("="*60)
         
         opcion = input("\nSeleccione una opción: ").strip()
@@ -154,13 +306,13 @@ def menu_principal():
             # Convertir a n
             n = len(entrada)
             
-            if n > 5:
-                print(f"Esta implementación funciona para n ≤ 5 (máximo: 11111)")
+            if n > MAXIMO_N_UNARIO:
+                print(f"Esta implementación funciona para n ≤ {MAXIMO_N_UNARIO} (máximo: {'1' * MAXIMO_N_UNARIO})")
                 confirmar = input("¿Continuar de todos modos? (s/n): ")
                 if confirmar.lower() != 's':
                     continue
             
-            simular_fibonacci(n, mostrar_pasos=False)
+            simular_fibonacci(n, mostrar_pasos=False, cache=cache)
         
         elif opcion == '2':
             entrada = input("\nIngrese la entrada en notación unaria (ej: para F(4) ingrese 1111, para F(0) presione Enter): ").strip()
@@ -173,8 +325,8 @@ def menu_principal():
             # Convertir a n
             n = len(entrada)
             
-            if n > 5:
-                print(f"Esta implementación funciona para n ≤ 5 (máximo: 11111)")
+            if n > MAXIMO_N_UNARIO:
+                print(f"Esta implementación funciona para n ≤ {MAXIMO_N_UNARIO} (máximo: {'1' * MAXIMO_N_UNARIO})")
                 confirmar = input("¿Continuar de todos modos? (s/n): ")
                 if confirmar.lower() != 's':
                     continue
@@ -200,6 +352,15 @@ def menu_principal():
                 traceback.print_exc()
         
         elif opcion == '4':
+            entrada = input("\nIngrese n en decimal (ej: 100): ").strip()
+            
+            if not entrada.isdigit():
+                print("Entrada inválida. Ingrese un entero no negativo (ejemplo: 100)")
+                continue
+            
+            simular_fibonacci_binario(int(entrada))
+        
+        elif opcion == '5':
             print("\n¡Hasta luego!")
             break
         
@@ -207,5 +368,206 @@ def menu_principal():
             print("Opción no válida")
 
 
+def ejecutar_sin_interfaz(args):
+    """
+    Ejecuta una entrada sin menú ni diagramas e imprime el resultado.
+    
+    Args:
+        args (argparse.Namespace): Argumentos del subcomando 'run'
+    
+    Returns:
+        int: Código de salida (0 si la máquina se detuvo sola)
+    """
+    if args.n is not None:
+        entrada = numero_a_binario(args.n) if args.binario else numero_a_unario(args.n)
+    elif args.archivo_entrada:
+        entrada = pathlib.Path(args.archivo_entrada)
+    else:
+        entrada = args.input
+    definicion = cargar_definicion(args.config or CONFIGURACIONES[args.binario],
+                                   optimizar=args.optimizar or args.componer, preservar_pasos=not args.componer)
+    ejecucion = crear_ejecucion(definicion, entrada, mostrar_avisos=False, historial='ninguno', tipo_cinta=args.cinta)
+    # El perfil usa el motor interpretado (ver Ejecucion.ejecutar)
+    perfilador = Perfilador() if args.perfil or args.diagrama else None
+    
+    tiempo_inicio = time.perf_counter()
+    exito = ejecucion.ejecutar(max_pasos=args.max_pasos, detectar_ciclos=args.detectar_ciclos,
+                               perfilador=perfilador, **MOTORES[args.motor])
+    tiempo_ejecucion = time.perf_counter() - tiempo_inicio
+    
+    resultado = {
+        'maquina': definicion.nombre,
+        'entrada': str(entrada),
+        'salida': ejecucion.obtener_resultado() if not args.archivo_salida else None,
+        'pasos': ejecucion.pasos,
+        'motivo': ejecucion.motivo_parada,
+        'estado': ejecucion.estado_actual,
+        'tiempo_s': tiempo_ejecucion,
+    }
+    if args.archivo_salida:
+        # La salida puede ser tan grande como la cinta: va al archivo, no a la terminal
+        ejecucion.cinta.exportar(args.archivo_salida)
+        resultado['archivo_salida'] = args.archivo_salida
+    if args.perfil and args.json:
+        resultado['perfil'] = perfilador.reporte()
+    if args.diagrama:
+        # Solo aquí se importan matplotlib y networkx
+        from src.generar_diagrama import crear_diagrama_calor
+        with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+            crear_diagrama_calor(definicion, perfilador, args.diagrama, args.calor)
+        resultado['diagrama'] = args.diagrama
+    if args.json:
+        print(json.dumps(resultado, ensure_ascii=False))
+    else:
+        print(f"Entrada: {resultado['entrada']}")
+        print(f"Salida: {resultado['salida'] if not args.archivo_salida else args.archivo_salida}")
+        print(f"Número de pasos: {resultado['pasos']} ({resultado['motivo']})")
+        print(f"Tiempo de ejecución: {tiempo_ejecucion:.6f} segundos")
+        if args.perfil:
+            print()
+            perfilador.mostrar()
+    return 0 if exito else 1
+
+
+def _leer_entradas(archivo, convertir=None):
+    """
+    Lee las entradas de un archivo de texto, una por línea, sin cargarlo completo.
+    
+    Args:
+        archivo (file): Archivo abierto (o sys.stdin)
+        convertir (callable): Si se indica, cada línea es un número n y esta
+            función lo codifica (numero_a_unario o numero_a_binario)
+    
+    Yields:
+        str: Cadena de entrada para la cinta
+    """
+    for linea in archivo:
+        linea = linea.rstrip('\r\n')
+        if convertir is not None:
+            if not linea.strip():
+                continue
+            yield convertir(int(linea))
+        else:
+            yield linea
+
+
+def ejecutar_lote_sin_interfaz(args):
+    """
+    Ejecuta todas las entradas de un archivo o de stdin e imprime una línea JSON por resultado.
+    
+    Cada línea se imprime en cuanto termina su entrada; con varios procesos
+    el orden puede diferir del de la entrada (el campo 'indice' lo indica).
+    
+    Args:
+        args (argparse.Namespace): Argumentos del subcomando 'lote'
+    
+    Returns:
+        int: Código de salida (0 si todas las máquinas se detuvieron solas)
+    """
+    # El pool de procesos solo se importa en este modo
+    from src.lote import ejecutar_lote
+    
+    opciones = MOTORES[args.motor]
+    archivo = sys.stdin if args.entradas == '-' else open(args.entradas, encoding='utf-8')
+    todas_terminaron = True
+    try:
+        convertir = None
+        if args.numeros:
+            convertir = numero_a_binario if args.binario else numero_a_unario
+        resultados = ejecutar_lote(args.config or CONFIGURACIONES[args.binario], _leer_entradas(archivo, convertir),
+                                   workers=args.workers,
+                                   max_pasos=args.max_pasos, compilado=opciones['compilado'],
+                                   macro_pasos=opciones.get('macro_pasos', False),
+                                   tamano_bloque=args.tamano_bloque,
+                                   optimizar=args.optimizar or args.componer, preservar_pasos=not args.componer)
+        for resultado in resultados:
+            if resultado.motivo not in ('final', 'sin_transicion'):
+                todas_terminaron = False
+            print(json.dumps({
+                'indice': resultado.indice,
+                'entrada': resultado.entrada,
+                'salida': resultado.salida,
+                'pasos': resultado.pasos,
+                'motivo': resultado.motivo,
+                'tiempo_s': resultado.tiempo,
+            }, ensure_ascii=False), flush=True)
+    except BrokenPipeError:
+        # El lector cerró la tubería (por ejemplo `| head`): terminar sin traza
+        sys.stdout = open(os.devnull, 'w')
+        return 0
+    finally:
+        if archivo is not sys.stdin:
+            archivo.close()
+    return 0 if todas_terminaron else 1
+
+
+def main(argumentos=None):
+    """
+    Punto de entrada: sin subcomando abre el menú interactivo.
+    
+    El subcomando 'run' no genera diagramas ni importa las bibliotecas de
+    gráficas, así que sirve para scripts y para medir el arranque.
+    
+    Args:
+        argumentos (list): Argumentos de la línea de comandos (None = sys.argv)
+    
+    Returns:
+        int: Código de salida
+    """
+    parser = argparse.ArgumentParser(description="Simulador de Máquina de Turing")
+    subcomandos = parser.add_subparsers(dest='comando')
+    subcomandos.add_parser('menu', help="Menú interactivo (por defecto)")
+    
+    run = subcomandos.add_parser('run', help="Ejecuta una entrada sin interfaz")
+    origen = run.add_mutually_exclusive_group()
+    origen.add_argument('--input', default='', help="Cadena de entrada para la cinta")
+    origen.add_argument('--n', type=int, help="Usa n codificado en unario (o en binario con --binario)")
+    origen.add_argument('--archivo-entrada',
+                        help="Lee la entrada de un archivo (con --cinta mmap, sin cargarla en memoria)")
+    run.add_argument('--archivo-salida', help="Escribe la cinta final en un archivo en vez de imprimirla")
+    run.add_argument('--binario', action='store_true', help="Usa la máquina de Fibonacci en binario")
+    run.add_argument('--config', help="Archivo JSON de la máquina (por defecto, la de Fibonacci)")
+    run.add_argument('--max-pasos', type=int, default=100000)
+    run.add_argument('--motor', choices=list(MOTORES), default='compilado')
+    run.add_argument('--cinta', choices=list(TIPOS_CINTA), default='lista')
+    run.add_argument('--detectar-ciclos', action='store_true', help="Detiene la ejecución si no terminará")
+    run.add_argument('--json', action='store_true', help="Imprime el resultado como JSON")
+    run.add_argument('--perfil', action='store_true',
+                     help="Perfila la ejecución (motor interpretado) e imprime los estados y transiciones más usados")
+    run.add_argument('--diagrama', metavar='ARCHIVO',
+                     help="Guarda el diagrama de estados coloreado con el perfil de la ejecución")
+    run.add_argument('--calor', choices=['pasos', 'tiempo'], default='pasos',
+                     help="Métrica que colorea el diagrama de --diagrama")
+    
+    lote = subcomandos.add_parser('lote', help="Ejecuta muchas entradas y emite JSON por líneas")
+    lote.add_argument('entradas', nargs='?', default='-',
+                      help="Archivo con una entrada por línea ('-' o nada = stdin)")
+    lote.add_argument('--numeros', action='store_true', help="Cada línea es un número n, no una cadena")
+    lote.add_argument('--binario', action='store_true', help="Usa la máquina de Fibonacci en binario")
+    lote.add_argument('--config', help="Archivo JSON de la máquina (por defecto, la de Fibonacci)")
+    lote.add_argument('--max-pasos', type=int, default=100000)
+    lote.add_argument('--motor', choices=list(MOTORES), default='compilado')
+    lote.add_argument('--workers', type=int, default=1, help="Procesos en paralelo (0 = uno por CPU)")
+    lote.add_argument('--tamano-bloque', type=int, default=64, help="Entradas por tarea enviada a cada proceso")
+    
+    for subcomando in (run, lote):
+        subcomando.add_argument('--optimizar', action='store_true',
+                                help="Optimiza la tabla al cargarla (mismos resultados y pasos)")
+        subcomando.add_argument('--componer', action='store_true',
+                                help="Optimiza y compone cadenas de transiciones (menos pasos)")
+    
+    args = parser.parse_args(argumentos)
+    try:
+        if args.comando == 'run':
+            return ejecutar_sin_interfaz(args)
+        if args.comando == 'lote':
+            return ejecutar_lote_sin_interfaz(args)
+    except ErrorConfiguracion as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    menu_principal()
+    return 0
+
+
 if __name__ == "__main__":
-    menu_principal()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,180 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from types import MappingProxyType
+
+from src.motor_compilado import DESPLAZAMIENTOS, TablaCompilada
+
+
+MAGICO = b'MTCB'
+VERSION = 1
+
+# Extensión del archivo binario que acompaña al JSON de la máquina
+EXTENSION = '.mtc'
+
+# magico, versión, orden de bytes (1 = little endian), bytes por entero,
+# mtime y tamaño del JSON de origen, huella SHA-256, estados, símbolos,
+# símbolos de la cinta, transiciones, estado inicial, blanco y largo de los nombres
+_CABECERA = struct.Struct('<4sHBBqQ32sIIIIIII')
+
+# Dirección de cada desplazamiento (-1 es el último elemento)
+_DIRECCIONES = ('N', 'R', 'L')
+
+
+def ruta_binaria(ruta):
+    """Ruta del archivo binario asociado a un JSON de máquina."""
+    return os.path.splitext(ruta)[0] + EXTENSION
+
+
+def _secciones(num_estados, num_simbolos, num_transiciones):
+    """Tipo y cantidad de elementos de cada arreglo, en el orden del archivo (enteros primero)."""
+    celdas = num_estados * num_simbolos
+    return [
+        ('i', celdas), ('i', num_transiciones), ('i', num_transiciones),
+        ('B', num_estados), ('B', celdas), ('b', celdas),
+        ('B', num_transiciones), ('B', num_transiciones), ('b', num_transiciones),
+    ]
+
+
+def guardar_binario(definicion, info, ruta=None):
+    """
+    Guarda la tabla compilada de una definición en su archivo binario.
+
+    Después de la cabecera van los arreglos de la tabla densa y las
+    transiciones como arreglos paralelos de identificadores (los enteros
+    primero, para que queden alineados), y al final los nombres en JSON. Se
+    escribe en un temporal que luego se renombra, así que otro proceso nunca
+    ve un archivo a medias. Si no se puede escribir, no se guarda nada.
+
+    Args:
+        definicion (DefinicionMT): Definición de una sola cinta, sin optimizar
+        info (os.stat_result): Estado del JSON de origen al leerlo
+        ruta (str): Archivo de destino (por defecto, ruta_binaria(definicion.ruta))
+
+    Returns:
+        bool: True si se guardó el archivo
+    """
+    tabla = definicion.tabla
+    if ruta is None:
+        ruta = ruta_binaria(definicion.ruta)
+
+    id_estado, id_simbolo = tabla.id_estado, tabla.id_simbolo
+    origen, leido, destino, escrito, mover = array('i'), array('B'), array('i'), array('B'), array('b')
+    for (estado, simbolo), (nuevo_estado, simbolo_escribir, direccion) in definicion.transiciones.items():
+        origen.append(id_estado[estado])
+        leido.append(id_simbolo[simbolo])
+        destino.append(id_estado[nuevo_estado])
+        escrito.append(id_simbolo[simbolo_escribir])
+        mover.append(DESPLAZAMIENTOS[direccion])
+
+    nombres = json.dumps({
+        'nombre': definicion.nombre,
+        'descripcion': definicion.descripcion,
+        'estados': tabla.estados,
+        'simbolos': tabla.simbolos,
+    }, ensure_ascii=False).encode('utf-8')
+    cabecera = _CABECERA.pack(
+        MAGICO, VERSION, sys.byteorder == 'little', array('i').itemsize,
+        info.st_mtime_ns, info.st_size, bytes.fromhex(definicion.huella),
+        len(tabla.estados), tabla.num_simbolos, len(definicion.simbolos_cinta), len(origen),
+        id_estado[definicion.estado_inicial], tabla.blanco, len(nombres),
+    )
+
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    try:
+        with open(temporal, 'wb') as f:
+            f.write(cabecera)
+            for arreglo in (tabla.siguiente, origen, destino, tabla.final, tabla.escribir, tabla.mover,
+                            leido, escrito, mover):
+                f.write(arreglo)
+            f.write(nombres)
+        os.replace(temporal, ruta)
+    except OSError:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        return False
+    return True
+
+
+def leer_binario(ruta, info):
+    """
+    Lee el archivo binario de una máquina, si está al día.
+
+    El archivo se mapea en memoria y los arreglos de la tabla son vistas
+    sobre el mapa: no se copian ni se recorren, y los procesos que cargan la
+    misma máquina comparten esas páginas. Solo se decodifican los nombres;
+    el diccionario de transiciones del motor interpretado y la lista de
+    transiciones faltantes se arman la primera vez que se usan (ver
+    DefinicionMT.desde_campos).
+
+    Args:
+        ruta (str): Archivo binario
+        info (os.stat_result): Estado actual del JSON de origen; si su
+            fecha de modificación o su tamaño no coinciden con los
+            guardados, el archivo está desactualizado
+
+    Returns:
+        dict: Argumentos de DefinicionMT.desde_campos() (menos ruta), o None
+        si no hay archivo, está desactualizado o es de otra versión o plataforma
+    """
+    try:
+        with open(ruta, 'rb') as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        (magico, version, little, tamano_entero, mtime, tamano, huella, num_estados, num_simbolos,
+         num_simbolos_cinta, num_transiciones, inicial, blanco, largo_nombres) = _CABECERA.unpack_from(mapa)
+    except struct.error:
+        mapa.close()
+        return None
+    if (magico, version, little, tamano_entero, mtime, tamano) != (
+            MAGICO, VERSION, sys.byteorder == 'little', array('i').itemsize, info.st_mtime_ns, info.st_size):
+        mapa.close()
+        return None
+
+    vista = memoryview(mapa)
+    arreglos = []
+    posicion = _CABECERA.size
+    for tipo, cantidad in _secciones(num_estados, num_simbolos, num_transiciones):
+        largo = cantidad * (tamano_entero if tipo == 'i' else 1)
+        arreglos.append(vista[posicion:posicion + largo].cast(tipo))
+        posicion += largo
+    nombres = json.loads(bytes(vista[posicion:posicion + largo_nombres]).decode('utf-8'))
+    siguiente, origen, destino, final, escribir, mover, leido, escrito, desplazamientos = arreglos
+
+    estados, simbolos = nombres['estados'], nombres['simbolos']
+
+    def decodificar():
+        # Solo el motor interpretado y el validador usan los nombres de cada transición
+        transiciones = {
+            (estados[q], simbolos[s]): (estados[n], simbolos[w], _DIRECCIONES[d])
+            for q, s, n, w, d in zip(origen.tolist(), leido.tolist(), destino.tolist(), escrito.tolist(),
+                                     desplazamientos.tolist())
+        }
+        # Pares sin transición, igual que validar_configuracion(): celdas libres de estados no finales
+        libres = siguiente.tolist()
+        faltantes = tuple(
+            (estados[q], simbolos[s])
+            for q in range(num_estados) if not final[q]
+            for s in range(num_simbolos_cinta) if libres[q * num_simbolos + s] < 0
+        )
+        return {'transiciones': MappingProxyType(transiciones), 'transiciones_faltantes': faltantes}
+
+    return {
+        'huella': huella.hex(),
+        'nombre': nombres['nombre'],
+        'descripcion': nombres['descripcion'],
+        'estados': tuple(estados),
+        'estado_inicial': estados[inicial],
+        'estados_finales': frozenset(e for e, es_final in zip(estados, final.tolist()) if es_final),
+        'simbolos_cinta': tuple(simbolos[:num_simbolos_cinta]),
+        'num_cintas': 1,
+        'cinta_salida': 0,
+        'tabla': TablaCompilada.desde_arreglos(estados, simbolos, blanco, final, siguiente, escribir, mover),
+        'diferidos': decodificar,
+    }
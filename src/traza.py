@@ -0,0 +1,217 @@
+from array import array
+from collections.abc import Sequence
+
+from src.cinta import representar_cinta
+
+
+def _tipo_arreglo(cantidad):
+    """Código de tipo de array más pequeño capaz de guardar cantidad identificadores."""
+    if cantidad <= 0xFF:
+        return 'B'
+    if cantidad <= 0xFFFF:
+        return 'H'
+    return 'I'
+
+
+class TrazaDelta(Sequence):
+    """
+    Traza de ejecución compacta con reconstrucción bajo demanda.
+
+    Por cada paso solo guarda (estado nuevo, movimiento del cabezal, símbolo
+    escrito) en arreglos tipados, más un checkpoint completo de la cinta cada
+    ``intervalo_checkpoint`` pasos. La configuración de cualquier paso se
+    reconstruye partiendo del checkpoint anterior más cercano y reproduciendo
+    los pasos hacia adelante.
+
+    Se comporta como una secuencia de configuraciones con el mismo formato que
+    el historial completo de MaquinaTuring.
+    """
+
+    def __init__(self, tabla, intervalo_checkpoint=1000):
+        """
+        Inicializa la traza vacía.
+
+        Args:
+            tabla (TablaCompilada): Numeración de estados y símbolos de la máquina
+            intervalo_checkpoint (int): Pasos entre checkpoints completos de la cinta
+        """
+        if intervalo_checkpoint < 1:
+            raise ValueError("El intervalo entre checkpoints debe ser al menos 1")
+
+        self.estados = list(tabla.estados)
+        self.simbolos = list(tabla.simbolos)
+        self.id_estado = dict(tabla.id_estado)
+        self.id_simbolo = dict(tabla.id_simbolo)
+        self.blanco = tabla.blanco
+        self.intervalo_checkpoint = intervalo_checkpoint
+
+        self.paso_inicial = 0
+        self.estados_paso = array(_tipo_arreglo(len(self.estados)))
+        self.movimientos = array('b')
+        self.escritos = array('B')
+        # Cada checkpoint es (paso, estado, cabezal, izquierda, celdas) con
+        # posiciones lógicas relativas a la primera celda de la entrada
+        self.checkpoints = []
+
+    def _id_simbolo(self, simbolo):
+        """Identificador de un símbolo, agregándolo si no pertenece al alfabeto."""
+        i = self.id_simbolo.get(simbolo)
+        if i is None:
+            i = len(self.simbolos)
+            if i > 0xFF:
+                raise ValueError("La traza delta admite como máximo 256 símbolos distintos")
+            self.simbolos.append(simbolo)
+            self.id_simbolo[simbolo] = i
+        return i
+
+    def checkpoint(self, paso, estado, cinta):
+        """
+        Guarda una copia completa de la configuración actual.
+
+        Args:
+            paso (int): Número de paso de la configuración
+            estado (str): Estado actual
+            cinta (Cinta): Cinta de la máquina
+        """
+        if not self.checkpoints:
+            self.paso_inicial = paso
+        celdas = bytearray(self._id_simbolo(s) for s in cinta.simbolos())
+        # El cabezal puede estar una celda fuera de la cinta: incluir esa celda en blanco
+        izquierda = self._extender(cinta.posicion_logica(), -cinta.origen, celdas)
+        self.checkpoints.append(
+            (paso, self.id_estado[estado], cinta.posicion_logica(), izquierda, bytes(celdas))
+        )
+
+    def registrar(self, estado, direccion, simbolo_escrito):
+        """
+        Registra un paso ejecutado.
+
+        Args:
+            estado (str): Estado al que pasó la máquina
+            direccion (str): 'L', 'R' o 'N'
+            simbolo_escrito (str): Símbolo escrito antes de mover el cabezal
+        """
+        self.estados_paso.append(self.id_estado[estado])
+        self.movimientos.append(-1 if direccion == 'L' else 1 if direccion == 'R' else 0)
+        self.escritos.append(self._id_simbolo(simbolo_escrito))
+
+    def necesita_checkpoint(self):
+        """Indica si el último paso registrado cae en un múltiplo del intervalo."""
+        pasos = len(self.estados_paso)
+        return pasos > 0 and pasos % self.intervalo_checkpoint == 0 \
+            and len(self.checkpoints) <= pasos // self.intervalo_checkpoint
+
+    def tamano_bytes(self):
+        """Memoria aproximada que ocupan los datos de la traza."""
+        total = sum(a.itemsize * len(a) for a in (self.estados_paso, self.movimientos, self.escritos))
+        return total + sum(len(c[4]) for c in self.checkpoints)
+
+    def _extender(self, cabezal, izquierda, celdas):
+        """
+        Agrega blancos a celdas (en sitio) hasta que incluya la celda del cabezal.
+
+        Returns:
+            int: Nueva posición lógica de la primera celda
+        """
+        if cabezal < izquierda:
+            extension = max(10, len(celdas), izquierda - cabezal)
+            celdas[0:0] = bytes([self.blanco]) * extension
+            izquierda -= extension
+        if cabezal - izquierda >= len(celdas):
+            celdas.extend(bytes([self.blanco]) * max(10, len(celdas), cabezal - izquierda + 1 - len(celdas)))
+        return izquierda
+
+    def _reproducir(self, desde, hasta):
+        """
+        Genera las configuraciones de los pasos desde..hasta (inclusive).
+
+        Produce tuplas (paso, estado, cabezal, izquierda, celdas) donde celdas
+        es un bytearray que se modifica en sitio entre iteraciones.
+        """
+        indice = min((desde - self.paso_inicial) // self.intervalo_checkpoint, len(self.checkpoints) - 1)
+        paso, estado, cabezal, izquierda, celdas = self.checkpoints[indice]
+        celdas = bytearray(celdas)
+        izquierda = self._extender(cabezal, izquierda, celdas)
+
+        while True:
+            if paso >= desde:
+                yield paso, estado, cabezal, izquierda, celdas
+            if paso >= hasta:
+                return
+
+            j = paso - self.paso_inicial
+            celdas[cabezal - izquierda] = self.escritos[j]
+            cabezal += self.movimientos[j]
+            estado = self.estados_paso[j]
+            paso += 1
+
+            # Crecer la copia de la cinta igual que la cinta real
+            if not 0 <= cabezal - izquierda < len(celdas):
+                izquierda = self._extender(cabezal, izquierda, celdas)
+
+    def _configuracion(self, paso, estado, cabezal, izquierda, celdas):
+        """Construye el diccionario de configuración a partir del estado reproducido."""
+        simbolos = self.simbolos
+        blanco = simbolos[self.blanco]
+        if not 0 <= cabezal - izquierda < len(celdas):
+            izquierda = self._extender(cabezal, izquierda, celdas)
+        contenido = ''.join(map(simbolos.__getitem__, celdas)).strip(blanco)
+        return {
+            'paso': paso,
+            'estado': self.estados[estado],
+            'posicion': cabezal,
+            'cinta': contenido if contenido else blanco,
+            'simbolo_actual': simbolos[celdas[cabezal - izquierda]],
+        }
+
+    def reconstruir(self, paso):
+        """
+        Reconstruye la configuración de un paso dado.
+
+        Args:
+            paso (int): Número de paso (entre el primero y el último registrado)
+
+        Returns:
+            dict: Configuración con el formato del historial completo
+        """
+        ultimo = self.paso_inicial + len(self.estados_paso)
+        if not self.checkpoints or not self.paso_inicial <= paso <= ultimo:
+            raise IndexError(f"El paso {paso} no está en la traza")
+        return self._configuracion(*next(self._reproducir(paso, paso)))
+
+    def iterar_vistas(self):
+        """
+        Recorre la traza de principio a fin en una sola reproducción.
+
+        Yields:
+            tuple: (configuración, representación visual de la cinta)
+        """
+        if not self.checkpoints:
+            return
+        ultimo = self.paso_inicial + len(self.estados_paso)
+        for paso, estado, cabezal, izquierda, celdas in self._reproducir(self.paso_inicial, ultimo):
+            config = self._configuracion(paso, estado, cabezal, izquierda, celdas)
+            # Decodificar solo la ventana que se muestra alrededor del cabezal
+            indice = cabezal - izquierda
+            inicio = max(0, indice - 20)
+            visibles = list(map(self.simbolos.__getitem__, celdas[inicio:indice + 20]))
+            yield config, representar_cinta(visibles, indice - inicio)
+
+    def __len__(self):
+        return len(self.estados_paso) + 1 if self.checkpoints else 0
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de la traza fuera de rango")
+        return self.reconstruir(self.paso_inicial + indice)
+
+    def __iter__(self):
+        if not self.checkpoints:
+            return
+        ultimo = self.paso_inicial + len(self.estados_paso)
+        for estado_reproducido in self._reproducir(self.paso_inicial, ultimo):
+            yield self._configuracion(*estado_reproducido)
@@ -0,0 +1,154 @@
+import argparse
+import json
+
+
+# Direcciones válidas del cabezal
+DIRECCIONES = ('L', 'R', 'N')
+
+# Claves obligatorias de la configuración
+CLAVES = ('estados', 'estado_inicial', 'estados_finales', 'simbolos_cinta', 'transiciones')
+
+# Errores que se listan en el mensaje de la excepción (todos quedan en .errores)
+MAXIMO_ERRORES_MENSAJE = 20
+
+
+class ErrorConfiguracion(ValueError):
+    """Configuración de máquina inválida; errores tiene la lista completa de problemas."""
+
+    def __init__(self, errores, ruta=None):
+        self.errores = list(errores)
+        self.ruta = ruta
+        origen = f" en {ruta}" if ruta else ""
+        total = len(self.errores)
+        lineas = [f"Configuración inválida{origen} ({total} {'error' if total == 1 else 'errores'}):"]
+        lineas += [f"  - {error}" for error in self.errores[:MAXIMO_ERRORES_MENSAJE]]
+        if len(self.errores) > MAXIMO_ERRORES_MENSAJE:
+            lineas.append(f"  ... y {len(self.errores) - MAXIMO_ERRORES_MENSAJE} más")
+        super().__init__('\n'.join(lineas))
+
+
+def validar_configuracion(config, ruta=None):
+    """
+    Verifica una configuración de máquina antes de construir su definición.
+
+    Comprueba que estén las claves obligatorias, que el estado inicial y los
+    finales existan (y que haya al menos un final), que num_cintas y
+    cinta_salida sean válidos, que cada transición use estados y símbolos
+    declarados (el blanco '_' siempre se acepta) y direcciones 'L', 'R' o
+    'N', y que la máquina sea determinista (a lo sumo una transición por
+    estado y símbolo leído). Todos los problemas se reportan juntos.
+
+    Args:
+        config (dict): Contenido del archivo JSON de la máquina
+        ruta (str): Archivo de origen, solo para el mensaje de error
+
+    Returns:
+        list: Pares (estado, símbolo) no finales sin transición, en los que
+        la máquina se detendría con 'sin_transicion' (solo en máquinas de
+        una cinta; en las de varias cintas la lista es vacía)
+
+    Raises:
+        ErrorConfiguracion: Si hay al menos un error
+    """
+    faltan = [clave for clave in CLAVES if clave not in config]
+    if faltan:
+        raise ErrorConfiguracion([f"Falta la clave {clave!r}" for clave in faltan], ruta)
+
+    errores = []
+    estados = set(config['estados'])
+    simbolos = set(config['simbolos_cinta']) | {'_'}
+    finales = set(config['estados_finales'])
+    num_cintas = config.get('num_cintas', 1)
+
+    if len(estados) != len(config['estados']):
+        errores.append("La lista de estados tiene nombres repetidos")
+    if config['estado_inicial'] not in estados:
+        errores.append(f"El estado inicial {config['estado_inicial']!r} no está en la lista de estados")
+    if not finales:
+        errores.append("No hay estados finales")
+    for estado in sorted(finales - estados):
+        errores.append(f"El estado final {estado!r} no está en la lista de estados")
+    if not isinstance(num_cintas, int) or num_cintas < 1:
+        errores.append(f"num_cintas debe ser un entero positivo (es {num_cintas!r})")
+        num_cintas = 1
+    cinta_salida = config.get('cinta_salida', 0)
+    if not isinstance(cinta_salida, int) or not 0 <= cinta_salida < num_cintas:
+        errores.append(f"cinta_salida debe estar entre 0 y {num_cintas - 1} (es {cinta_salida!r})")
+
+    vistas = {}
+    for numero, t in enumerate(config['transiciones']):
+        try:
+            estado, leidos, nuevo_estado = t['estado_actual'], t['simbolo_leido'], t['nuevo_estado']
+            escritos, direcciones = t['simbolo_escribir'], t['direccion']
+        except KeyError as e:
+            errores.append(f"Transición {numero}: falta el campo {e.args[0]!r}")
+            continue
+
+        problemas = []
+        for e in (estado, nuevo_estado):
+            if e not in estados:
+                problemas.append(f"el estado {e!r} no está en la lista de estados")
+        if num_cintas > 1:
+            if not all(isinstance(v, list) and len(v) == num_cintas for v in (leidos, escritos, direcciones)):
+                errores.append(f"Transición {numero} ({estado!r}): simbolo_leido, simbolo_escribir y "
+                               f"direccion deben ser listas de {num_cintas} elementos")
+                continue
+            leido = tuple(leidos)
+        else:
+            if any(isinstance(v, list) for v in (leidos, escritos, direcciones)):
+                errores.append(f"Transición {numero} ({estado!r}): usa listas de símbolos pero la máquina "
+                               f"es de una cinta (falta num_cintas)")
+                continue
+            leido = leidos
+            leidos, escritos, direcciones = [leidos], [escritos], [direcciones]
+        for simbolo in leidos + escritos:
+            if simbolo not in simbolos:
+                problemas.append(f"el símbolo {simbolo!r} no está en simbolos_cinta")
+        for d in direcciones:
+            if d not in DIRECCIONES:
+                problemas.append(f"dirección {d!r} desconocida (use 'L', 'R' o 'N')")
+
+        clave = (estado, leido)
+        if clave in vistas:
+            problemas.append(f"no es determinista, ya hay una transición para ({estado!r}, {leido!r}) "
+                             f"(transición {vistas[clave]})")
+        else:
+            vistas[clave] = numero
+        errores += [f"Transición {numero} ({estado!r}): {problema}" for problema in problemas]
+
+    if errores:
+        raise ErrorConfiguracion(errores, ruta)
+
+    if num_cintas > 1:
+        return []
+    return [(estado, simbolo) for estado in config['estados'] if estado not in finales
+            for simbolo in config['simbolos_cinta'] if (estado, simbolo) not in vistas]
+
+
+def main(argumentos=None):
+    """Valida archivos de máquina e informa los errores y las transiciones faltantes."""
+    parser = argparse.ArgumentParser(description="Validador de configuraciones de máquinas")
+    parser.add_argument('configs', nargs='+', help="Archivos JSON de máquinas")
+    parser.add_argument('--faltantes', action='store_true',
+                        help="Lista los pares (estado, símbolo) sin transición")
+    args = parser.parse_args(argumentos)
+
+    validos = True
+    for ruta in args.configs:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        try:
+            faltantes = validar_configuracion(config, ruta)
+        except ErrorConfiguracion as e:
+            print(f"❌ {e}")
+            validos = False
+            continue
+        print(f"✅ {ruta}: {len(config['transiciones'])} transiciones, "
+              f"{len(faltantes)} pares (estado, símbolo) sin transición")
+        for estado, simbolo in faltantes if args.faltantes else ():
+            print(f"     ({estado}, {simbolo!r}) se detiene con 'sin_transicion'")
+    return 0 if validos else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
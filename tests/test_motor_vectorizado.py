@@ -0,0 +1,40 @@
+import json
+
+from src.maquina_turing import MaquinaTuring
+from src.motor_vectorizado import ejecutar_vectorizado
+
+
+def _transicion(estado, leido, nuevo, escrito, direccion):
+    return {'estado_actual': estado, 'simbolo_leido': leido, 'nuevo_estado': nuevo,
+            'simbolo_escribir': escrito, 'direccion': direccion}
+
+
+def test_filas_que_salen_por_bordes_opuestos_en_el_mismo_paso(tmp_path):
+    # Con 'a' el cabezal avanza siempre a la izquierda y con 'b' a la derecha,
+    # así que las dos filas salen de la cinta 2-D en el mismo paso
+    config = {
+        'nombre': 'Divergente',
+        'estados': ['q0', 'izquierda', 'derecha', 'qf'],
+        'estado_inicial': 'q0',
+        'estados_finales': ['qf'],
+        'simbolos_cinta': ['a', 'b', '_'],
+        'transiciones': [
+            _transicion('q0', 'a', 'izquierda', 'a', 'L'),
+            _transicion('q0', 'b', 'derecha', 'b', 'R'),
+            _transicion('izquierda', '_', 'izquierda', 'a', 'L'),
+            _transicion('derecha', '_', 'derecha', 'b', 'R'),
+        ],
+    }
+    ruta = tmp_path / 'divergente.json'
+    ruta.write_text(json.dumps(config))
+    maquina = MaquinaTuring(str(ruta), mostrar_avisos=False)
+
+    resultados = ejecutar_vectorizado(maquina, ['a', 'b'], max_pasos=100)
+
+    esperados = []
+    for entrada in ['a', 'b']:
+        maquina.inicializar(entrada, historial='ninguno')
+        maquina.ejecutar(max_pasos=100)
+        esperados.append((maquina.obtener_resultado(), maquina.pasos, maquina.motivo_parada))
+    assert [(r.salida, r.pasos, r.motivo) for r in resultados] == esperados
+    assert esperados == [('a' * 100, 100, 'limite_pasos'), ('b' * 100, 100, 'limite_pasos')]
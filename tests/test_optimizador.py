@@ -0,0 +1,49 @@
+from src.definicion import DefinicionMT, cargar_definicion
+from src.ejecucion import Ejecucion
+from src.optimizador import optimizar_configuracion
+
+
+def _transicion(estado, leido, nuevo, escrito, direccion):
+    return {'estado_actual': estado, 'simbolo_leido': leido, 'nuevo_estado': nuevo,
+            'simbolo_escribir': escrito, 'direccion': direccion}
+
+
+def _ejecutar(definicion, entrada):
+    ejecucion = Ejecucion(definicion, entrada, mostrar_avisos=False, historial='ninguno')
+    ejecucion.ejecutar(max_pasos=10000)
+    return ejecucion.obtener_resultado(), ejecucion.pasos, ejecucion.motivo_parada, ejecucion.estado_actual
+
+
+def test_fibonacci_optimizada_tiene_menos_estados_y_los_mismos_resultados():
+    original = cargar_definicion('config/maquina_fibonacci.json')
+    optimizada = cargar_definicion('config/maquina_fibonacci.json', optimizar=True)
+    reporte = optimizada.optimizacion
+
+    assert reporte.estados_despues < reporte.estados_antes
+    assert reporte.transiciones_despues < reporte.transiciones_antes
+    assert reporte.fusionados
+    for n in range(6):
+        assert _ejecutar(optimizada, '1' * n) == _ejecutar(original, '1' * n)
+
+
+def test_solo_se_fusionan_estados_que_se_detienen_con_los_mismos_simbolos():
+    # 'a' y 'b' solo difieren en que 'b' no tiene transición con '0'
+    config = {
+        'estados': ['q0', 'a', 'b', 'h'],
+        'estado_inicial': 'q0',
+        'estados_finales': ['h'],
+        'simbolos_cinta': ['0', '1'],
+        'transiciones': [
+            _transicion('q0', '1', 'a', '1', 'R'),
+            _transicion('q0', '0', 'b', '0', 'R'),
+            _transicion('q0', '_', 'h', '_', 'N'),
+            _transicion('a', '_', 'h', '_', 'N'),
+            _transicion('a', '0', 'h', '0', 'N'),
+            _transicion('b', '_', 'h', '_', 'N'),
+        ],
+    }
+    optimizada, reporte = optimizar_configuracion(config)
+
+    assert reporte.fusionados == {}
+    for entrada in ['00', '10', '11', '0', '1', '']:
+        assert _ejecutar(DefinicionMT(optimizada), entrada) == _ejecutar(DefinicionMT(config), entrada)
@@ -0,0 +1,36 @@
+import pytest
+
+from src.definicion import DefinicionMT
+from src.ejecucion import Ejecucion
+
+
+def _maquina(direccion):
+    """Máquina que avanza siempre en una dirección escribiendo 1 sobre los blancos."""
+    return DefinicionMT({
+        'estados': ['q0', 'qf'],
+        'estado_inicial': 'q0',
+        'estados_finales': ['qf'],
+        'simbolos_cinta': ['1', '_'],
+        'transiciones': [
+            {'estado_actual': 'q0', 'simbolo_leido': '1', 'nuevo_estado': 'q0',
+             'simbolo_escribir': '1', 'direccion': direccion},
+            {'estado_actual': 'q0', 'simbolo_leido': '_', 'nuevo_estado': 'q0',
+             'simbolo_escribir': '1', 'direccion': direccion},
+        ],
+    })
+
+
+@pytest.mark.parametrize('tipo_cinta', ['lista', 'compacta'])
+@pytest.mark.parametrize('direccion', ['R', 'L'])
+@pytest.mark.parametrize('intervalo', [1, 2, 4, 8, 11, 16, 32, 37])
+def test_traza_delta_con_cabezal_fuera_de_la_cinta(tipo_cinta, direccion, intervalo):
+    definicion = _maquina(direccion)
+    completa = Ejecucion(definicion, '11', mostrar_avisos=False, tipo_cinta=tipo_cinta)
+    completa.ejecutar(max_pasos=120)
+    delta = Ejecucion(definicion, '11', mostrar_avisos=False, historial='delta',
+                      intervalo_checkpoint=intervalo, tipo_cinta=tipo_cinta)
+    delta.ejecutar(max_pasos=120)
+
+    assert [delta.traza[i] for i in range(len(delta.traza))] == completa.historial
+    assert list(delta.traza) == completa.historial
+    assert [config for config, _ in delta.traza.iterar_vistas()] == completa.historial